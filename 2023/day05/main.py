@@ -1,9 +1,13 @@
 """
 Welcome to the dumpster fire.
 """
+import sys
 from typing import Dict
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.intervals import IntervalSet  # noqa: E402
+
 
 class SeedMap:
 
@@ -12,14 +16,18 @@ class SeedMap:
         self.src_range = map_list[1]
         self.range_length = map_list[2]
 
-        self.dest_list = []
-        self.src_list = []
+    @property
+    def rule(self) -> tuple[int, int, int]:
+        """Source range and how far it moves, for IntervalSet.shift_map.
 
-    def expand(self) -> None:
-        for attr in ['dest_range', 'src_range']:
-            val = getattr(self, attr)
-            rng = range(getattr, getattr + self.range_length, 1)
-            setattr(attr.replace('range', 'list'), rng)
+        The ranges are far too big to expand into lists of numbers, so they
+        are only ever moved as whole intervals.
+        """
+        return (
+            self.src_range,
+            self.src_range + self.range_length - 1,
+            self.dest_range - self.src_range,
+        )
 
     def __repr__(self) -> str:
         return f'<SeedMap {self.dest_range}, {self.src_range}, {self.range_length}>'
@@ -62,11 +70,35 @@ def fill_zeros(data_dict: Dict[float, SeedMap]) -> Dict:
     pass
 
 
+def lowest_location(data: Dict, seeds: IntervalSet) -> int:
+    """Send every seed through the maps, in order, and return the lowest."""
+    for name, maps in data.items():
+        if name == 'seeds':
+            continue
+
+        seeds = seeds.shift_map(seed_map.rule for seed_map in maps.values())
+
+    return seeds.starts[0]
+
+
+def solve_1(data: Dict) -> int:
+    """Solution to Part 1"""
+    return lowest_location(data, IntervalSet((s, s) for s in data['seeds']))
+
+
+def solve_2(data: Dict) -> int:
+    """Solution to Part 2"""
+    seeds = data['seeds']
+
+    return lowest_location(data, IntervalSet(
+        (start, start + length - 1)
+        for start, length in zip(seeds[::2], seeds[1::2])))
+
+
 if __name__ == '__main__':
     input_file = Path('input.txt')
 
     input = read_input(input_file)
-    print(input)
 
-    for key, val in input.items():
-        print(key, len(val))
+    print(f'Part 1: {solve_1(input)}')
+    print(f'Part 2: {solve_2(input)}')
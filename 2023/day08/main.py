@@ -7,9 +7,11 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 
 
-def read_input() -> Tuple[List[str], Dict[str, List[str]]]:
+def read_input(
+    f_name: str = 'input.txt',
+) -> Tuple[List[str], Dict[str, List[str]]]:
     """Read and clean/organize the input."""
-    input = Path(__file__).with_name('input.txt').read_text().splitlines()
+    input = (Path(__file__).parent / f_name).read_text().splitlines()
 
     instructions = list(input[0])
 
@@ -25,7 +27,7 @@ def read_input() -> Tuple[List[str], Dict[str, List[str]]]:
     return instructions, nodes
 
 
-def solve_1(instructions: list[str], nodes: Dict[str, list[str]]) -> None:
+def solve_1(instructions: list[str], nodes: Dict[str, list[str]]) -> int:
     """Solution for Part 1."""
     curr_node = 'AAA'
     idx = 0
@@ -39,7 +41,7 @@ def solve_1(instructions: list[str], nodes: Dict[str, list[str]]) -> None:
 
         idx += 1
 
-    print(idx)
+    return idx
 
 
 def solve_2() -> None:
@@ -64,7 +66,7 @@ def test_2() -> None:
 
 def main() -> None:
     instr, nodes = read_input()
-    solve_1(instr, nodes)
+    print(solve_1(instr, nodes))
 
 
 if __name__ == '__main__':
@@ -70,6 +70,16 @@ def solve(grid: list[list[str]], incr: int = 2) -> int:
     return sum(distances)
 
 
+def solve_1(grid: list[list[str]]) -> int:
+    """Solution to Part 1: every empty row and column doubles."""
+    return solve(grid)
+
+
+def solve_2(grid: list[list[str]], incr: int = 1000000) -> int:
+    """Solution to Part 2: every empty row and column grows `incr` times."""
+    return solve(grid, incr=incr)
+
+
 def test_1() -> None:
     """Simple unit test for Part 1 solution."""
     soln = solve_1(explode(SAMPLE_INP))
@@ -93,10 +103,5 @@ def test_2() -> None:
 if __name__ == '__main__':
     inp = explode(Path(__file__).with_name('input.txt').read_text().splitlines())
 
-    # Part 1 solution
-    #soln = solve(inp)
-
-    # Part 2 solution
-    soln = solve(inp, incr=1000000)
-
-    print(soln)
+    print(solve_1(inp))
+    print(solve_2(inp))
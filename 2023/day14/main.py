@@ -2,8 +2,14 @@
 Advent of Code 2023
 Day 14 - Parabolic Reflector Dish
 """
+import sys
 from pathlib import Path
 
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # noqa: E402
+
 
 SAMPLE_GRID = [
     'O....#....',
@@ -19,104 +25,91 @@ SAMPLE_GRID = [
 ]
 
 
-# North, West, South, East
-TILTS = {
-    1: (-1, 0),
-    2: (0, -1),
-    3: (1, 0),
-    4: (0, 1),
-}
+ROCK, CUBE, EMPTY = map(ord, 'O#.')
+
+# Sort rank of each cell within a tilted segment: cube, rocks, then space
+RANK = np.zeros(256, dtype=np.int64)
+RANK[ROCK], RANK[EMPTY] = 1, 2
 
 
-def pretty_print(grid: list[list[str]]) -> None:
-    [print(''.join(x)) for x in grid]
+def pretty_print(grid: Grid) -> None:
+    print(grid)
     print('-'*20)
 
 
-def explode(grid: list[str]) -> list[list[str]]:
-    return [list(x) for x in grid]
+def explode(grid: list[str]) -> Grid:
+    return Grid(grid, pad='#')
 
 
-def solve_2(grid: list[list[str]], cycles: int = 10e8, pprint: bool = False) -> int:
-    """Solution to Part 2."""
-    n_rows = len(grid)
-    n_cols = len(grid[0])
+def tilt(cells: np.ndarray) -> np.ndarray:
+    """Roll every round rock towards row 0 of the array.
 
-    # GIVE ME MORE LOOPS I LOVE LOOPS
-    for cyc in range(cycles):
-        for k in range(1, 5, 1):
-            delta_i, delta_j = TILTS[k]
+    Each column is split into segments that start at a cube rock. A stable
+    sort of every column by (segment, rank) moves the round rocks to the
+    start of their segment while the cube rocks stay in place.
+    """
+    segment = np.cumsum(cells == CUBE, axis=0)
+    order = np.argsort(segment * 3 + RANK[cells], axis=0, kind='stable')
 
-            for i in range(n_rows):
-                for j in range(n_cols):
-                    if (
-                        grid[i][j] == 'O' and
-                        i + delta_i >= 0 and
-                        j + delta_j >= 0
-                    ):
-                        ii, jj = i, j
+    return np.take_along_axis(cells, order, axis=0)
 
-                        try:
-                            next_spot = grid[ii + delta_i][jj + delta_j]
-                        except IndexError:
-                            continue
 
-                        while (
-                            next_spot == '.' and
-                            ii + delta_i >= 0 and
-                            jj + delta_j >= 0
-                        ):
+def spin(grid: Grid) -> None:
+    """Tilt the platform north, west, south and then east, in place."""
+    cells = grid.inner
+    cells[:] = tilt(cells)
+    cells[:] = tilt(cells.T).T
+    cells[::-1] = tilt(cells[::-1])
+    cells[:, ::-1] = tilt(cells[:, ::-1].T).T
 
-                            try:
-                                grid[ii + delta_i][jj + delta_j] = 'O'
-                            except IndexError:
-                                break
 
-                            grid[ii][jj] = '.'
+def load(grid: Grid) -> int:
+    """Total load on the north support beams."""
+    rocks = np.count_nonzero(grid.inner == ROCK, axis=1)
 
-                            ii += delta_i
-                            jj += delta_j
+    return int((rocks * np.arange(grid.nrows, 0, -1)).sum())
 
-                            next_spot = grid[ii][jj]
-                # end j
-            # end i
-        # end tilt loop
-    # end cycle loop
 
-    sum = 0
-    for i in range(n_rows):
-        for j in range(n_cols):
-            if grid[i][j] == 'O': sum += n_rows - i
+def solve_2(
+    grid: Grid,
+    cycles: int = 1_000_000_000,
+    pprint: bool = False,
+) -> int:
+    """Solution to Part 2.
 
-    if pprint: pretty_print(grid)
+    The platform settles into a loop after a while, so the spin cycles are
+    run until a layout repeats and the rest of the loop is skipped.
+    """
+    seen = {}
+    cyc = 0
 
-    return sum
+    while cyc < cycles:
+        key = grid.inner.tobytes()
 
+        if key in seen:
+            period = cyc - seen[key]
+            cyc += (cycles - cyc) // period * period
+            seen = {}
 
-def solve_1(grid: list[list[str]], pprint: bool = False) -> int:
-    """Solution to Part 1."""
-    n_rows = len(grid)
-    n_cols = len(grid[0])
+            if cyc == cycles:
+                break
 
-    for i in range(n_rows):
-        for j in range(n_cols):
+        seen[key] = cyc
+        spin(grid)
+        cyc += 1
 
-            if grid[i][j] == 'O':
-                ii, jj = i, j
+    if pprint: pretty_print(grid)
+
+    return load(grid)
 
-                while grid[ii - 1][jj] == '.' and ii > 0:
-                    grid[ii][jj] = '.'
-                    ii -= 1
-                    grid[ii][jj] = 'O'
 
-    sum = 0
-    for i in range(n_rows):
-        for j in range(n_cols):
-            if grid[i][j] == 'O': sum += n_rows - i
+def solve_1(grid: Grid, pprint: bool = False) -> int:
+    """Solution to Part 1."""
+    grid.inner[:] = tilt(grid.inner)
 
     if pprint: pretty_print(grid)
 
-    return sum
+    return load(grid)
 
 
 if __name__ == '__main__':
@@ -127,4 +120,3 @@ if __name__ == '__main__':
     soln = solve_2(grid, cycles=1, pprint=True)
 
     print(soln)
-
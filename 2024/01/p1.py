@@ -73,12 +73,13 @@ def quicksort(arr: list[int]) -> list[int]:
     return quicksort(lesser) + equal + quicksort(greater)
 
 
-def parse_input() -> list[list[int]]:
+def parse_input(fname: str = 'input.txt') -> list[list[int]]:
     """Read the input from a file and return it as a nest list of ints.
 
     Parameters
     ----------
-    None.
+    fname: str, optional
+        Input filename. Default is 'input.txt'.
 
     Returns
     -------
@@ -87,7 +88,7 @@ def parse_input() -> list[list[int]]:
     a, b = list(
         zip(*[
             x.split()
-            for x in Path('input.txt').read_text().split('\n') if x
+            for x in Path(fname).read_text().split('\n') if x
         ])
     )
 
@@ -1,5 +1,10 @@
 """Advent of Code 2024 - Day 2 Part 1"""
+import sys
 from pathlib import Path
+from typing import Iterable
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.stream import Lines  # noqa: E402
 
 
 INPUT_PATH = Path(__file__).parents[1].joinpath('input', 'day2.txt')
@@ -25,30 +30,41 @@ def valid_report(report: list[int], valid_seq: list[int]) -> bool:
     return True
 
 
-def parse_input() -> list[list[int]]:
+def parse_report(line: str) -> list[int]:
+    """Parse a line of the input into a report."""
+    return [int(x) for x in line.split()]
+
+
+def parse_input(fname: str = 'input.txt') -> Lines:
     """Parse the input from a text file.
 
+    Reports are checked one at a time, so they are read lazily.
+
     Parameters
     ----------
-    None.
+    fname: str, optional
+        Input filename. Default is 'input.txt'.
 
     Returns
     -------
-    list of list of int
+    Lines
+        Iterable of the reports, as lists of int.
     """
-    return [
-        [int(y) for y in x.split()]
-        for x in  Path('input.txt').read_text().split('\n') if x
-    ]
+    return Lines(fname, parse_report)
 
 
-if __name__ == '__main__':
+def part1(reports: Iterable[list[int]]) -> int:
+    """Return the number of safe reports."""
     num_valid = 0
     inc_seq = range(1, 4)
     dec_seq = range(-3, 0)
 
-    for report in parse_input():
+    for report in reports:
         if valid_report(report, inc_seq) or valid_report(report, dec_seq):
             num_valid += 1
 
-    print(f'Day 02 Part 1 answer: {num_valid}')
+    return num_valid
+
+
+if __name__ == '__main__':
+    print(f'Day 02 Part 1 answer: {part1(parse_input())}')
@@ -1,4 +1,6 @@
 """Advent of Code 2024 - Day 2 Part 2"""
+from typing import Iterable
+
 from p1 import parse_input
 
 
@@ -9,16 +11,21 @@ def is_valid(seq: list[int], safe_range: range):
     return True
 
 
-if __name__ == '__main__':
+def part2(reports: Iterable[list[int]]) -> int:
+    """Return the number of reports made safe by removing up to one level."""
     num_valid = 0
     inc_seq = range(1, 4)
     dec_seq = range(-3, 0)
 
-    for report in parse_input():
+    for report in reports:
         num_valid += any(
             is_valid(report[:i] + report[i+1:], safe_range)
             for safe_range in (inc_seq, dec_seq)
             for i in range(len(report))
         )
 
-    print(f'Day 02 Part 2 answer: {num_valid}')
+    return num_valid
+
+
+if __name__ == '__main__':
+    print(f'Day 02 Part 2 answer: {part2(parse_input())}')
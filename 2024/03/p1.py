@@ -3,18 +3,19 @@ import re
 from pathlib import Path
 
 
-def parse_input() -> list[str]:
+def parse_input(fname: str = 'input.txt') -> list[str]:
     """Parse the input from a text file.
 
     Parameters
     ----------
-    None.
+    fname: str, optional
+        Input filename. Default is 'input.txt'.
 
     Returns
     -------
     list of list of str
     """
-    return [x for x in Path('input.txt').read_text().split('\n') if x]
+    return [x for x in Path(fname).read_text().split('\n') if x]
 
 
 def answer(instructions: list[str]) -> int:
@@ -1,11 +1,14 @@
 """Advent of Code 2024 - Day 7 Part 1"""
-import re
+import sys
 from itertools import product
 from operator import add, mul
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.ints import ints_by_line  # noqa: E402
 
-def parse_input(fname: str = None) -> list[str]:
+
+def parse_input(fname: str = None) -> list[list[int]]:
     """Parse the input from a text file.
 
     Parameters
@@ -14,19 +17,25 @@ def parse_input(fname: str = None) -> list[str]:
 
     Returns
     -------
-    list of str
+    list of list of int
+        Test value followed by the operands, one list per equation.
     """
     fname = 'input.txt' if fname is None else fname
 
-    return [x for x in Path(fname).read_text().split('\n') if x]
+    values, offsets = ints_by_line(Path(fname).read_bytes(), signed=False)
+    values = values.tolist()
+
+    return [
+        values[start:end]
+        for start, end in zip(offsets[:-1], offsets[1:]) if end > start]
 
 
-def part1(calibrations: list[str]) -> int:
+def part1(calibrations: list[list[int]]) -> int:
     """Solution to Part 1.
 
     Parameters
     ----------
-    calibrations: list of str
+    calibrations: list of list of int
 
     Returns
     -------
@@ -45,9 +54,7 @@ def part1(calibrations: list[str]) -> int:
     * Brute force lol
     """
     valid_sum = 0
-    for line in calibrations:
-        nums = [int(x) for x in re.findall(r'\d+', line)]
-
+    for nums in calibrations:
         test_val = nums[0]
         operands = nums[1:]
 
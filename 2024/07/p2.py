@@ -1,5 +1,4 @@
 """Advent of Code 2024 - Day 7 Part 2"""
-import re
 from itertools import product
 from operator import add, mul
 
@@ -11,12 +10,12 @@ def concat(a: int, b: int) -> int:
     return int(f'{a}{b}')
 
 
-def part2(calibrations: list[str]) -> int:
+def part2(calibrations: list[list[int]]) -> int:
     """Solution to Part 2.
 
     Parameters
     ----------
-    calibrations: list of str
+    calibrations: list of list of int
 
     Returns
     -------
@@ -35,9 +34,7 @@ def part2(calibrations: list[str]) -> int:
     * Same approach as in Part 1.
     """
     valid_sum = 0
-    for line in calibrations:
-        nums = [int(x) for x in re.findall(r'\d+', line)]
-
+    for nums in calibrations:
         test_val = nums[0]
         operands = nums[1:]
 
@@ -1,10 +1,13 @@
 """Advent of Code 2024 - Day 8 Part 1"""
-from collections import defaultdict
+import sys
 from itertools import combinations
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # noqa: E402
 
-def parse_input(fname: str = 'input.txt') -> list[list[str]]:
+
+def parse_input(fname: str = 'input.txt') -> Grid:
     """Parse the input from a text file.
 
     Parameters
@@ -13,39 +16,30 @@ def parse_input(fname: str = 'input.txt') -> list[list[str]]:
 
     Returns
     -------
-    list of list of str
+    Grid
     """
-    return [[y for y in x] for x in Path(fname).read_text().split('\n') if x]
+    return Grid.from_file(fname, pad='.')
 
 
-def part1(grid: list[list[str]]) -> int:
+def part1(grid: Grid) -> int:
     """Solution to Part 1.
 
     Parameters
     ----------
-    grid: list of list of str
+    grid: Grid
 
     Returns
     -------
     int
     """
-    locations = defaultdict(set)
-    m = len(grid)
-    n = len(grid[0])
-
-    for i in range(m):
-        for j in range(n):
-            if grid[i][j] != '.':
-                locations[grid[i][j]].add((i, j))
-
     antinodes = set()
-    for loc in locations.values():
+    for loc in grid.positions(ignore='.').values():
         for (a, b), (c, d) in combinations(loc, 2):
             di = a - c
             dj = b - d
-            for i, j in [(a+di, b+dj), (c-di, d-dj)]:
-                if i in range(m) and j in range(n):
-                    antinodes.add((i, j))
+            for point in [(a+di, b+dj), (c-di, d-dj)]:
+                if point in grid:
+                    antinodes.add(point)
 
     return len(antinodes)
 
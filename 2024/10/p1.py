@@ -220,11 +220,13 @@ def parse_input(f_name: str = 'input.txt') -> list[list[int]]:
     ]
 
 
-if __name__ == '__main__':
-    graph = Graph(parse_input())
+def part1(topo: list[list[int]]) -> int:
+    """Return the sum of the scores of all trailheads."""
+    graph = Graph(topo)
+
+    return sum(
+        len(graph.part1(start_node, set(), [])) for start_node in graph.roots)
 
-    sum = 0
-    for start_node in graph.roots:
-        sum += len(graph.part1(start_node, set(), []))
 
-    print(f'Answer: {sum}')
+if __name__ == '__main__':
+    print(f'Answer: {part1(parse_input())}')
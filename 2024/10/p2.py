@@ -4,10 +4,13 @@ from __future__ import annotations
 from p1 import parse_input, Graph
 
 
-graph = Graph(parse_input())
+def part2(topo: list[list[int]]) -> int:
+    """Return the sum of the ratings of all trailheads."""
+    graph = Graph(topo)
 
-sum = 0
-for start_node in graph.roots:
-    sum += len(graph.part2(start_node, [], []))
+    return sum(
+        len(graph.part2(start_node, [], [])) for start_node in graph.roots)
 
-print(f'Answer: {sum}')
+
+if __name__ == '__main__':
+    print(f'Answer: {part2(parse_input())}')
@@ -33,22 +33,23 @@ def parse_input(f_name: str = 'input.txt') -> str:
     return [x for x in Path(f_name).read_text().split('\n') if x][0]
 
 
-@timer
-def solution(stones: str) -> None:
-    """Solution to Part 1 & 2.
+def count_stones(stones: str, blinks: int) -> int:
+    """Return the number of stones after blinking.
 
     Parameters
     ----------
     stones: str
         String of stones.
+    blinks: int
+        Number of blinks.
 
     Returns
     -------
-    None.
+    int
     """
     stones = Counter(map(int, stones.split()))
 
-    for blink in range(1, 76):
+    for _ in range(blinks):
         new_stones = Counter()
 
         for pebble, num_pebble in stones.items():
@@ -62,8 +63,34 @@ def solution(stones: str) -> None:
 
         stones = new_stones
 
-        if blink in (25, 75):
-            print(sum(new_stones.values()))
+    return sum(stones.values())
+
+
+def part1(stones: str) -> int:
+    """Solution to Part 1: stones after 25 blinks."""
+    return count_stones(stones, 25)
+
+
+def part2(stones: str) -> int:
+    """Solution to Part 2: stones after 75 blinks."""
+    return count_stones(stones, 75)
+
+
+@timer
+def solution(stones: str) -> None:
+    """Solution to Part 1 & 2.
+
+    Parameters
+    ----------
+    stones: str
+        String of stones.
+
+    Returns
+    -------
+    None.
+    """
+    print(part1(stones))
+    print(part2(stones))
 
 
 if __name__ == '__main__':
@@ -1,9 +1,12 @@
 """Advent of Code 2024 - Day 13 Part 1 & 2"""
 from __future__ import annotations
-import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.ints import read_ints  # noqa: E402
+
 
 class Button:
 
@@ -64,17 +67,11 @@ class ClawMachine:
 
     @classmethod
     def from_file(cls, f_path: str = 'input.txt') -> list[ClawMachine]:
-        machines = []
-        for block in Path(f_path).read_text().split('\n\n'):
-            inp = re.findall(r'X[\+|\=](\d{1,6}), Y[\+|\=](\d{1,6})', block)
-            machines.append(
-                cls(
-                    tuple(map(int, inp[0])),
-                    tuple(map(int, inp[1])),
-                    tuple(map(int, inp[2])),
-                ))
-
-        return machines
+        # Six numbers per machine: button A, button B and prize X and Y
+        return [
+            cls((ax, ay), (bx, by), (px, py))
+            for ax, ay, bx, by, px, py in read_ints(
+                f_path, signed=False).reshape(-1, 6).tolist()]
 
     def __repr__(self) -> str:
         prize = f'<Prize X={self.prize[0]}, Y={self.prize[1]}'
@@ -82,9 +79,20 @@ class ClawMachine:
         return f'<{self.__class__.__qualname__} {sub_str}>'
 
 
-if __name__ == '__main__':
-    sum = 0
-    for m in ClawMachine.from_file():
-        sum += m.solve(True)
+def parse_input(f_path: str = 'input.txt') -> list[ClawMachine]:
+    """Read the claw machines from a file."""
+    return ClawMachine.from_file(f_path)
+
+
+def part1(machines: list[ClawMachine]) -> int:
+    """Fewest tokens to win every prize that can be won."""
+    return int(sum(m.solve() for m in machines))
 
-    print(f'Answer: {int(sum)}')
+
+def part2(machines: list[ClawMachine]) -> int:
+    """Fewest tokens with the prizes moved 10000000000000 further out."""
+    return int(sum(m.solve(True) for m in machines))
+
+
+if __name__ == '__main__':
+    print(f'Answer: {part2(parse_input())}')
@@ -1,31 +1,25 @@
 """Advent of Code 2024 - Day 14 Part 1"""
-import re
+import sys
 from math import prod
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.cache import cached_parse  # noqa: E402
+from aoc.ints import read_ints  # noqa: E402
+
 
 TuplePair = tuple[int, int]
 
 
+@cached_parse('1')
 def parse_input(fpath: str = 'input.txt') -> list[tuple[TuplePair]]:
     """Parse and return input."""
-    patt = re.compile(r'(-?\d{1,3})\,(-?\d{1,3})')
-    robots = []
-
-    for x in Path(fpath).read_text().split('\n'):
-        if x == '' or x == '\n':
-            continue
-
-        match = patt.findall(x)
-        pos = tuple(map(int, match[0]))
-        vel = tuple(map(int, match[1]))
-
-        robots.append((pos, vel))
-
-    return robots
+    return [
+        ((x, y), (dx, dy))
+        for x, y, dx, dy in read_ints(fpath).reshape(-1, 4).tolist()]
 
 
-def part1() -> int:
+def part1(robots: list[tuple[TuplePair]]) -> int:
     """Solution to Part 1."""
     nx = 101
     ny = 103
@@ -35,7 +29,7 @@ def part1() -> int:
 
     quads = [0, 0, 0, 0]
 
-    for pos, vel in parse_input():
+    for pos, vel in robots:
         x, y = pos
         dx, dy = vel
 
@@ -52,4 +46,4 @@ def part1() -> int:
 
 
 if __name__ == '__main__':
-    print(f'Part 1 answer: {part1()}')
+    print(f'Part 1 answer: {part1(parse_input())}')
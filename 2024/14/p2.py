@@ -1,7 +1,7 @@
 """Advent of Code 2024 - Day 14 Part 2"""
 import math
 from itertools import combinations
-from p1 import parse_input
+from p1 import TuplePair, parse_input
 
 
 class Robot:
@@ -40,7 +40,7 @@ class Robot:
         return f'<{self.__class__.__qualname__} {self.position}>'
 
 
-def part2() -> int:
+def part2(robots: list[tuple[TuplePair]]) -> int:
     """Solution to Part 2.
 
     Find the timestep corresponding to the minimum average distance
@@ -58,9 +58,7 @@ def part2() -> int:
     min_dist = 10e5
     min_idx = 0
 
-    robots = []
-    for x in parse_input():
-        robots.append(Robot(*x))
+    robots = [Robot(*x) for x in robots]
 
     for t in range(nt):
         points = []
@@ -79,4 +77,4 @@ def part2() -> int:
 
 
 if __name__ == '__main__':
-    print(f'Part 2 answer: {part2()}')
+    print(f'Part 2 answer: {part2(parse_input())}')
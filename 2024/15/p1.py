@@ -1,12 +1,21 @@
 """Advent of Code 2024 - Day 15 Part 1"""
 from __future__ import annotations
+
+import sys
 from pathlib import Path
 
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # noqa: E402
+
 
 def parse_input(f_path: str = 'input.txt') -> tuple:
     inp = Path(f_path).read_text().split('\n\n')
-    return [list(x) for x in inp[0].split('\n')], inp[1].replace('\n', '')
+    return Grid.from_text(inp[0], pad='#'), inp[1].replace('\n', '')
+
 
+WALL, EMPTY, BOX_L, BOX_R = map(ord, '#.[]')
 
 MoveDirs = {
     '^': (-1, 0),
@@ -18,112 +27,90 @@ MoveDirs = {
 
 class Fishtank:
 
-    def __init__(self, tank_map: list[list[str]]) -> None:
+    def __init__(self, tank_map: Grid) -> None:
         self.grid = tank_map
-        self.num_i, self.num_j = self._set_dims()
-        self.robot_pos = self._get_init_pos()
+        self._setup()
         self.part = 1
 
-    def _get_init_pos(self) -> tuple[int, int]:
-        """Find edges and robot's initial position"""
-        rpos = None
-        for i in range(self.num_i):
-            for j in range(self.num_j):
-                if self.grid[i][j] == '@':
-                    rpos = (i, j)
-                    self.grid[i][j] = '.'
-                    break
-
-        return rpos
+    def _setup(self) -> None:
+        """Set the dimensions, flat move offsets and robot's position."""
+        self.num_i, self.num_j = self.grid.shape
+        self.moves = {
+            move_str: di * self.grid.width + dj
+            for move_str, (di, dj) in MoveDirs.items()}
+        self.robot_pos = self._get_init_pos()
 
-    def _set_dims(self) -> tuple[int, int]:
-        return len(self.grid), len(self.grid[0])
+    def _get_init_pos(self) -> int:
+        """Find the robot's initial position as a flat index."""
+        rpos = self.grid.index(*self.grid.find_one('@'))
+        self.grid.data[rpos] = EMPTY
 
-    def move_robot(self, move_str: str) -> tuple[int, int]:
-        i, j = self.robot_pos
-        di, dj = MoveDirs[move_str]
+        return rpos
 
-        ii = i + di
-        jj = j + dj
+    def move_robot(self, move_str: str) -> None:
+        data = self.grid.data
+        d = self.moves[move_str]
+        nxt = self.robot_pos + d
 
-        if self.grid[ii][jj] == '.':
-            self.robot_pos = (ii, jj)
-        elif self.grid[ii][jj] == '#':
+        if data[nxt] == EMPTY:
+            self.robot_pos = nxt
+        elif data[nxt] == WALL:
             return
         else:
-            edges, adjacent = self._get_adjacent(i, j, move_str)
-            blocked = 0
-            di, dj = MoveDirs[move_str]
+            edges, adjacent = self._get_adjacent(self.robot_pos, move_str)
             for box in edges:
-                ni = box[0] + di
-                nj = box[1] + dj
-                if self.grid[ni][nj] == "#":
-                    blocked += 1
-            if blocked == 0:
-                self.update_grid(adjacent, move_str)
-                self.robot_pos = (i + di, j + dj)
-
-    def update_grid(self, adjacent: list[tuple], move_str: str) -> None:
-        coords = []
-
-        if move_str == '^':
-            coords = sorted(adjacent, key=lambda x : x[0])
-        elif move_str == 'v':
-            coords = sorted(adjacent, key=lambda x : x[0], reverse=True)
-        elif move_str == '>':
-            coords = sorted(adjacent, key=lambda x : x[1], reverse=True)
-        elif move_str == '<':
-            coords = sorted(adjacent, key=lambda x : x[1])
-
-        di, dj = MoveDirs[move_str]
-        for c in coords:
-            i, j = c
-            ni = i + di
-            nj = j + dj
-            self.grid[ni][nj] = self.grid[i][j]
-            self.grid[i][j] = '.'
-
-    def _get_adjacent(self, i: int, j: int, move_str: str) -> any:
+                if data[box + d] == WALL:
+                    return
+
+            self.update_grid(adjacent, move_str)
+            self.robot_pos = nxt
+
+    def update_grid(self, adjacent: set[int], move_str: str) -> None:
+        """Shift boxes one step, starting with the one furthest ahead."""
+        data = self.grid.data
+        d = self.moves[move_str]
+
+        for idx in sorted(adjacent, reverse=d > 0):
+            data[idx + d] = data[idx]
+            data[idx] = EMPTY
+
+    def _get_adjacent(self, idx: int, move_str: str) -> any:
+        """Return the boxes at the front of a push and every box pushed."""
+        data = self.grid.data
+        d = self.moves[move_str]
         adj = set()
-        di, dj = MoveDirs[move_str]
-        orig_i = i
-        orig_j = j
 
         if self.part == 1 or move_str in '<>':
-            while True:
-                ni = i + di
-                nj = j + dj
+            while data[idx + d] not in (EMPTY, WALL):
+                idx += d
+                adj.add(idx)
 
-                if self.grid[ni][nj] in '.#':
-                    return [(ni-di, nj-dj)], adj
+            return [idx], adj
 
-                i = ni
-                j = nj
-                adj.add((i, j))
-        else:
-            edges = []
-            queue = [(i, j)]
+        edges = []
+        queue = [idx]
+
+        for idx in queue:
+            if idx in adj:
+                continue
 
-            while queue:
-                i, j = queue.pop(0)
+            adj.add(idx)
+            nxt = idx + d
 
-                if (i, j) in adj:
-                    continue
+            if data[nxt] in (EMPTY, WALL):
+                edges.append(idx)
+            elif data[nxt] == BOX_L:
+                queue += [nxt, nxt + 1]
+            elif data[nxt] == BOX_R:
+                queue += [nxt, nxt - 1]
 
-                adj.add((i, j))
-                ni = i + di
-                nj = j + dj
+        return edges, adj - {queue[0]}
 
-                if self.grid[ni][nj] in '.#':
-                    edges.append((i, j))
-                elif self.grid[ni][nj] == '[':
-                    queue.append((ni, nj))
-                    queue.append((ni, nj+1))
-                elif self.grid[ni][nj] == ']':
-                    queue.append((ni, nj))
-                    queue.append((ni, nj-1))
+    def gps_sum(self, box: str) -> int:
+        """Sum of the GPS coordinates of every box."""
+        rows, cols = np.nonzero(self.grid.mask(box))
 
-            return edges, adj - {(orig_i, orig_j)}
+        return int((100 * rows + cols).sum())
 
 
 def part1(f_path: str = 'input.txt') -> int:
@@ -134,9 +121,7 @@ def part1(f_path: str = 'input.txt') -> int:
     for m in moves:
         fishtank.move_robot(m)
 
-    return sum(
-        100 * i + j for i in range(fishtank.num_i)
-        for j in range(fishtank.num_j) if fishtank.grid[i][j] == 'O')
+    return fishtank.gps_sum('O')
 
 
 if __name__ == '__main__':
@@ -1,14 +1,13 @@
 """Advent of Code 2024 - Day 15 Part 2"""
-from p1 import Fishtank, parse_input
+from p1 import Fishtank, Grid, parse_input
 
 
 class UpdatedFishtank(Fishtank):
 
-    def __init__(self, tank_map: list[list[str]]) -> None:
+    def __init__(self, tank_map: Grid) -> None:
         self.grid = tank_map
         self._resize_grid()
-        self.num_i, self.num_j = self._set_dims()
-        self.robot_pos = self._get_init_pos()
+        self._setup()
         self.part = 2
 
     def _resize_grid(self):
@@ -18,8 +17,9 @@ class UpdatedFishtank(Fishtank):
             '.': '..',
             '@': '@.',
         }
-        self.grid = [list("".join(_mapping[c] for c in line))
-                     for line in self.grid]
+        self.grid = Grid(
+            ["".join(_mapping[c] for c in line) for line in self.grid.lines()],
+            pad='#')
 
 
 def part2(f_path: str = 'input.txt') -> int:
@@ -30,9 +30,7 @@ def part2(f_path: str = 'input.txt') -> int:
     for m in moves:
         fishtank.move_robot(m)
 
-    return sum(
-        100 * i + j for i in range(fishtank.num_i)
-        for j in range(fishtank.num_j) if fishtank.grid[i][j] == '[')
+    return fishtank.gps_sum('[')
 
 
 if __name__ == '__main__':
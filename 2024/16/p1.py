@@ -1,144 +1,100 @@
 """Advent of Code 2024 - Day 16 Part 1"""
 from __future__ import annotations
-from dataclasses import dataclass
-from enum import Enum
-from operator import sub
-from pathlib import Path
-from queue import PriorityQueue
-
-
-Point = tuple[int, int]
 
+import sys
+from pathlib import Path
 
-def parse_input(f_path: str = 'input.txt') -> any:
-    return [list(x) for x in Path(f_path).read_text().split('\n') if x]
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # noqa: E402
+from aoc.search import SearchResult, SearchStats, dijkstra  # noqa: E402
 
 
-def subtract(a: Point, b: Point) -> Point:
-    return tuple(map(sub, a, b))
+Point = tuple[int, int]
 
+WALL = ord('#')
 
-def update_cost(reindeer: Reindeer, pos: Point):
-    result = reindeer.cost
-    if subtract(pos, reindeer.pos) != reindeer.direction:
-        result += 1000
+# Headings index Grid.offsets4: north, east, south, west
+EAST = 1
 
-    return result + 1
+STEP_COST = 1
+TURN_COST = 1000
 
 
-class Move(Enum):
-    NORTH = (-1, 0)
-    SOUTH = (1, 0)
-    EAST = (0, 1)
-    WEST = (0, -1)
+def parse_input(f_path: str = 'input.txt') -> Grid:
+    return Grid.from_file(f_path, pad='#')
 
 
-@dataclass
-class Reindeer:
-    pos: tuple
-    cost: int
-    direction: tuple
-    visited: set
+class Solution:
+    """Reindeer maze.
 
-    def __hash__(self):
-        return hash((self.pos, self.cost, self.direction))
+    A search state is a cell and a heading, encoded as
+    ``flat_index * 4 + heading``.
+    """
 
-    def __repr__(self):
-        return f'<Reindeer ({self.pos}, {self.cost}, {self.direction})>'
+    def __init__(self, maze: Grid) -> None:
+        self.maze = maze
+        self.ni, self.nj = maze.shape
 
-    def __lt__(self, other):
-        return self.cost < other.cost
+    def _get_start_end(self) -> tuple[Point, Point]:
+        return self.maze.find_one('S'), self.maze.find_one('E')
 
+    def get_neighbors(self, state: int) -> list[tuple[int, int]]:
+        """Step forward or turn 90 degrees in place.
 
-class Solution:
+        Maze is bounded by #, so we dont need to check fot out-of-bounds.
+        """
+        idx, heading = divmod(state, 4)
+        neighbors = [
+            (state - heading + (heading + 1) % 4, TURN_COST),
+            (state - heading + (heading - 1) % 4, TURN_COST),
+        ]
 
-    def __init__(self, maze: list[list[str]]) -> None:
-        self.maze = maze
-        self.ni = len(maze)
-        self.nj = len(maze[0])
-
-    def _get_start_end(self) -> tuple[int, int]:
-        start = None
-        end = None
-        for i in range(self.ni):
-            for j in range(self.nj):
-                if self.maze[i][j] == 'S':
-                    start = (i, j)
-                elif self.maze[i][j] == 'E':
-                    end = (i, j)
-                    self.maze[i][j] = '.'
-
-            if start and end:
-                return start, end
-
-    def get_neighbors(self, pos: Point) -> list[Point]:
-        """Maze is bounded by #, so we dont need to check fot out-of-bounds."""
-        neighbors = []
-        i, j = pos
-        for move in Move:
-            di, dj = move.value
-            ii = i + di
-            jj = j + dj
-
-            if self.maze[ii][jj] == '.':
-                neighbors.append((ii, jj))
+        nxt = idx + self.maze.offsets4[heading]
+        if self.maze.data[nxt] != WALL:
+            neighbors.append((nxt * 4 + heading, STEP_COST))
 
         return neighbors
 
-    def solve(self) -> int:
-        result = []
+    def search(
+        self,
+        dag: bool = False,
+        stats: SearchStats | None = None,
+    ) -> SearchResult:
+        """Lowest cost search from the start, facing east, to the end.
 
+        Pass a SearchStats to collect the node expansions, pushes, peak
+        frontier, duplicate skips and visited memory of the search.
+        """
         start, end = self._get_start_end()
+        end_idx = self.maze.index(*end)
 
-        q = PriorityQueue()
-        q.put(Reindeer(start, 0, Move.EAST.value, set()))
+        return dijkstra(
+            self.maze.index(*start) * 4 + EAST,
+            self.get_neighbors,
+            goal=lambda state: state // 4 == end_idx,
+            dag=dag,
+            stats=stats,
+        )
 
-        min_cost = float('inf')
-        junction_lowest = {}
-
-        while not q.empty():
-            reindeer = q.get()
-            neighbors = self.get_neighbors(reindeer.pos)
-
-            if reindeer.cost > min_cost:
-                continue
-
-            if len(neighbors) > 1:
-                least = junction_lowest.get(reindeer.pos)
-                if least is not None and least < reindeer.cost:
-                    continue
-
-                junction_lowest[reindeer.pos] = reindeer.cost
-
-            for n in neighbors:
-                if n == end:
-                    result.append(update_cost(reindeer, n))
-                elif n not in reindeer.visited:
-                    visited2 = reindeer.visited.copy()
-                    visited2.add(n)
-                    cost2 = update_cost(reindeer, n)
-
-                    if len(result) == 0 or cost2 < min(result):
-                        q.put(
-                            Reindeer(n, cost2,
-                                     subtract(n, reindeer.pos), visited2))
-
-        return min(result)
+    def solve(self, stats: SearchStats | None = None) -> int:
+        return self.search(stats=stats).cost
 
     def draw(self, shortest_path: list[tuple[int, int]]) -> None:
+        maze = self.maze.copy()
+
         for p in shortest_path[1:-1]:
-            self.maze[p[0]][p[1]] = 'O'
+            maze[p] = 'O'
+
+        maze[shortest_path[0]] = 'S'
+        maze[shortest_path[-1]] = 'E'
 
-        start = shortest_path[0]
-        self.maze[start[0]][start[1]] = 'S'
+        print(maze)
 
-        end = shortest_path[-1]
-        self.maze[end[0]][end[1]] = 'E'
 
-        for x in self.maze:
-            print(''.join(x))
+def part1(maze: Grid) -> int:
+    """Lowest score of a path through the maze."""
+    return Solution(maze).solve()
 
 
 if __name__ == '__main__':
-    soln = Solution(parse_input())
-    print(f"Part 1 answer: {soln.solve()}")
+    print(f"Part 1 answer: {part1(parse_input())}")
@@ -138,10 +138,10 @@ class Processor:
                 f'B={self.registers.B}, C={self.registers.C}>')
 
 
-if __name__ == '__main__':
-    reg_vals, program = parse_input()
+def part1(reg_vals: list[int], program: list[int]) -> str:
+    """Output of the program, comma-separated."""
+    return Processor(reg_vals).run_program(program)
 
-    proc = Processor(reg_vals)
-    rtn = proc.run_program(program)
 
-    print(f'Part 1 answer: {rtn}')
+if __name__ == '__main__':
+    print(f'Part 1 answer: {part1(*parse_input())}')
@@ -41,9 +41,8 @@ def reverse_prog(program: list[str]) -> int:
     return min(valid_vals)
 
 
-if __name__ == '__main__':
-    reg_vals, program = p1.parse_input()
-
+def part2(reg_vals: list[int], program: list[int]) -> int:
+    """Lowest value of register A that makes the program output itself."""
     ans = reverse_prog(program)
 
     # Validate our answer
@@ -52,4 +51,8 @@ if __name__ == '__main__':
 
     assert test == truth, f'Validation failed: {test} != {truth}'
 
-    print(f'Part 2 answer: {ans}')
+    return ans
+
+
+if __name__ == '__main__':
+    print(f'Part 2 answer: {part2(*p1.parse_input())}')
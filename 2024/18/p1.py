@@ -1,8 +1,12 @@
 """Advent of Code 2024 - Day 18 Parts 1 & 2"""
-from collections import deque
-from enum import Enum
+import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # noqa: E402
+from aoc.search import SearchStats, bfs  # noqa: E402
+from aoc.unionfind import UnionFind  # noqa: E402
+
 
 Point = tuple[int, int]
 
@@ -26,12 +30,7 @@ def parse_input(f_path: str = 'input.txt') -> list[Point]:
     ]
 
 
-class Move(Enum):
-    """Maze movements, represented by their delta i and delta j values."""
-    UP = (-1, 0)
-    DOWN = (1, 0)
-    RIGHT = (0, 1)
-    LEFT = (0, -1)
+WALL = ord('#')
 
 
 class MemoryMap:
@@ -45,7 +44,7 @@ class MemoryMap:
         Size of the maze in the i-direction.
     nj: int
         Size of the maze in the j-direction.
-    map: list of list of str
+    map: Grid
         The maze, where '#' are obstructions and '.' are open spaces.
     """
 
@@ -73,7 +72,7 @@ class MemoryMap:
         self.byte_idx = add_bytes - 1
         self.ni = ni
         self.nj = nj
-        self.map = [['.'] * self.nj for _ in range(self.ni)]
+        self.map = Grid.filled(self.ni, self.nj, '.', pad='#')
         self._corrupt(add_bytes)
 
     def _corrupt(self, num_bytes: int) -> None:
@@ -88,49 +87,26 @@ class MemoryMap:
         -------
         None.
         """
-        for (i, j) in self.bytes[:num_bytes]:
-            self.map[i][j] = '#'
-
-    def _valid_move(
-        self,
-        curr_pos: Point,
-        move: Point,
-    ) -> Point | None:
-        """Determine if the given move is valid. If it is, return the
-        coordinates of the resulting grid space. Else return None.
-
-        Parameters
-        ----------
-        curr_pos: tuple of (int, int)
-            i and j coordinates of the current position.
-        move: tuple of (int, int)
-            Delta i and Delta values representing the move.
-
-        Returns
-        -------
-        None
-            The move is out of bounds.
-        tuple of (int, int) or None
-            i and j coordinates of the resulting move if valid.
-        """
-        i, j = curr_pos
-        ii = i + move[0]
-        jj = j + move[1]
+        for point in self.bytes[:num_bytes]:
+            self.map[point] = '#'
 
-        if 0 <= ii < self.ni and 0 <= jj < self.nj and self.map[ii][jj] != '#':
-            return (ii, jj)
+    def _neighbors(self, idx: int) -> list[int]:
+        """Return the flat indices of the open spaces next to a space."""
+        data = self.map.data
 
-        return None
+        return [
+            idx + move for move in self.map.offsets4
+            if data[idx + move] != WALL]
 
     def add_byte(self) -> None:
         self.byte_idx += 1
-        i, j = self.bytes[self.byte_idx]
-        self.map[i][j] = '#'
+        self.map[self.bytes[self.byte_idx]] = '#'
 
     def solve(
         self,
         start_pos: Point = (0, 0),
         end_pos: Point = None,
+        stats: SearchStats = None,
     ) -> list[Point]:
         """BFS returning the shortest path.
 
@@ -140,9 +116,8 @@ class MemoryMap:
             Starting position. Default is (0, 0).
         end_pos: tuple of (int, int), optional
             End position/goal. Default is (self.ni - 1, self.nj - 1)
-        part: int, optional
-            Indicates whether we are solving part 1 or 2 of the problem.
-            Default is 1.
+        stats: SearchStats, optional
+            Collects the work done by the search.
 
         Returns
         -------
@@ -151,27 +126,12 @@ class MemoryMap:
         """
         end_pos = (self.ni-1, self.nj-1) if end_pos is None else end_pos
 
-        visited = {}
-        queue = deque()
-
-        visited[start_pos] = None
-        queue.append(start_pos)
-
-        while queue:
-            curr_pos = queue.popleft()
+        result = bfs(
+            self.map.index(*start_pos), self._neighbors,
+            goal=self.map.index(*end_pos), stats=stats)
 
-            if curr_pos == end_pos:
-                path = []
-                while curr_pos:
-                    path.append(curr_pos)
-                    curr_pos = visited[curr_pos]
-                return path[::-1]
-
-            for move in Move:
-                neighbor = self._valid_move(curr_pos, move.value)
-                if neighbor is not None and neighbor not in visited:
-                    visited[neighbor] = curr_pos
-                    queue.append(neighbor)
+        if result.goal is not None:
+            return [self.map.point(idx) for idx in result.path()]
 
         # Reverse since answer is in (x, y)
         return self.bytes[self.byte_idx][::-1]
@@ -190,29 +150,80 @@ class MemoryMap:
         None.
         """
         if path:
-            for (i, j) in path:
-                self.map[i][j] = 'O'
+            for point in path:
+                self.map[point] = 'O'
 
-        for i in range(self.ni):
-            print(''.join(self.map[i]))
+        print(self.map)
 
     def __repr__(self) -> str:
         """Return a string representation of the class."""
         return f'<{self.__class__.__name__} ni={self.ni}, nj={self.nj}>'
 
 
-if __name__ == '__main__':
-    mem = MemoryMap(parse_input())
+def part1(points: list[Point]) -> int:
+    """Fewest steps to the exit after the first 1024 bytes have fallen."""
+    return len(MemoryMap(points).solve()) - 1
 
-    part1 = mem.solve()
-    print(f'Part 1 Answer: {len(part1)-1}')
 
-    part2 = mem.solve()[-1]
-    while part2 == (70, 70):
-        mem.add_byte()
-        part2 = mem.solve()
+def first_blocker(points: list[Point], ni: int = 71, nj: int = 71) -> Point:
+    """Return the (i, j) of the first byte that cuts the exit off.
 
-        if len(part2) > 2:
-            part2 = part2[-1]
+    The start (top left) and the exit (bottom right) split the border into
+    two arcs: the top and right edges, and the left and bottom edges. The
+    exit is cut off as soon as a chain of bytes, touching each other
+    side-on or diagonally, joins the two arcs. So instead of searching the
+    maze after every byte, each byte is joined to the bytes around it and
+    to the arcs it touches, until the arcs end up in the same set.
 
-    print(f'Part 2 Answer: {part2}')
+    Parameters
+    ----------
+    points: list of tuple of (int, int)
+        (i, j) of the falling bytes, in order.
+    ni: int, optional
+        Size of the maze in the i-direction. Default is 71.
+    nj: int, optional
+        Size of the maze in the j-direction. Default is 71.
+
+    Returns
+    -------
+    tuple of (int, int)
+
+    Raises
+    ------
+    ValueError
+        The exit is never cut off.
+    """
+    grid = Grid.filled(ni, nj, '.', pad='.')
+    data = grid.data
+    # Two extra elements for the arcs
+    top_right, bottom_left = len(data), len(data) + 1
+    walls = UnionFind(len(data) + 2)
+
+    for i, j in points:
+        idx = grid.index(i, j)
+        data[idx] = WALL
+
+        for move in grid.offsets8:
+            if data[idx + move] == WALL:
+                walls.union(idx, idx + move)
+
+        if i == 0 or j == nj - 1:
+            walls.union(idx, top_right)
+        if i == ni - 1 or j == 0:
+            walls.union(idx, bottom_left)
+
+        if walls.connected(top_right, bottom_left):
+            return i, j
+
+    raise ValueError('the exit is never cut off')
+
+
+def part2(points: list[Point]) -> str:
+    """Coordinates (``x,y``) of the first byte that blocks the exit."""
+    # Reverse since answer is in (x, y)
+    return ','.join(map(str, first_blocker(points)[::-1]))
+
+
+if __name__ == '__main__':
+    print(f'Part 1 Answer: {part1(parse_input())}')
+    print(f'Part 2 Answer: {part2(parse_input())}')
@@ -1,7 +1,10 @@
 """Advent of Code 2014 - Day 19 Part 1"""
-from functools import cache
+import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.memo import memoize  # noqa: E402
+
 
 def parse_input(f_path: str = 'input.txt') -> tuple[list[str], list[str]]:
     """Return input from a file and return as a list of tuples.
@@ -20,13 +23,15 @@ def parse_input(f_path: str = 'input.txt') -> tuple[list[str], list[str]]:
     return patterns.strip().split(', '), [x for x in designs.split('\n') if x]
 
 
-@cache
-def count(design: str) -> int:
+@memoize(scoped=True)
+def count(patterns: list[str], design: str) -> int:
     """Determine if the given design can be constructed from the available
     patterns.
 
     Parameters
     ----------
+    patterns: list of str
+        Available patterns. The cache is dropped when they change.
     design: str
         Desired design to construct.
 
@@ -39,11 +44,14 @@ def count(design: str) -> int:
         return 1
 
     return sum(
-        count(design[len(p):]) for p in patterns if design.startswith(p))
+        count(patterns, design[len(p):])
+        for p in patterns if design.startswith(p))
 
 
-if __name__ == '__main__':
-    patterns, designs = parse_input()
+def part1(patterns: list[str], designs: list[str]) -> int:
+    """Return the number of designs that can be constructed."""
+    return len([d for d in designs if count(patterns, d)])
 
-    num_combos = len([c for c in [count(d) for d in designs] if c])
-    print(f'Part 1 Answer: {num_combos}')
+
+if __name__ == '__main__':
+    print(f'Part 1 Answer: {part1(*parse_input())}')
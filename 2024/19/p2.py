@@ -1,20 +1,25 @@
 """Advent of Code 2014 - Day 19 Part 2"""
 import sys
-from functools import cache
+from pathlib import Path
 
 from p1 import parse_input
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.memo import memoize  # noqa: E402
+
 # Just in case
 sys.setrecursionlimit(100000)
 
 
-@cache
-def count(design: str) -> bool:
+@memoize(scoped=True)
+def count(patterns: list[str], design: str) -> int:
     """Count how many ways the given design can be constructed from the
     available designs.
 
     Parameters
     ----------
+    patterns: list of str
+        Available patterns. The cache is dropped when they change.
     design: str
         Desired design to construct.
 
@@ -29,11 +34,15 @@ def count(design: str) -> bool:
     result = 0
     for p in patterns:
         if design.startswith(p):
-            result += count(design[len(p):])
+            result += count(patterns, design[len(p):])
 
     return result
 
 
+def part2(patterns: list[str], designs: list[str]) -> int:
+    """Return the number of ways all designs can be constructed."""
+    return sum(count(patterns, d) for d in designs)
+
+
 if __name__ == '__main__':
-    patterns, designs = parse_input()
-    print(f'Part 2 Answer: {sum([count(d) for d in designs])}')
+    print(f'Part 2 Answer: {part2(*parse_input())}')
@@ -1,13 +1,16 @@
 """Advent of Code 2024 - Day 20 Part 1"""
-from collections import deque
-from enum import Enum
+import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # noqa: E402
+from aoc.search import SearchStats, bfs  # noqa: E402
+
 
 Point = tuple[int, int]
 
 
-def parse_input(f_path = 'input.txt') -> list[list[str]]:
+def parse_input(f_path = 'input.txt') -> Grid:
     """Parse input from file.
 
     Parameters
@@ -17,97 +20,57 @@ def parse_input(f_path = 'input.txt') -> list[list[str]]:
 
     Returns
     -------
-    list of list of str
+    Grid
     """
-    return [list(x) for x in Path(f_path).read_text().split('\n') if x]
+    return Grid.from_file(f_path, pad='#')
 
 
-class Move(Enum):
-    UP = (-1, 0)
-    DOWN = (1, 0)
-    LEFT = (0, -1)
-    RIGHT = (0, 1)
+WALL = ord('#')
 
 
 class Maze:
 
-    def __init__(self, input: list[list[str]]) -> None:
+    def __init__(self, input: Grid) -> None:
         self.map = input
-        self.ni = len(input)
-        self.nj = len(input[0])
+        self.ni, self.nj = input.shape
         self.start, self.end = self.get_start_end()
 
-    def bfs(self) -> list[Point]:
-        """BFS returning the shorted path between the start & end points."""
-        visited = {}
-        queue = deque()
-
-        (i, j) , end_pos = self.start, self.end
-
-        visited[(i, j)] = None
-        queue.append((i, j))
+    def bfs(self, stats: SearchStats = None) -> list[Point]:
+        """BFS returning the shorted path between the start & end points.
 
-        while queue:
-            (i, j) = queue.popleft()
+        Pass a SearchStats to collect the work done by the search.
+        """
+        result = bfs(
+            self.map.index(*self.start), self._neighbors,
+            goal=self.map.index(*self.end), stats=stats)
 
-            if (i, j) == end_pos:
-                path = []
-                curr_pos = (i, j)
-                while curr_pos:
-                    path.append(curr_pos)
-                    curr_pos = visited[curr_pos]
-                return path[::-1]
-
-            for move in Move:
-                di, dj = move.value
-                ii = i + di
-                jj = j + dj
-
-                if self._valid_move((ii, jj)) and (ii, jj) not in visited:
-                    visited[(ii, jj)] = (i, j)
-                    queue.append((ii, jj))
+        if result.goal is not None:
+            return [self.map.point(idx) for idx in result.path()]
 
     def get_start_end(self) -> tuple[Point]:
         """Get the coordinates of the start & end positions."""
-        start = None
-        end = None
-
-        for i in range(self.ni):
-            for j in range(self.nj):
-                if self.map[i][j] == 'S':
-                    start = (i, j)
-                elif self.map[i][j] == 'E':
-                    end = (i, j)
-
-                if start and end:
-                    break
-
-        return start, end
+        return self.map.find_one('S'), self.map.find_one('E')
 
     def print(self, path: list[Point] = None) -> None:
         """Print the maze."""
         maze = self.map.copy()
 
         if path:
-            for (i, j) in path:
-                maze[i][j] = 'O'
-
-            maze[self.start[0]][self.start[1]] = 'S'
-            maze[self.end[0]][self.end[1]] = 'E'
+            for point in path:
+                maze[point] = 'O'
 
-        for row in maze:
-            print(''.join(row))
+            maze[self.start] = 'S'
+            maze[self.end] = 'E'
 
-    def _valid_move(self, next_pos: Point) -> bool:
-        ii, jj = next_pos
+        print(maze)
 
-        if (
-            0 <= ii < self.ni and 0 <= jj < self.nj and
-            self.map[ii][jj] != '#'
-        ):
-            return True
+    def _neighbors(self, idx: int) -> list[int]:
+        """Return the flat indices of the open spaces next to a space."""
+        data = self.map.data
 
-        return False
+        return [
+            idx + move for move in self.map.offsets4
+            if data[idx + move] != WALL]
 
 
 def calc_distance(a: Point, b: Point) -> int:
@@ -156,8 +119,7 @@ def find_shortcuts(maze: Maze, best_path: list[Point]) -> any:
                 continue
 
             if calc_distance(point1, point2) == 2 and point2 not in visited:
-                pi, pj = point_between(point1, point2)
-                if maze.map[pi][pj] == '#':
+                if maze.map[point_between(point1, point2)] == '#':
                     len_saved = best_path.index(point2) \
                                 - best_path.index(point1) - 2
 
@@ -171,16 +133,13 @@ def find_shortcuts(maze: Maze, best_path: list[Point]) -> any:
     return shortcuts
 
 
-if __name__ == '__main__':
-    maze = Maze(parse_input())
-    path = maze.bfs()
-    print(f'Best path length = {len(path)-1}')
+def part1(grid: Grid) -> int:
+    """Number of cheats that save at least 100 picoseconds."""
+    maze = Maze(grid)
+    shortcuts = find_shortcuts(maze, maze.bfs())
 
-    shortcuts = find_shortcuts(maze, path)
+    return sum(v for k, v in shortcuts.items() if k >= 100)
 
-    sum = 0
-    for k, v in shortcuts.items():
-        if k >= 100:
-            sum += v
 
-    print(f'Part 1 answer: {sum}')
+if __name__ == '__main__':
+    print(f'Part 1 answer: {part1(parse_input())}')
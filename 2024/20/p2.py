@@ -1,5 +1,5 @@
 """Advent of Code 2024 - Day 20 Part 2"""
-from p1 import calc_distance, parse_input, Maze, Point
+from p1 import calc_distance, parse_input, Grid, Maze, Point
 
 
 def get_distance(a: Point, b: Point, max_diff: int = 20) -> int | None:
@@ -38,8 +38,10 @@ def find_shortcuts(best_path: list[Point], length: int = 2) -> int:
     return n_cheats
 
 
-if __name__ == '__main__':
-    maze = Maze(parse_input())
-    path = maze.bfs()
+def part2(grid: Grid) -> int:
+    """Number of cheats of up to 20 picoseconds that save at least 100."""
+    return find_shortcuts(Maze(grid).bfs(), length=20)
+
 
-    print(f'Part 2 answer: {find_shortcuts(path, length=20)}')
+if __name__ == '__main__':
+    print(f'Part 2 answer: {part2(parse_input())}')
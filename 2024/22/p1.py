@@ -1,9 +1,14 @@
 """Advent of Code 2024 - Day 22 Part 1"""
+import sys
 from pathlib import Path
+from typing import Iterable
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.stream import Lines  # noqa: E402
 
-def parse_input(f_path: str = 'input.txt') -> list[int]:
-    return [int(x) for x in Path(f_path).read_text().split('\n') if x != '']
+
+def parse_input(f_path: str = 'input.txt') -> Lines:
+    return Lines(f_path, int)
 
 
 def step(n: int) -> int:
@@ -14,13 +19,18 @@ def step(n: int) -> int:
     return n
 
 
-if __name__ == '__main__':
-    sum = 0
+def part1(secrets: Iterable[int]) -> int:
+    """Sum of every buyer's 2000th secret number."""
+    total = 0
 
-    for shopper in parse_input():
+    for shopper in secrets:
         for _ in range(2000):
             shopper = step(shopper)
 
-        sum += shopper
+        total += shopper
+
+    return total
 
-    print(f'Part 1 answer: {sum}')
+
+if __name__ == '__main__':
+    print(f'Part 1 answer: {part1(parse_input())}')
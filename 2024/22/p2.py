@@ -1,5 +1,6 @@
 """Advent of Code 2024 - Day 22 Part 2"""
 from collections import defaultdict
+from typing import Iterable
 
 from p1 import parse_input, step
 
@@ -21,17 +22,24 @@ def get_prices(n: int) -> list[tuple[int, int]]:
     return prices
 
 
-patterns = defaultdict(int)
-for shopper in parse_input():
-    added = set()
-    prices = get_prices(shopper)
+def part2(secrets: Iterable[int]) -> int:
+    """Most bananas that one sequence of four price changes can buy."""
+    patterns = defaultdict(int)
 
-    for i in range(len(prices) - 3):
-        p = tuple(d[0] for d in prices[i:i+4])
-        if p in added:
-            continue
+    for shopper in secrets:
+        added = set()
+        prices = get_prices(shopper)
 
-        patterns[p] += prices[i+3][1]
-        added.add(p)
+        for i in range(len(prices) - 3):
+            p = tuple(d[0] for d in prices[i:i+4])
+            if p in added:
+                continue
 
-print(f"part 2: {max(patterns.values())}")
\ No newline at end of file
+            patterns[p] += prices[i+3][1]
+            added.add(p)
+
+    return max(patterns.values())
+
+
+if __name__ == '__main__':
+    print(f"part 2: {part2(parse_input())}")
\ No newline at end of file
@@ -39,6 +39,10 @@ def find_connections(network: dict) -> set:
     return connections
 
 
+def part1(network: dict) -> int:
+    """Number of sets of three computers with one starting with 't'."""
+    return len(find_connections(network))
+
+
 if __name__ == '__main__':
-    connections = find_connections(parse_input())
-    print(f'Part 1 answer: {len(connections)}')
+    print(f'Part 1 answer: {part1(parse_input())}')
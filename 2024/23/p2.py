@@ -1,8 +1,15 @@
 """Advent of Code 2024 - Day 22 Part 2"""
-import networkx as nx
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.lazy import lazy_import  # noqa: E402
+from p1 import parse_input  # noqa: E402
 
-def init_graph(f_path: str = 'input.txt') -> nx.Graph:
+nx = lazy_import('networkx')
+
+
+def init_graph(f_path: str = 'input.txt') -> 'nx.Graph':
     """Read input from a text file and return as a networkx Graph.
 
     Parameters
@@ -23,11 +30,26 @@ def init_graph(f_path: str = 'input.txt') -> nx.Graph:
     return g
 
 
-if __name__ == '__main__':
-    network = init_graph()
+def part2(network: dict) -> str:
+    """Password of the LAN party: the largest clique, sorted and joined.
 
-    clusters = list(nx.find_cliques_recursive(network))
+    Parameters
+    ----------
+    network: dict
+        Adjacency sets, as returned by ``p1.parse_input``.
+
+    Returns
+    -------
+    str
+    """
+    graph = nx.Graph({node: list(nbrs) for node, nbrs in network.items()})
+
+    clusters = list(nx.find_cliques_recursive(graph))
     clusters.sort(key=len, reverse=True)
     clusters[0].sort()
 
-    print(f'Part 2 answer: {",".join(clusters[0])}')
+    return ",".join(clusters[0])
+
+
+if __name__ == '__main__':
+    print(f'Part 2 answer: {part2(parse_input())}')
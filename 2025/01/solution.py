@@ -1,7 +1,16 @@
 """Advent of Code 2025 - Day 01 Parts 1 and 2"""
-from math import floor
+from __future__ import annotations
+
+import sys
 from operator import add, sub
 from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.ints import extract_ints  # noqa: E402
+from aoc.stream import Lines  # noqa: E402
 
 
 class Solution:
@@ -11,54 +20,91 @@ class Solution:
         "R": add,
     }
 
+    # Number of positions on the dial, and where it starts
+    dial_size = 100
+    start_pos = 50
+
     @classmethod
-    def read_input(cls, f_path: str | Path) -> list[str]:
-        """Read and parse the puzzle input."""
-        return Path(f_path).read_text(encoding="utf-8").split()
+    def read_input(cls, f_path: str | Path) -> Lines:
+        """Read and parse the puzzle input.
+
+        Instructions are followed one at a time, so they are read lazily.
+        """
+        return Lines(f_path, str.strip)
 
     @classmethod
-    def part_1(cls, instructions: list[str]) -> None:
+    def part_1(cls, instructions: Iterable[str]) -> int:
         """Solution to Part 1."""
         password = 0
-        curr_pos = 50
+        curr_pos = cls.start_pos
 
         for instr in instructions:
-            curr_pos = cls.rotation[instr[0]](curr_pos, int(instr[1:])) % 100
+            curr_pos = cls.rotation[instr[0]](
+                curr_pos, int(instr[1:])) % cls.dial_size
 
             if curr_pos == 0:
                 password += 1
 
-        print(f"The password for Part 1 is {password}")
+        return password
 
     @classmethod
-    def part_2(cls, instructions: list[str]) -> None:
-        """Solution to Part 2."""
-        raise NotImplementedError("TODO: make this work lol")
-        password = 0
-        curr_pos = 50
-        prev_pos = None
+    def turn(
+        cls,
+        curr_pos: int,
+        instr: str,
+        dial_size: int = 100,
+    ) -> tuple[int, int]:
+        """Turn the dial once and count the clicks that land on zero.
 
-        for instr in instructions:
-            zero_crossings = 0
+        Unwrapped, a turn sweeps the positions strictly after the current
+        one up to the new one (right), or from the new one up to just
+        before the current one (left). Every multiple of ``dial_size`` in
+        that sweep is a click on zero, and floor division counts them
+        without visiting the positions, however large the turn.
 
-            prev_pos = curr_pos
-            curr_pos = cls.rotation[instr[0]](curr_pos, int(instr[1:]))
+        Parameters
+        ----------
+        curr_pos : int
+            Position before the turn, ``0 <= curr_pos < dial_size``.
+        instr : str
+            Rotation, e.g. ``L68``.
+        dial_size : int, optional
+            Number of positions on the dial. Default is 100.
 
-            if not 0 <= curr_pos <= 99:
-                zero_crossings = abs(floor(curr_pos / 100))
-                curr_pos = curr_pos % 100
-                if zero_crossings and (curr_pos == 0 or prev_pos == 0):
-                    zero_crossings -= 1
+        Returns
+        -------
+        int
+            Position after the turn.
+        int
+            Number of clicks that landed on zero, the last one included.
+        """
+        new_pos = cls.rotation[instr[0]](curr_pos, int(instr[1:]))
 
-                password += zero_crossings
+        if new_pos >= curr_pos:
+            zeros = new_pos // dial_size - curr_pos // dial_size
+        else:
+            zeros = (curr_pos - 1) // dial_size - (new_pos - 1) // dial_size
 
-            if curr_pos == 0:
-                password += 1
+        return new_pos % dial_size, zeros
 
-        print(f"The password for Part 2 is {password}")
+    @classmethod
+    def part_2(cls, instructions: Iterable[str]) -> int:
+        """Solution to Part 2.
+
+        Counts every click that lands on zero, O(1) per instruction (see
+        ``turn``) instead of one step per click like ``part_2_brute``.
+        """
+        password = 0
+        curr_pos = cls.start_pos
+
+        for instr in instructions:
+            curr_pos, zeros = cls.turn(curr_pos, instr, cls.dial_size)
+            password += zeros
+
+        return password
 
     @classmethod
-    def part_2_brute(cls, instructions: list[str]) -> None:
+    def part_2_brute(cls, instructions: Iterable[str]) -> int:
         """Yeah we're really doing this on Day 1."""
         password = 0
         curr_pos = 50
@@ -73,7 +119,6 @@ class Solution:
 
             for n in range(int(instr[1:])):
                 curr_pos = spin_func(curr_pos, 1) % 100
-                print(f"{curr_pos=}, {prev_pos=}")
 
                 if (
                     spin_dir == "R" and curr_pos == 1 and prev_pos == 99
@@ -90,11 +135,123 @@ class Solution:
             if curr_pos == 0:
                 password += 1
 
-        print(f"The password for Part 2 is {password}")
+        return password
+
+
+class DialLog:
+    """The whole history of the dial over an instruction log, as arrays.
+
+    Instructions become one signed int64 array (``R`` positive, ``L``
+    negative), and a cumulative sum gives the unwrapped position after
+    every instruction at once. Zero landings and zero clicks are counted for
+    every instruction in bulk, then summed into prefix arrays, so any range
+    of instructions is answered in O(1).
+
+    The arrays take a few times 8 bytes per instruction; for logs too big
+    for that, ``Solution.part_1`` and ``part_2`` stream in constant memory.
+    Unwrapped positions must fit in int64, which any log of up to 10**15
+    clicks in total does.
+
+    Attributes
+    ----------
+    dial_size : int
+        Number of positions on the dial.
+    positions : numpy.ndarray
+        Position before any instruction, then after each one; ``n + 1``
+        values in ``0 .. dial_size - 1``.
+    landed : numpy.ndarray
+        ``landed[k]`` is the number of the first ``k`` instructions that
+        left the dial at zero.
+    clicked : numpy.ndarray
+        ``clicked[k]`` is the number of clicks onto zero during the first
+        ``k`` instructions.
+    """
+
+    def __init__(
+        self,
+        steps: np.ndarray,
+        dial_size: int = 100,
+        start_pos: int = 50,
+    ) -> None:
+        """Run the dial through every instruction.
+
+        Parameters
+        ----------
+        steps : numpy.ndarray
+            Signed clicks of every instruction, right positive.
+        dial_size : int, optional
+            Number of positions on the dial. Default is 100.
+        start_pos : int, optional
+            Starting position. Default is 50.
+        """
+        unwrapped = np.empty(len(steps) + 1, dtype=np.int64)
+        unwrapped[0] = start_pos
+        np.cumsum(steps, out=unwrapped[1:])
+        unwrapped[1:] += start_pos
+
+        before, after = unwrapped[:-1], unwrapped[1:]
+
+        # Multiples of dial_size in (before, after], or [after, before)
+        clicks = np.where(
+            after >= before,
+            after // dial_size - before // dial_size,
+            (before - 1) // dial_size - (after - 1) // dial_size)
+
+        self.dial_size = dial_size
+        self.positions = unwrapped % dial_size
+        self.landed = _prefix(self.positions[1:] == 0)
+        self.clicked = _prefix(clicks)
+
+    @classmethod
+    def from_text(
+        cls,
+        text: str | bytes,
+        dial_size: int = 100,
+        start_pos: int = 50,
+    ) -> DialLog:
+        """Parse ``L68``/``R48`` lines into a log without a Python loop."""
+        raw = np.frombuffer(
+            text.encode() if isinstance(text, str) else text, dtype=np.uint8)
+        turns = raw[(raw == ord("L")) | (raw == ord("R"))]
+        clicks = extract_ints(text, signed=False)
+        steps = np.where(turns == ord("R"), clicks, -clicks)
+
+        return cls(steps, dial_size, start_pos)
+
+    @classmethod
+    def from_file(
+        cls,
+        f_path: str | Path,
+        dial_size: int = 100,
+        start_pos: int = 50,
+    ) -> DialLog:
+        """Read and parse an instruction file."""
+        return cls.from_text(Path(f_path).read_bytes(), dial_size, start_pos)
+
+    def __len__(self) -> int:
+        """Return the number of instructions."""
+        return len(self.positions) - 1
+
+    def landings(self, i: int = 0, j: int | None = None) -> int:
+        """Return how many of instructions ``i .. j - 1`` ended at zero."""
+        j = len(self) if j is None else j
+        return int(self.landed[j] - self.landed[i])
+
+    def zero_clicks(self, i: int = 0, j: int | None = None) -> int:
+        """Return how many clicks of instructions ``i .. j - 1`` hit zero."""
+        j = len(self) if j is None else j
+        return int(self.clicked[j] - self.clicked[i])
+
+
+def _prefix(counts: np.ndarray) -> np.ndarray:
+    """Return the running totals of counts, starting from 0."""
+    prefix = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=prefix[1:])
+    return prefix
 
 
 if __name__ == "__main__":
     puzzle_input = Solution.read_input(Path("input.txt"))
 
-    Solution.part_1(puzzle_input)
-    Solution.part_2_brute(puzzle_input)
+    print(f"The password for Part 1 is {Solution.part_1(puzzle_input)}")
+    print(f"The password for Part 2 is {Solution.part_2(puzzle_input)}")
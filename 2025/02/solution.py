@@ -1,6 +1,10 @@
 """Advent of Code 2025 - Day 02 Parts 1 and 2"""
+import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.intervals import IntervalSet  # noqa: E402
+
 
 class Solution:
 
@@ -10,13 +14,108 @@ class Solution:
         return Path(f_path).read_text(encoding="utf-8").split(",")
 
     @classmethod
-    def part_1(cls, product_ids: list[str]) -> None:
+    def id_ranges(cls, product_ids: list[str]) -> IntervalSet:
+        """Merge the ``first-last`` ranges, so no ID is counted twice."""
+        return IntervalSet(
+            tuple(map(int, id.split("-"))) for id in product_ids)
+
+    @classmethod
+    def repeated_sum(cls, lo: int, hi: int, period: int, n_digits: int) -> int:
+        """Sum the ``n_digits`` long IDs in ``[lo, hi]`` with a period.
+
+        An ID made of a ``period`` digit pattern P repeated is P times the
+        "repunit" 10..010..01 with ones every ``period`` digits, e.g.
+        123123 = 123 * 1001. So the IDs are the multiples of that factor
+        whose quotient has exactly ``period`` digits, and their sum in a
+        range is an arithmetic series: no ID is visited.
+
+        Parameters
+        ----------
+        lo, hi : int
+            Inclusive range of IDs.
+        period : int
+            Length of the repeated pattern; must divide ``n_digits``.
+        n_digits : int
+            Length of the IDs.
+
+        Returns
+        -------
+        int
+        """
+        factor = (10**n_digits - 1) // (10**period - 1)
+        first = max(10**(period - 1), -(-lo // factor))
+        last = min(10**period - 1, hi // factor)
+
+        if first > last:
+            return 0
+
+        return factor * (first + last) * (last - first + 1) // 2
+
+    @classmethod
+    def invalid_sum(cls, lo: int, hi: int, any_repeats: bool) -> int:
+        """Sum the invalid IDs in ``[lo, hi]``.
+
+        Parameters
+        ----------
+        lo, hi : int
+            Inclusive range of IDs.
+        any_repeats : bool
+            False: a pattern repeated exactly twice (Part 1). True: repeated
+            at least twice (Part 2).
+
+        Returns
+        -------
+        int
+        """
+        total = 0
+
+        for n_digits in range(len(str(lo)), len(str(hi)) + 1):
+            if not any_repeats:
+                if n_digits % 2 == 0:
+                    total += cls.repeated_sum(
+                        lo, hi, n_digits // 2, n_digits)
+                continue
+
+            # An ID repeated r times for any prime r dividing n_digits has
+            # period n_digits / r; IDs with several of those periods are
+            # counted once by inclusion-exclusion over the sets of primes
+            primes = [
+                p for p in range(2, n_digits + 1)
+                if n_digits % p == 0
+                and all(p % q for q in range(2, int(p**0.5) + 1))]
+
+            for mask in range(1, 1 << len(primes)):
+                repeats = 1
+                for k, p in enumerate(primes):
+                    if mask >> k & 1:
+                        repeats *= p
+
+                sign = 1 if bin(mask).count("1") % 2 else -1
+                total += sign * cls.repeated_sum(
+                    lo, hi, n_digits // repeats, n_digits)
+
+        return total
+
+    @classmethod
+    def part_1(cls, product_ids: list[str]) -> int:
         """Solution to Part 1."""
-        num_invalid = 0
+        return sum(
+            cls.invalid_sum(first_id, last_id, any_repeats=False)
+            for first_id, last_id in cls.id_ranges(product_ids))
 
-        for id in product_ids:
-            first_id, last_id = map(int, id.split("-"))
+    @classmethod
+    def part_2(cls, product_ids: list[str]) -> int:
+        """Solution to Part 2."""
+        return sum(
+            cls.invalid_sum(first_id, last_id, any_repeats=True)
+            for first_id, last_id in cls.id_ranges(product_ids))
 
+    @classmethod
+    def part_1_brute(cls, product_ids: list[str]) -> int:
+        """Check every ID of every range, one at a time."""
+        num_invalid = 0
+
+        for first_id, last_id in cls.id_ranges(product_ids):
             for curr_id in range(first_id, last_id+1):
                 str_id = str(curr_id)
                 midpoint = len(str_id) // 2
@@ -27,16 +126,14 @@ class Solution:
                 ):
                     num_invalid += curr_id
 
-        print(f"The solution for Part 1 is {num_invalid}")
+        return num_invalid
 
     @classmethod
-    def part_2(cls, product_ids: list[str]) -> None:
-        """Solution to Part 2."""
-        invalid = []
-
-        for id in product_ids:
-            first_id, last_id = map(int, id.split("-"))
+    def part_2_brute(cls, product_ids: list[str]) -> int:
+        """Check every ID of every range against every pattern length."""
+        invalid = 0
 
+        for first_id, last_id in cls.id_ranges(product_ids):
             for curr_id in range(first_id, last_id+1):
                 str_id = str(curr_id)
 
@@ -47,13 +144,15 @@ class Solution:
                     num_reps = len(str_id) // pattern_len
                     pattern = str_id[:pattern_len]
 
-                    if pattern * num_reps == str_id and curr_id not in invalid:
-                        invalid.append(curr_id)
+                    if pattern * num_reps == str_id:
+                        # Count each ID once, whatever the pattern
+                        invalid += curr_id
+                        break
 
-        print(f"The solution for Part 2 is {sum(invalid)}")
+        return invalid
 
 
 if __name__ == "__main__":
     input = Solution.read_input(Path("input.txt"))
-    Solution.part_1(input)
-    Solution.part_2(input)
+    print(f"The solution for Part 1 is {Solution.part_1(input)}")
+    print(f"The solution for Part 2 is {Solution.part_2(input)}")
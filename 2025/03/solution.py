@@ -1,17 +1,150 @@
 """Advent of Code 2025 - Day 03 Parts 1 and 2"""
+import sys
 from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.stream import Lines  # noqa: E402
 
 
 class Solution:
 
     @classmethod
-    def read_input(cls, f_path: str | Path) -> list[str]:
-        """Read and parse the puzzle input."""
-        return Path(f_path).read_text(encoding="utf-8").split()
+    def read_input(cls, f_path: str | Path) -> Lines:
+        """Read and parse the puzzle input.
+
+        Banks are handled one at a time, so they are read lazily.
+        """
+        return Lines(f_path, str.strip)
+
+    @classmethod
+    def best_k_digits(cls, bank: str, k: int) -> int:
+        """Return the largest number made of ``k`` digits of a bank, in order.
+
+        Single pass with a monotonic stack: a digit pops the smaller digits
+        before it for as long as enough digits are left to drop, so every
+        digit is pushed and popped at most once, O(len(bank)) for any k.
+
+        Parameters
+        ----------
+        bank : str
+            Digits of the bank.
+        k : int
+            Number of batteries to turn on.
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        ValueError
+            ``k`` is not between 1 and the bank length.
+        """
+        if not 0 < k <= len(bank):
+            raise ValueError(f"cannot pick {k} of {len(bank)} digits")
+
+        to_drop = len(bank) - k
+        stack = []
+
+        for digit in bank:
+            while to_drop and stack and stack[-1] < digit:
+                stack.pop()
+                to_drop -= 1
+            stack.append(digit)
+
+        return int("".join(stack[:k]))
+
+    @classmethod
+    def read_matrices(cls, f_path: str | Path) -> list[np.ndarray]:
+        """Read the banks as digit matrices, one per bank length.
+
+        Returns
+        -------
+        list[numpy.ndarray]
+            uint8 arrays of shape ``(banks, length)``, one row per bank.
+        """
+        by_length = {}
+
+        for bank in Path(f_path).read_bytes().split():
+            by_length.setdefault(len(bank), []).append(bank)
+
+        return [
+            np.frombuffer(b"".join(banks), dtype=np.uint8)
+            .reshape(len(banks), length) - ord("0")
+            for length, banks in by_length.items()]
+
+    @classmethod
+    def best_k_digits_batch(cls, digits: np.ndarray, k: int) -> np.ndarray:
+        """Return ``best_k_digits`` of every row of a digit matrix at once.
+
+        Greedy, one digit at a time for all rows together: the next digit
+        is the first maximum of the window that still leaves enough digits
+        after it, from just past the previous pick. Columns before the
+        previous pick are masked out, so a single ``argmax`` over the
+        windows picks the digit of every row.
+
+        Parameters
+        ----------
+        digits : numpy.ndarray
+            Digits of equal-length banks, shape ``(banks, length)``.
+        k : int
+            Number of batteries to turn on; at most 18 so the joltages fit
+            in int64.
+
+        Returns
+        -------
+        numpy.ndarray
+            int64 joltage of every bank.
+
+        Raises
+        ------
+        ValueError
+            ``k`` is larger than 18 or than the bank length.
+        """
+        n_banks, length = digits.shape
+        if not 0 < k <= min(18, length):
+            raise ValueError(f"cannot pick {k} of {length} digits in int64")
+
+        digits = digits.astype(np.int8)
+        columns = np.arange(length)
+        rows = np.arange(n_banks)
+        start = np.zeros(n_banks, dtype=np.int64)
+        joltages = np.zeros(n_banks, dtype=np.int64)
+
+        for pos in range(k):
+            end = length - k + pos + 1
+            window = np.where(
+                columns[:end] >= start[:, None], digits[:, :end], -1)
+            picked = window.argmax(axis=1)
+
+            joltages = joltages * 10 + digits[rows, picked]
+            start = picked + 1
+
+        return joltages
+
+    @classmethod
+    def joltage_batch(cls, matrices: list[np.ndarray], k: int) -> int:
+        """Sum the ``k`` digit joltages of the banks of every matrix."""
+        return sum(
+            int(cls.best_k_digits_batch(digits, k).sum())
+            for digits in matrices)
 
     @classmethod
-    def part_1(cls, banks: list[str]) -> int:
+    def part_1(cls, banks: Iterable[str]) -> int:
         """Solution to Part 1."""
+        return sum(cls.best_k_digits(bank, 2) for bank in banks)
+
+    @classmethod
+    def part_2(cls, banks: Iterable[str]) -> int:
+        """Solution to Part 2."""
+        return sum(cls.best_k_digits(bank, 12) for bank in banks)
+
+    @classmethod
+    def part_1_brute(cls, banks: Iterable[str]) -> int:
+        """Try every pair of batteries of every bank."""
         joltages = []
 
         for bank in banks:
@@ -28,13 +161,13 @@ class Solution:
         return sum(joltages)
 
     @classmethod
-    def part_2(cls, inp: list[str]) -> int:
-        """Greedy solution to Part 2."""
+    def part_2_greedy(cls, inp: Iterable[str]) -> int:
+        """Pick each digit with ``max`` over a slice, then find it again."""
         joltages = []
-        bank_len = len(inp[0])
         joltage_len = 12
 
         for bank in inp:
+            bank_len = len(bank)
             max_joltage = []
             start_idx = 0
 
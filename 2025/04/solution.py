@@ -1,100 +1,48 @@
 """Advent of Code 2025 - Day 04 Parts 1 and 2"""
+import sys
 from pathlib import Path
 
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # noqa: E402
+
 
 class Solution:
 
-    window_size = 3
-    half_window = window_size // 2
+    max_neighbors = 3
 
     @classmethod
-    def read_input(cls, f_path: str | Path) -> list[list[str]]:
-        """Read puzzle input and return as a list of strings."""
-        return [
-            list(x) for x in Path(f_path).read_text(encoding="utf-8").split()
-            if x]
+    def read_input(cls, f_path: str | Path) -> Grid:
+        """Read puzzle input and return it as a Grid."""
+        return Grid.from_file(f_path, pad=".")
 
     @classmethod
-    def part_1(cls, inp: list[str]) -> int:
-        """Solution to Part 1."""
-        result = 0
-        n_rows = len(inp)
-        n_cols = len(inp[0])
-
-        for row in range(n_rows):
-            for col in range(n_cols):
-                curr_window = []
-
-                for i in range(
-                    row - cls.half_window,
-                    row - cls.half_window + cls.window_size
-                ):
-                    row_vals = []
-
-                    for j in range(
-                        col - cls.half_window,
-                        col - cls.half_window + cls.window_size
-                    ):
-
-                        if i < 0 or j < 0:
-                            row_vals.append(".")
-                            continue
+    def accessible(cls, grid: Grid) -> np.ndarray:
+        """Return a mask of the paper rolls with few enough neighbors."""
+        return grid.mask("@") & (
+            grid.neighbor_count("@") <= cls.max_neighbors)
 
-                        try:
-                            row_vals.append(inp[i][j])
-                        except IndexError:
-                            row_vals.append(".")
-
-                    curr_window.append(row_vals)
-
-                num_neighbors = sum(x.count("@") for x in curr_window)
-                if curr_window[1][1] == "@" and num_neighbors < 5:
-                    result += 1
-
-        return result
+    @classmethod
+    def part_1(cls, inp: Grid) -> int:
+        """Solution to Part 1."""
+        return int(np.count_nonzero(cls.accessible(inp)))
 
     @classmethod
-    def part_2(cls, inp: list[str]) -> int:
-        """Solution to Part 2.."""
+    def part_2(cls, inp: Grid) -> int:
+        """Solution to Part 2.
+
+        Every accessible roll is removed at once and the neighbor counts are
+        recomputed, until no more rolls can be removed. The rolls that end up
+        removed do not depend on the order they are removed in.
+        """
         result = 0
-        num_removed = -1
-        n_rows = len(inp)
-        n_cols = len(inp[0])
-
-        while num_removed != 0:
-            num_removed = 0
-
-            for row in range(n_rows):
-                for col in range(n_cols):
-                    curr_window = []
-
-                    for i in range(
-                        row - cls.half_window,
-                        row - cls.half_window + cls.window_size
-                    ):
-                        row_vals = []
-
-                        for j in range(
-                            col - cls.half_window,
-                            col - cls.half_window + cls.window_size
-                        ):
-
-                            if i < 0 or j < 0:
-                                row_vals.append(".")
-                                continue
-
-                            try:
-                                row_vals.append(inp[i][j])
-                            except IndexError:
-                                row_vals.append(".")
-
-                        curr_window.append(row_vals)
-
-                    num_neighbors = sum(x.count("@") for x in curr_window)
-                    if curr_window[1][1] == "@" and num_neighbors < 5:
-                        inp[row][col] = "."
-                        num_removed = 1
-                        result += 1
+        removable = cls.accessible(inp)
+
+        while removable.any():
+            inp.inner[removable] = ord(".")
+            result += int(np.count_nonzero(removable))
+            removable = cls.accessible(inp)
 
         return result
 
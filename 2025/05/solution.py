@@ -1,6 +1,10 @@
 """Advent of Code 2025 - Day 5 Parts 1 and 2"""
+import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.intervals import IntervalSet  # noqa: E402
+
 
 class Solution:
     """Advent of Code 2025 - Day 5 Part 1 and 2 solutions"""
@@ -60,18 +64,13 @@ class Solution:
         ---------
         We need to identify all IDs that fall into any of the given ID ranges.
         Since we only want to count an ID once regardless of how many ID
-        ranges it is contained by, all IDs deemed valid for a given range
-        will be added to a set. Taking the length of the set yields the
-        number of valid IDs.
+        ranges it is contained by, the ranges are merged into an interval
+        set first and each distinct ID is looked up once, with a binary
+        search over the merged ranges rather than a scan of all of them.
         """
-        fresh = set()
-
-        for (min_id, max_id) in ranges:
-            for curr_id in ids:
-                if min_id <= curr_id <= max_id:
-                    fresh.add(curr_id)
+        fresh = IntervalSet(ranges)
 
-        return len(fresh)
+        return int(fresh.contains_many(sorted(set(ids))).sum())
 
     @classmethod
     def part_2(cls, ranges: list[tuple[int, int]]) -> int:
@@ -90,29 +89,14 @@ class Solution:
         Breakdown
         ---------
         The idea here is to combine as many adjacent/overlapping ID ranges as
-        we can, then sum the sizes of the ranges.
+        we can, then sum the sizes of the ranges. The interval set merges
+        them as it is built, so the answer is its total size.
 
         Attempting to solve this part with an approach similar to Part 1 will
         lead to memory errors due to the size of the integers in the puzzle
         input.
         """
-        merged_ranges = []
-        ranges.sort()
-
-        for (min_id, max_id) in ranges:
-            if merged_ranges and min_id <= merged_ranges[-1][1] + 1:
-                # Overlapping or adjacent - extend the last range
-                merged_ranges[-1] = (
-                    merged_ranges[-1][0], max(merged_ranges[-1][1], max_id))
-            else:
-                # Non-overlapping - add as new range
-                merged_ranges.append((min_id, max_id))
-
-        total = 0
-        for start, end in merged_ranges:
-            total += (end - start + 1)
-
-        return total
+        return IntervalSet(ranges).total()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,19 @@
 """Advent of Code 2025 - Day 07 Parts 1 and 2."""
+import sys
 from pathlib import Path
 
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # noqa: E402
+
 
 class Solution:
     """Advent of Code 2025 - Day 07 Part 1 and 2 solutions."""
 
     @classmethod
-    def read_input(cls, f_path: str | Path) -> list[list[str]]:
-        """Read puzzle input and return as a list of strings.
+    def read_input(cls, f_path: str | Path) -> Grid:
+        """Read puzzle input and return it as a Grid.
 
         Parameters
         ----------
@@ -16,18 +22,32 @@ class Solution:
 
         Returns
         -------
-        list[list[str]]
+        Grid
+        """
+        return Grid.from_file(f_path, pad=".")
+
+    @classmethod
+    def splitters(cls, inp: Grid) -> list[list[int]]:
+        """Return the columns of the splitters in each row, left to right.
+
+        Parameters
+        ----------
+        inp: Grid
+            Puzzle input.
+
+        Returns
+        -------
+        list[list[int]]
         """
-        return [
-            list(x) for x in Path(f_path).read_text(encoding="utf-8").split()]
+        return [np.flatnonzero(row == ord("^")).tolist() for row in inp.inner]
 
     @classmethod
-    def part_1(cls, inp: list[list[str]]) -> int:
+    def part_1(cls, inp: Grid) -> int:
         """Solution to Part 1.
 
         Parameters
         ----------
-        inp: list[list[str]]
+        inp: Grid
             Puzzle input.
 
         Returns
@@ -41,26 +61,26 @@ class Solution:
         """
         num_splits = 0
 
-        beams = [" "] * len(inp[0])
-        beams[inp[0].index("S")] = "|"
+        beams = [False] * inp.ncols
+        beams[inp.find_one("S")[1]] = True
 
-        for row in inp[1:]:
-            for col_idx, col_val in enumerate(row):
-                if col_val == "^" and beams[col_idx] == "|":
+        for row in cls.splitters(inp)[1:]:
+            for col_idx in row:
+                if beams[col_idx]:
                     num_splits += 1
-                    beams[col_idx] = " "
-                    beams[col_idx - 1] = "|"
-                    beams[col_idx + 1] = "|"
+                    beams[col_idx] = False
+                    beams[col_idx - 1] = True
+                    beams[col_idx + 1] = True
 
         return num_splits
 
     @classmethod
-    def part_2(cls, inp: list[list[str]]) -> int:
+    def part_2(cls, inp: Grid) -> int:
         """Solution to Part 2.
 
         Parameters
         ----------
-        inp: list[list[str]]
+        inp: Grid
             Puzzle input.
 
         Returns
@@ -72,16 +92,15 @@ class Solution:
         ---------
         TODO
         """
-        timelines = [0] * len(inp[0])
-        timelines[inp[0].index("S")] += 1
-
-        for row in inp:
-            for col_idx, col_val in enumerate(row):
-                if col_val == "^":
-                    curr_val = timelines[col_idx]
-                    timelines[col_idx] = 0
-                    timelines[col_idx - 1] += curr_val
-                    timelines[col_idx + 1] += curr_val
+        timelines = [0] * inp.ncols
+        timelines[inp.find_one("S")[1]] += 1
+
+        for row in cls.splitters(inp):
+            for col_idx in row:
+                curr_val = timelines[col_idx]
+                timelines[col_idx] = 0
+                timelines[col_idx - 1] += curr_val
+                timelines[col_idx + 1] += curr_val
 
         return sum(timelines)
 
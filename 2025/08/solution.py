@@ -1,74 +1,69 @@
 """Advent of Code 2025 - Day 8 Parts 1 and 2"""
+import sys
 from math import sqrt
 from pathlib import Path
 
+import numpy as np
 
-# Type alias
-XYZ = tuple[int, int, int]
-
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.cache import cached_parse  # noqa: E402
+from aoc.ints import read_ints  # noqa: E402
+from aoc.unionfind import UnionFind  # noqa: E402
 
-class UnionFind:
-    """A simple disjoint-set/union-find data structure."""
 
-    def __init__(self):
-        """Instantiate a new UnionFind."""
-        self.parent: dict[int, int] = {}
-
-    def make_set(self, elements: list[XYZ]) -> None:
-        """Add elements to the parent set.
-
-        Parameters
-        ----------
-        elements : list[XYZ]
-            List of elements to add.
-        """
-        for ele in elements:
-            self.parent[ele] = ele
+# Type alias
+XYZ = tuple[int, int, int]
 
-    def find(self, element: XYZ) -> XYZ:
-        """Find an element in the set.
 
-        Parameters
-        ----------
-        element : XYZ
-            Element to find.
-        """
-        if self.parent[element] != element:
-            self.parent[element] = self.find(self.parent[element])
+class Solution:
+    """Advent of Code 2025 - Day 8 Part 1 and 2 solutions"""
 
-        return self.parent[element]
+    # Number of sorted pairs converted to Python ints at once in Part 2
+    BLOCK = 4096
 
-    def union(self, element1: XYZ, element2: XYZ) -> None:
-        """Unionize two elements.
+    def __init__(self, input_path: Path):
+        """Instantiate a new Solution object.
 
         Parameters
         ----------
-        element1 : XYZ
-            First element.
-        elemtn2 : XYZ
-            Second element.
+        input_path : Path
+            Path of the puzzle input file.
         """
-        root1 = self.find(element1)
-        root2 = self.find(element2)
-
-        if root1 != root2:
-            self.parent[root1] = root2
+        data = self.prepare(input_path)
+        self.input = [tuple(p) for p in data["points"].tolist()]
+        self.n = len(self.input)
+        self.dist, self.i, self.j = data["dist"], data["i"], data["j"]
 
+    @classmethod
+    @cached_parse("1")
+    def prepare(cls, input_path: str | Path) -> dict[str, np.ndarray]:
+        """Read the points and sort the distances between every pair.
 
-class Solution:
-    """Advent of Code 2025 - Day 8 Part 1 and 2 solutions"""
-
-    def __init__(self, input_path: Path):
-        """Instantiate a new Solution object.
+        This is most of the work for both parts, so the arrays are kept in
+        the parsed-input cache when it is turned on.
 
         Parameters
         ----------
-        input_path : Path
+        input_path : str | pathlib.Path
             Path of the puzzle input file.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            ``points`` of shape (n, 3), and the ``dist``, ``i`` and ``j`` of
+            every pair ``i < j`` in the order of ``sorted(get_dists())``.
         """
-        self.input = self.read_input(input_path)
-        self.n = len(self.input)
-        self.dists = sorted(self.get_dists(self.input))
+        points = read_ints(input_path, signed=False).reshape(-1, 3)
+        i, j = np.triu_indices(len(points), k=1)
+        diff = points[i] - points[j]
+        dist = np.sqrt(np.einsum("ij,ij->i", diff, diff).astype(np.float64))
+        order = np.lexsort((j, i, dist))
+
+        return {
+            "points": points,
+            "dist": dist[order],
+            "i": i[order],
+            "j": j[order]}
 
     @classmethod
     def read_input(cls, f_path: str | Path) -> list[XYZ]:
@@ -84,8 +79,8 @@ class Solution:
         list[XYZ]
         """
         return [
-            tuple(map(int, x.split(",")))
-            for x in Path(f_path).read_text(encoding="utf-8").split()]
+            tuple(xyz)
+            for xyz in read_ints(f_path, signed=False).reshape(-1, 3).tolist()]
 
     def part_1(self, n_connections: int = 1000) -> int:
         """Solution to Part 1.
@@ -105,34 +100,25 @@ class Solution:
         Since we want to group the (x, y, z) coordinates into discrete groups,
         I decided that a disjoint-set/union-find data structure would be the
         best fit here. We don't actually care whats in each set, we only care
-        about the size of the sets and if an element has been added to a set
-        or not. Because of this, our union-find data structure can be
-        implemented as a dictionary containing connecting a single element
-        to a single set-mate.
+        about the size of the sets, which the union-find keeps up to date
+        for every set as they are merged.
 
         The general workflow is as follows:
             1. Compute the distances between all points, then sort.
-            2. Iterate over the 1000 closest distances and create 2-element
-               circuits by union-ing their coordinates.
-            3. Create a dictionary to store the number of times a coordinate
-               appears in the circuits created in step 2.
-            4. Sort the count values and take the product of the 3 largest
-               counts.
+            2. Iterate over the 1000 closest distances and create circuits
+               by union-ing the points' indices.
+            3. Sort the sizes of the circuits and take the product of the 3
+               largest.
         """
-        union_find = UnionFind()
-        union_find.make_set(list(range(self.n)))
-
-        for idx in range(min(n_connections, len(self.dists))):
-            _, i, j = self.dists[idx]
-            union_find.union(i, j)
+        union_find = UnionFind(self.n)
 
-        parents = dict.fromkeys(list(range(self.n)), 0)
+        pairs = zip(self.i[:n_connections].tolist(),
+                    self.j[:n_connections].tolist())
 
-        for i in range(self.n):
-            j = union_find.find(i)
-            parents[j] += 1
+        for i, j in pairs:
+            union_find.union(i, j)
 
-        k = sorted(parents.values())
+        k = sorted(union_find.sizes())
 
         return k[-3] * k[-2] * k[-1]
 
@@ -148,22 +134,23 @@ class Solution:
         ---------
         We want to continue combining coordinates until they're all in one
         large group. Based on the framework created for Part 1, this means
-        we want to continue to union coordinates until all values of the
-        union-find parent dictionary are equal. Then, as the problem states,
-        simply return the x-coordinates of the final two connected coordinates.
+        we want to continue to union coordinates until the union-find is
+        down to a single set, which it counts as sets are merged. Then, as
+        the problem states, simply return the x-coordinates of the final two
+        connected coordinates.
         """
-        union_find = UnionFind()
-        union_find.make_set(list(range(self.n)))
+        union_find = UnionFind(self.n)
 
-        for dist in self.dists:
-            _, i, j = dist
-            union_find.union(i, j)
+        # Convert the sorted pairs a block at a time; the last connection
+        # usually comes long before the end of the ~n**2 / 2 pairs.
+        for start in range(0, len(self.i), self.BLOCK):
+            stop = start + self.BLOCK
+            pairs = zip(self.i[start:stop].tolist(),
+                        self.j[start:stop].tolist())
 
-            if all(
-                union_find.find(i) == union_find.find(0)
-                for i in range(self.n)
-            ):
-                return self.input[i][0] * self.input[j][0]
+            for i, j in pairs:
+                if union_find.union(i, j) and union_find.count == 1:
+                    return self.input[i][0] * self.input[j][0]
 
         return -1
 
@@ -205,33 +192,9 @@ def test():
     print("Both tests passed!")
 
 
-def run():
-    """Run solutions with puzzle input."""
-    solution = Solution("input.txt")
-
-    soln_1 = solution.part_1()
-    print(f"Solution to part 1: {soln_1}")
-
-    soln_2 = solution.part_2()
-    print(f"Solution to part 2: {soln_2}")
-
-
 if __name__ == "__main__":
-    import argparse
-
-    parser = argparse.ArgumentParser()
-    parser.add_argument(
-        "-r"
-        "--run-mode",
-        dest="run_mode",
-        type=str,
-        choices=["run", "test"],
-        default="run",
-    )
-
-    args = parser.parse_args()
-
-    if args.run_mode == "run":
-        run()
-    else:
-        test()
+    # --mode run|test|bench|profile. Imported here so that loading the day
+    # from the runner does not pay for the command line tooling
+    from aoc.entry import day_main
+
+    sys.exit(day_main(__file__, test=test))
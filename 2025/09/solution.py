@@ -1,10 +1,16 @@
 """Advent of Code 2025 - Day 09 Parts 1 and 2."""
 import math
+import sys
 from pathlib import Path
 from typing import Any
 
-from shapely import Polygon
-from shapely.prepared import prep
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.ints import read_ints  # noqa: E402
+from aoc.lazy import lazy_import  # noqa: E402
+
+# Only Part 2 needs shapely
+shapely = lazy_import("shapely")
+shapely_prepared = lazy_import("shapely.prepared")
 
 
 def calc_area(point1: tuple[int, int], point2: tuple[int, int]) -> int:
@@ -32,8 +38,8 @@ class Solution:
         list[tuple[int, ...]]
         """
         return [
-            tuple(map(int, x.split(",")))
-            for x in Path(f_path).read_text(encoding="utf-8").split()]
+            tuple(xy)
+            for xy in read_ints(f_path, signed=False).reshape(-1, 2).tolist()]
 
     @classmethod
     def part_1(cls, inp: list[tuple[int, int]]) -> int:
@@ -105,7 +111,7 @@ class Solution:
         max_area = 0
 
         # Prep the polygon to improve performance
-        main_polygon = prep(Polygon(inp))
+        main_polygon = shapely_prepared.prep(shapely.Polygon(inp))
 
         for i in range(n):
             for j in range(i + 1, n):
@@ -117,7 +123,7 @@ class Solution:
                     continue
 
                 # Sort vertices so no edges intersect
-                curr_poly = Polygon(
+                curr_poly = shapely.Polygon(
                     radial_sort([inp[i], inp[j], (x1, y2), (x2, y1)]))
 
                 if main_polygon.contains(curr_poly):
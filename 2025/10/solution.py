@@ -1,10 +1,14 @@
 """Advent of Code 2025 - Day 10 Parts 1 and 2."""
 import sys
-from collections import deque
 from pathlib import Path
 from typing import Any
 
-from z3 import Int, Optimize, Sum, sat
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.lazy import lazy_import  # noqa: E402
+from aoc.search import SearchStats, bfs  # noqa: E402
+
+# Only Part 2 needs the z3 solver
+z3 = lazy_import("z3")
 
 
 class Solution:
@@ -48,7 +52,7 @@ class Solution:
         return instructions
 
     @classmethod
-    def part_1(cls, inp: Any) -> int:
+    def part_1(cls, inp: Any, stats: SearchStats | None = None) -> int:
         """Solution to Part 1.
 
         Parameters
@@ -59,49 +63,43 @@ class Solution:
             - list[bool] : Starting state of the machine (all False/off).
             - list[list[int, ...]] : Button toggles.
             - list[int] : Joltages.
+        stats: SearchStats, optional
+            Collects the work done by the searches of every machine.
 
         Returns
         -------
         int
             Puzzle solution.
 
+        Raises
+        ------
+        ValueError
+            If a machine's lights can't be put in their goal state.
+
         Breakdown
         ---------
         We're using breadth-first search to explore how many button presses
-        are required to reach our desired machine state, where each "node"
-        is a tuple of the current machine state and the number of button
-        presses that yielded the machine state.
+        are required to reach our desired machine state. Each machine state
+        is a bitmask of its lights (bit i is light i), so pressing a button
+        is an XOR with the bitmask of the lights it toggles, and the depth of
+        the goal state is the number of button presses.
         """
         total = 0
 
-        for machine in inp:
-            goal_state, curr_state, buttons, _ = machine
-
-            # Store both the machine state and number of button presses (depth)
-            # in the queue.
-            q = deque(((curr_state, 0), ))
-            visited = set(str(curr_state))
-
-            while q:
-                curr_state, depth = q.popleft()
+        for n, machine in enumerate(inp, 1):
+            goal_state, _, buttons, _ = machine
 
-                if curr_state == goal_state:
-                    total += depth
-                    break
+            goal = sum(1 << i for i, on in enumerate(goal_state) if on)
+            masks = [sum(1 << light for light in button) for button in buttons]
 
-                for button in buttons:
-                    # Apply each button to get a new machine state
-                    new_state = curr_state[:]
+            result = bfs(
+                0, lambda state, masks=masks: [state ^ m for m in masks], goal,
+                stats=stats)
 
-                    for press in button:
-                        # Press the button -> toggle the indicator light
-                        new_state[press] = not new_state[press]
+            if result.cost is None:
+                raise ValueError(f"Machine {n} can't reach its goal state.")
 
-                    to_add = new_state
-
-                    if str(to_add) not in visited:
-                        visited.add(str(to_add))
-                        q.append((to_add, depth + 1))
+            total += result.cost
 
         return total
 
@@ -134,9 +132,9 @@ class Solution:
             joltages.append(curr_joltages)
 
         def solver(joltage, button):
-            opt = Optimize()
+            opt = z3.Optimize()
 
-            press_counts = [Int(f"c_{i}") for i in range(len(button))]
+            press_counts = [z3.Int(f"c_{i}") for i in range(len(button))]
 
             for count in press_counts:
                 opt.add(count >= 0)
@@ -147,12 +145,12 @@ class Solution:
                     press_counts[i]
                     for i, btn in enumerate(button) if pos in btn]
 
-                opt.add(Sum(affects) == jol)
+                opt.add(z3.Sum(affects) == jol)
 
             # Minimize total presses
-            opt.minimize(Sum(press_counts))
+            opt.minimize(z3.Sum(press_counts))
 
-            if opt.check() != sat:
+            if opt.check() != z3.sat:
                 raise ValueError("No solution found.")
 
             model = opt.model()
@@ -173,22 +171,9 @@ def test() -> None:
     print("Both tests passed!")
 
 
-def run() -> None:
-    """Run with actual puzzle input."""
-    inp = Solution.read_input("input.txt")
-
-    print(f"Solution to part 1: {Solution.part_1(inp)}")
-    print(f"Solution to part 2: {Solution.part_2(inp)}")
-
-
 if __name__ == "__main__":
-    try:
-        run_mode = sys.argv[1]
-    except IndexError:
-        run()
-        sys.exit()
-
-    if run_mode in ["-r", "--run"]:
-        run()
-    elif run_mode in ["-t", "--test"]:
-        test()
+    # --mode run|test|bench|profile. Imported here so that loading the day
+    # from the runner does not pay for the command line tooling
+    from aoc.entry import day_main
+
+    sys.exit(day_main(__file__, test=test))
@@ -1,14 +1,19 @@
 """Advent of Code 2025 - Day 11 Parts 1 and 2."""
 import re
-from functools import lru_cache
+import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.memo import memoize  # noqa: E402
 
-def dfs(start: str, end: str) -> list[list[str]]:
+
+def dfs(graph: dict, start: str, end: str) -> list[list[str]]:
     """Find all paths from `start` to `end`.
 
     Parameters
     ----------
+    graph : dict
+        Adjacency list.
     start : str
         Start node.
     end : str
@@ -37,14 +42,17 @@ def dfs(start: str, end: str) -> list[list[str]]:
     return paths
 
 
-@lru_cache(maxsize=512)
-def count_paths(curr_node: str, tgt_node: str) -> int:
+@memoize(scoped=True)
+def count_paths(graph: dict, curr_node: str, tgt_node: str) -> int:
     """Count the paths from the current node to the target node.
 
-    Recursive depth-first search with memoization.
+    Recursive depth-first search with memoization. The cache belongs to
+    `graph` and is dropped when called with another graph.
 
     Parameters
     ----------
+    graph : dict
+        Adjacency list.
     curr_node : str
         Current node.
     tgt_node : str
@@ -63,7 +71,7 @@ def count_paths(curr_node: str, tgt_node: str) -> int:
 
     total = 0
     for neighbor in graph[curr_node]:
-        total += count_paths(neighbor, tgt_node)
+        total += count_paths(graph, neighbor, tgt_node)
 
     return total
 
@@ -85,7 +93,7 @@ class Solution:
         dict
             Adjacency matrix.
         """
-        pattern = re.compile(r"(\w{3})")
+        pattern = re.compile(r"(\w+)")
 
         parts = [
             pattern.findall(x)
@@ -95,12 +103,13 @@ class Solution:
         return {x[0]: x[1:] for x in parts}
 
     @classmethod
-    def part_1(cls) -> int:
+    def part_1(cls, graph: dict) -> int:
         """Solution to Part 1.
 
         Parameters
         ----------
-        None.
+        graph : dict
+            Adjacency list.
 
         Returns
         -------
@@ -114,15 +123,16 @@ class Solution:
         The `count_paths` function from Part 2 can also be used here but I
         wanted to keep this example of iterative DFS.
         """
-        return len(dfs("you", "out"))
+        return len(dfs(graph, "you", "out"))
 
     @classmethod
-    def part_2(cls) -> int:
+    def part_2(cls, graph: dict) -> int:
         """Solution to Part 2.
 
         Parameters
         ----------
-        None.
+        graph : dict
+            Adjacency list.
 
         Returns
         -------
@@ -148,14 +158,14 @@ class Solution:
         DFS function with caching to speed things up.
         """
         path1 = (
-            count_paths("svr", "dac")
-            * count_paths("dac", "fft")
-            * count_paths("fft", "out"))
+            count_paths(graph, "svr", "dac")
+            * count_paths(graph, "dac", "fft")
+            * count_paths(graph, "fft", "out"))
 
         path2 = (
-            count_paths("svr", "fft")
-            * count_paths("fft", "dac")
-            * count_paths("dac", "out"))
+            count_paths(graph, "svr", "fft")
+            * count_paths(graph, "fft", "dac")
+            * count_paths(graph, "dac", "out"))
 
         return path1 + path2
 
@@ -163,8 +173,8 @@ class Solution:
 if __name__ == "__main__":
     graph = Solution.read_input("input.txt")
 
-    soln_1 = Solution.part_1()
+    soln_1 = Solution.part_1(graph)
     print(f"Solution to part 1: {soln_1}")
 
-    soln_2 = Solution.part_2()
+    soln_2 = Solution.part_2(graph)
     print(f"Solution to part 2: {soln_2}")
@@ -1,15 +1,39 @@
 import argparse
+import re
 from pathlib import Path
 
 
 TEMPLATE = '''"""Advent of Code 2025 - Day {day_number} Parts 1 and 2."""
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.stream import Lines  # noqa: E402
 
 
 class Solution:
     """Advent of Code 2025 - Day {day_number} Part 1 and 2 solutions."""
 
+    @classmethod
+    def iter_input(cls, f_path: str | Path) -> Iterable[str]:
+        """Stream the puzzle input a line at a time.
+
+        Parts that only need one pass over the lines can take this instead
+        of ``read_input`` and keep memory flat on large inputs.
+
+        Parameters
+        ----------
+        f_path : str | pathlib.Path
+            Path of the input file.
+
+        Returns
+        -------
+        Iterable[str]
+            The non-blank lines, read lazily on every iteration.
+        """
+        return Lines(f_path)
+
     @classmethod
     def read_input(cls, f_path: str | Path) -> Any:
         """Read puzzle input.
@@ -23,7 +47,7 @@ class Solution:
         -------
         Any
         """
-        return Path(f_path).read_text(encoding="utf-8").split()
+        return list(cls.iter_input(f_path))
 
     @classmethod
     def part_1(cls, inp: Any) -> int:
@@ -66,18 +90,64 @@ class Solution:
         return 0
 
 
+def test() -> None:
+    """Run with example puzzle input."""
+    inp = Solution.read_input("example.txt")
+
+    # TODO: expected answers from the puzzle text
+    assert Solution.part_1(inp) == 0
+    assert Solution.part_2(inp) == 0
+
+    print("Both tests passed!")
+
+
 if __name__ == "__main__":
-    input_fname = "input.txt"
-    input = Solution.read_input(input_fname)
+    # --mode run|test|bench|profile. Imported here so that loading the day
+    # from the runner does not pay for the command line tooling
+    from aoc.entry import day_main
 
-    soln_1 = Solution.part_1(input)
-    print(f"Solution to part 1: {{soln_1}}")
+    sys.exit(day_main(__file__, test=test))
+'''
 
-    soln_2 = Solution.part_2(input)
-    print(f"Solution to part 2: {{soln_2}}")
+GENERATOR_TEMPLATE = '''
 
+@generator(2025, {day})
+def day{day_number}(scale: int, rng: random.Random) -> str:
+    """TODO: describe the input format, e.g. ``L68``, ``R48``, ..."""
+    return "".join(
+        f"{{rng.randint(1, 999)}}\\n" for _ in range(1000 * scale))
 '''
 
+GENERATORS_FILE = (
+    Path(__file__).resolve().parents[1] / "aoc" / "generators" / "y2025.py")
+
+
+def add_generator(day_num: str, f_path: Path = GENERATORS_FILE) -> bool:
+    """Append a synthetic input generator stub for a day, if it has none.
+
+    Parameters
+    ----------
+    day_num : str
+        Zero padded day number.
+    f_path : pathlib.Path, optional
+        Generators module of the year.
+
+    Returns
+    -------
+    bool
+        True if a stub was added.
+    """
+    source = f_path.read_text(encoding="utf-8")
+
+    if re.search(rf"@generator\(2025, {int(day_num)}\)", source):
+        return False
+
+    with open(f_path, "a", encoding="utf-8") as f:
+        f.write(GENERATOR_TEMPLATE.format(
+            day=int(day_num), day_number=day_num))
+
+    return True
+
 
 def parse_args() -> argparse.Namespace:
     """Parse and return command line arguments."""
@@ -107,3 +177,8 @@ if __name__ == "__main__":
 
     with open(f_path, "w", encoding="utf-8") as f:
         f.write(TEMPLATE.format(day_number=day_num))
+
+    # The runner and bench find the new day on their own; give
+    # ``python -m aoc generate`` something to scale up too
+    if add_generator(day_num):
+        print(f"Added a generator stub to {GENERATORS_FILE}")
@@ -0,0 +1,11 @@
+"""Shared tooling for running and measuring the Advent of Code solutions.
+
+Run ``python -m aoc --help`` from the repository root for the available
+commands.
+
+Solution files are run as scripts from their own directory, so they import
+the shared modules by putting the repository root on ``sys.path`` first::
+
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+    from aoc.grid import Grid  # noqa: E402
+"""
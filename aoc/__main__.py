@@ -0,0 +1,51 @@
+"""Command line interface: ``python -m aoc <command> [options]``."""
+import argparse
+import sys
+
+from aoc import (
+    batch, bench, differential, generators, importtime, inputs, memory,
+    runner)
+
+
+COMMANDS = {
+    "run": (runner, runner.run, "Run and time every day."),
+    "bench": (
+        bench, bench.bench, "Benchmark every day against a stored baseline."),
+    "batch": (
+        batch, batch.batch,
+        "Run every day across worker processes with time and memory "
+        "limits."),
+    "inputs": (
+        inputs, inputs.inputs,
+        "Run a day on a directory of inputs, loading it only once."),
+    "memory": (
+        memory, memory.memory,
+        "Measure the peak memory of every day against a budget."),
+    "imports": (
+        importtime, importtime.imports,
+        "Measure how long each day's modules take to import."),
+    "diff": (
+        differential, differential.diff,
+        "Check optimized implementations against reference ones on "
+        "generated inputs."),
+    "generate": (
+        generators, generators.generate_cmd,
+        "Write synthetic inputs at a larger scale."),
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line and dispatch to a command."""
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for name, (module, _, help_str) in COMMANDS.items():
+        module.add_arguments(subparsers.add_parser(name, help=help_str))
+
+    args = parser.parse_args(argv)
+
+    return COMMANDS[args.command][1](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
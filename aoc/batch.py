@@ -0,0 +1,269 @@
+"""Run the whole calendar across a pool of worker processes.
+
+Each task (a day, or with ``--split-parts`` a single part of a day) runs in a
+fresh worker process through ``runner.run_day``, so it gets the same
+treatment as a serial run: the working directory and ``sys.path`` of its day
+directory (for ``from p1 import ...`` and relative ``input.txt`` paths), a
+copy of the parsed input per part, and the result cache.
+
+Every task can be given limits:
+
+* a time limit, enforced with ``SIGALRM`` inside the worker. Python code is
+  interrupted at once; a long call into C (a NumPy or solver call) is only
+  interrupted when it returns.
+* a memory limit on the worker's address space (``RLIMIT_AS``). An
+  allocation over the limit raises ``MemoryError`` in the phase that made it.
+
+A worker that dies (crash, killed by the OS) only fails its own task.
+
+Usage
+-----
+python -m aoc batch -j 8 -t 60 -m 4096
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from aoc import runner
+from aoc.cache import enable_parse_cache, result_cache
+from aoc.discover import Day, find_days
+from aoc.profiling import enable_profiling
+from aoc.runner import PhaseResult
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class TimeLimitExceeded(BaseException):
+    """Raised in a worker when its task runs past the time limit.
+
+    Derived from BaseException so that the runner, which records and moves
+    past ordinary exceptions, does not swallow it.
+    """
+
+
+@dataclass(frozen=True)
+class Task:
+    """One unit of work for a worker.
+
+    Attributes
+    ----------
+    day : Day
+        Day to run.
+    parts : tuple[int, ...]
+        Parts to run. The input is parsed once per task.
+    """
+    day: Day
+    parts: tuple[int, ...]
+
+
+def make_tasks(
+    days: list[Day],
+    parts: tuple[int, ...] = (1, 2),
+    split_parts: bool = False,
+) -> list[Task]:
+    """Split days into tasks, one per day or one per part of a day."""
+    if not split_parts:
+        return [Task(day, parts) for day in days]
+
+    tasks = []
+    for day in days:
+        wanted = [n for n in parts if n in day.parts]
+        # Days without any of the parts still get a task, to report on them
+        tasks.extend(Task(day, (n,)) for n in wanted)
+        if not wanted:
+            tasks.append(Task(day, ()))
+
+    return tasks
+
+
+def pool_context() -> multiprocessing.context.BaseContext:
+    """Return the cheapest start method that gives every task a clean process.
+
+    A fork server with the tooling preloaded starts workers in a few
+    milliseconds; spawning a new interpreter (the fallback) re-imports
+    everything for every task.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["aoc.runner", "numpy"])
+
+    return ctx
+
+
+def _set_memory_limit(memory_mb: int | None) -> None:
+    """Worker initializer: cap the address space of the process."""
+    if memory_mb and resource is not None:
+        limit = memory_mb * 1024 ** 2
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _on_alarm(signum, frame):
+    raise TimeLimitExceeded()
+
+
+def run_task(
+    task: Task,
+    input_name: str = "input.txt",
+    time_limit: float | None = None,
+    use_cache: bool = True,
+) -> list[PhaseResult]:
+    """Run a task in the current process, within a time limit.
+
+    Parameters
+    ----------
+    task : Task
+        Task to run.
+    input_name : str, optional
+        Input file name or path. Default is 'input.txt'.
+    time_limit : float, optional
+        Seconds the task may take. Default is None: no limit.
+    use_cache : bool, optional
+        Serve and store results through the result cache. Default is True.
+
+    Returns
+    -------
+    list[PhaseResult]
+        Results of the phases, or a single ``timeout`` result.
+    """
+    cache = result_cache if use_cache else None
+    use_alarm = bool(time_limit) and hasattr(signal, "setitimer")
+
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, time_limit)
+
+    start = time.perf_counter()
+
+    try:
+        return runner.run_day(task.day, input_name, task.parts, cache)
+    except TimeLimitExceeded:
+        return [PhaseResult(
+            task.day.name, "timeout", wall=time.perf_counter() - start,
+            error=f"time limit of {time_limit:g}s exceeded")]
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def run_batch(
+    tasks: list[Task],
+    input_name: str = "input.txt",
+    jobs: int | None = None,
+    time_limit: float | None = None,
+    memory_mb: int | None = None,
+    use_cache: bool = True,
+) -> list[PhaseResult]:
+    """Run tasks across a process pool.
+
+    Every task gets a fresh worker process, so state a solution leaves behind
+    (module globals, caches, memory) never leaks into the next task.
+
+    Parameters
+    ----------
+    tasks : list[Task]
+        Tasks to run.
+    input_name : str, optional
+        Input file name or path. Default is 'input.txt'.
+    jobs : int, optional
+        Number of worker processes. Default is the number of CPUs.
+    time_limit : float, optional
+        Seconds each task may take. Default is None: no limit.
+    memory_mb : int, optional
+        Address space limit of each worker in MiB. Default is None: no limit.
+    use_cache : bool, optional
+        Serve and store results through the result cache. Default is True.
+
+    Returns
+    -------
+    list[PhaseResult]
+        Results in the order of ``tasks``. A part of a day split over several
+        tasks reports its parse phase only once.
+    """
+    by_task: dict[int, list[PhaseResult]] = {}
+
+    with ProcessPoolExecutor(
+        max_workers=jobs or os.cpu_count(),
+        initializer=_set_memory_limit,
+        initargs=(memory_mb,),
+        mp_context=pool_context(),
+        max_tasks_per_child=1,
+    ) as pool:
+        futures = {
+            pool.submit(run_task, task, input_name, time_limit, use_cache): i
+            for i, task in enumerate(tasks)}
+
+        for future in as_completed(futures):
+            i = futures[future]
+
+            try:
+                by_task[i] = future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                by_task[i] = [PhaseResult(
+                    tasks[i].day.name, "worker",
+                    error=f"{type(exc).__name__}: {exc}")]
+
+    results = []
+    parsed = set()
+
+    for i, task in enumerate(tasks):
+        for res in by_task[i]:
+            if res.phase == "parse":
+                if res.day in parsed:
+                    continue
+                parsed.add(res.day)
+            results.append(res)
+
+    return results
+
+
+def batch(args) -> int:
+    """Entry point for ``python -m aoc batch``."""
+    if args.parse_cache:
+        enable_parse_cache()
+
+    if args.profile:
+        enable_profiling(args.profile)
+
+    tasks = make_tasks(
+        find_days(args.year, args.day), tuple(args.part or (1, 2)),
+        args.split_parts)
+
+    start = time.perf_counter()
+    results = run_batch(
+        tasks, args.input, args.jobs, args.time_limit, args.memory_limit,
+        not (args.no_cache or args.profile))
+    elapsed = time.perf_counter() - start
+
+    print(runner.format_table(results))
+    print(f"batch: {len(tasks)} task(s) in {elapsed:.2f}s wall")
+
+    return 0 if all(r.ok for r in results) else 1
+
+
+def add_arguments(parser) -> None:
+    """Add the ``batch`` command line arguments to a parser."""
+    runner.add_arguments(parser)
+    parser.add_argument(
+        "-j", "--jobs", type=int,
+        help="Number of worker processes. Default is the number of CPUs.")
+    parser.add_argument(
+        "-t", "--time-limit", type=float,
+        help="Seconds each task may run. Default is no limit.")
+    parser.add_argument(
+        "-m", "--memory-limit", type=int,
+        help="Address space limit of each worker in MiB. "
+             "Default is no limit.")
+    parser.add_argument(
+        "--split-parts", action="store_true",
+        help="Run each part of a day as its own task. The input is parsed "
+             "by every task.")
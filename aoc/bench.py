@@ -0,0 +1,453 @@
+"""Benchmark suite with stored baselines and regression detection.
+
+Each phase of a day (parse, part 1, part 2) is run several times and the
+median and 95th percentile wall-clock times are recorded. Results can be saved
+as a JSON baseline and later runs compared against it: any phase whose median
+got more than ``threshold`` percent slower is reported as a regression.
+
+Timings that are too small to measure reliably are ignored when comparing;
+see ``min_delta``.
+
+Shared modules of the ``aoc`` package are benchmarked the same way through
+*workloads* (``--lib``): a registered function builds the data outside the
+timed region and returns the operations to time. Their results are stored in
+the same baseline under ``aoc/<name>``. The workloads of ``aoc.workloads`` are
+registered when the command line is set up.
+"""
+from __future__ import annotations
+
+import copy
+import importlib
+import json
+import math
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc.cache import enable_parse_cache
+from aoc.discover import STATE_DIR, Day, find_days
+from aoc.runner import timed
+
+
+DEFAULT_BASELINE = STATE_DIR / "baseline.json"
+
+# Builds a workload's data and returns its operations by phase name
+Workload = Callable[[], dict[str, Callable[[], Any]]]
+
+WORKLOADS: dict[str, Workload] = {}
+
+
+@dataclass
+class PhaseStats:
+    """Summary of the timings of a phase.
+
+    Attributes
+    ----------
+    median : float
+        Median wall-clock seconds.
+    p95 : float
+        95th percentile wall-clock seconds.
+    best : float
+        Fastest run in seconds.
+    runs : int
+        Number of timed runs.
+    """
+    median: float
+    p95: float
+    best: float
+    runs: int
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> PhaseStats:
+        """Summarize a list of wall-clock samples."""
+        return cls(
+            median=statistics.median(samples),
+            p95=percentile(samples, 95),
+            best=min(samples),
+            runs=len(samples),
+        )
+
+
+@dataclass
+class DayBench:
+    """Benchmark results of a day.
+
+    Attributes
+    ----------
+    day : str
+        Day name, ``YYYY/DD``.
+    phases : dict[str, PhaseStats]
+        Phase name to timing summary.
+    errors : dict[str, str]
+        Phase name to the error that stopped it.
+    """
+    day: str
+    phases: dict[str, PhaseStats] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class Regression:
+    """A phase that got slower than its baseline."""
+    day: str
+    phase: str
+    baseline: float
+    current: float
+
+    @property
+    def slowdown(self) -> float:
+        """Return the slowdown in percent."""
+        return (self.current - self.baseline) / self.baseline * 100
+
+    def __str__(self) -> str:
+        return (
+            f"{self.day} {self.phase}: {self.baseline:.4f}s -> "
+            f"{self.current:.4f}s (+{self.slowdown:.1f}%)")
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return a percentile of the samples, interpolating between ranks.
+
+    Parameters
+    ----------
+    samples : list[float]
+        Values to summarize. Must not be empty.
+    pct : float
+        Percentile, 0 to 100.
+
+    Returns
+    -------
+    float
+    """
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def bench_day(
+    day: Day,
+    input_name: str = "input.txt",
+    repeats: int = 5,
+    warmup: int = 1,
+) -> DayBench | None:
+    """Time every phase of a day over several runs.
+
+    Parts are given a fresh copy of the parsed input on every run. The copy is
+    made outside of the timed region.
+
+    Parameters
+    ----------
+    day : Day
+        Day to benchmark.
+    input_name : str, optional
+        Input file name or path. Default is 'input.txt'.
+    repeats : int, optional
+        Number of timed runs per phase. Default is 5.
+    warmup : int, optional
+        Number of untimed runs before the timed ones. Default is 1.
+
+    Returns
+    -------
+    DayBench or None
+        None if the day has no input file.
+    """
+    path = day.input_path(input_name)
+
+    if not path.is_file():
+        return None
+
+    result = DayBench(day.name)
+
+    with day.context():
+        try:
+            phases = day.load()
+        except Exception as exc:  # pylint: disable=broad-except
+            result.errors["import"] = repr(exc)
+            return result
+
+        def sample(name, func, *args):
+            walls = []
+            try:
+                for i in range(warmup + repeats):
+                    call_args = copy.deepcopy(args)
+                    value, wall, _, _ = timed(func, *call_args)
+                    if i >= warmup:
+                        walls.append(wall)
+            except Exception as exc:  # pylint: disable=broad-except
+                result.errors[name] = repr(exc)
+                return None
+
+            result.phases[name] = PhaseStats.from_samples(walls)
+            return value
+
+        inp = sample("parse", phases.parse, path)
+
+        if "parse" not in result.phases:
+            return result
+
+        for n, part in phases.parts.items():
+            sample(f"part_{n}", part, inp, path)
+
+    return result
+
+
+def workload(name: str) -> Callable[[Workload], Workload]:
+    """Register a benchmark of a shared module under ``aoc/<name>``."""
+    def register(func: Workload) -> Workload:
+        WORKLOADS[name] = func
+        return func
+
+    return register
+
+
+def bench_workload(
+    name: str,
+    repeats: int = 5,
+    warmup: int = 1,
+) -> DayBench:
+    """Time every operation of a registered workload over several runs.
+
+    The workload's data is built once, before any timing. Operations must
+    not modify it.
+
+    Parameters
+    ----------
+    name : str
+        Workload name.
+    repeats : int, optional
+        Number of timed runs per operation. Default is 5.
+    warmup : int, optional
+        Number of untimed runs before the timed ones. Default is 1.
+
+    Returns
+    -------
+    DayBench
+    """
+    result = DayBench(f"aoc/{name}")
+
+    for phase, func in WORKLOADS[name]().items():
+        walls = []
+
+        try:
+            for i in range(warmup + repeats):
+                _, wall, _, _ = timed(func)
+                if i >= warmup:
+                    walls.append(wall)
+        except Exception as exc:  # pylint: disable=broad-except
+            result.errors[phase] = repr(exc)
+            continue
+
+        result.phases[phase] = PhaseStats.from_samples(walls)
+
+    return result
+
+
+def compare(
+    baseline: dict[str, dict[str, PhaseStats]],
+    current: list[DayBench],
+    threshold: float = 10.0,
+    min_delta: float = 0.001,
+) -> list[Regression]:
+    """Find phases that got slower than the baseline.
+
+    Parameters
+    ----------
+    baseline : dict[str, dict[str, PhaseStats]]
+        Day name to phase name to baseline stats.
+    current : list[DayBench]
+        Fresh benchmark results.
+    threshold : float, optional
+        Allowed slowdown of the median in percent. Default is 10.
+    min_delta : float, optional
+        Slowdowns smaller than this many seconds are treated as noise.
+        Default is 0.001.
+
+    Returns
+    -------
+    list[Regression]
+    """
+    regressions = []
+
+    for bench in current:
+        for phase, stats in bench.phases.items():
+            base = baseline.get(bench.day, {}).get(phase)
+
+            if base is None or base.median <= 0:
+                continue
+
+            reg = Regression(bench.day, phase, base.median, stats.median)
+
+            if (
+                reg.slowdown > threshold
+                and reg.current - reg.baseline >= min_delta
+            ):
+                regressions.append(reg)
+
+    return regressions
+
+
+def load_baseline(f_path: str | Path) -> dict[str, dict[str, PhaseStats]]:
+    """Read a baseline file written by ``save_baseline``."""
+    raw = json.loads(Path(f_path).read_text(encoding="utf-8"))
+
+    return {
+        day: {phase: PhaseStats(**stats) for phase, stats in phases.items()}
+        for day, phases in raw["days"].items()}
+
+
+def save_baseline(
+    f_path: str | Path,
+    results: list[DayBench],
+    merge: bool = True,
+) -> None:
+    """Write benchmark results to a baseline file.
+
+    Parameters
+    ----------
+    f_path : str | pathlib.Path
+        Baseline file.
+    results : list[DayBench]
+        Results to store.
+    merge : bool, optional
+        Keep the entries of days that were not benchmarked this time.
+        Default is True.
+    """
+    f_path = Path(f_path)
+    days = {}
+
+    if merge and f_path.is_file():
+        days = json.loads(f_path.read_text(encoding="utf-8"))["days"]
+
+    for bench in results:
+        days[bench.day] = {
+            phase: asdict(stats) for phase, stats in bench.phases.items()}
+
+    f_path.parent.mkdir(parents=True, exist_ok=True)
+    f_path.write_text(
+        json.dumps({
+            "meta": {
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+            },
+            "days": dict(sorted(days.items())),
+        }, indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+
+def format_results(results: list[DayBench]) -> str:
+    """Format benchmark results as a plain text table."""
+    day_w = max([8] + [len(bench.day) for bench in results])
+    phase_w = max([7] + [len(p) for b in results for p in b.phases])
+    lines = [
+        f"{'day':<{day_w}} {'phase':<{phase_w}} {'median (s)':>11} "
+        f"{'p95 (s)':>11} {'runs':>5}"]
+
+    for bench in results:
+        for phase, stats in bench.phases.items():
+            lines.append(
+                f"{bench.day:<{day_w}} {phase:<{phase_w}} "
+                f"{stats.median:>11.5f} {stats.p95:>11.5f} {stats.runs:>5}")
+
+        for phase, error in bench.errors.items():
+            lines.append(
+                f"{bench.day:<{day_w}} {phase:<{phase_w}} ERROR {error}")
+
+    return "\n".join(lines)
+
+
+def bench(args) -> int:
+    """Entry point for ``python -m aoc bench``."""
+    if args.parse_cache:
+        enable_parse_cache()
+
+    results = []
+    names = sorted(WORKLOADS) if "all" in (args.lib or []) else args.lib
+
+    # --lib alone benchmarks only the workloads
+    if not args.lib or args.year or args.day:
+        for day in find_days(args.year, args.day):
+            res = bench_day(day, args.input, args.repeats, args.warmup)
+            if res is not None:
+                results.append(res)
+
+    for name in names or []:
+        results.append(bench_workload(name, args.repeats, args.warmup))
+
+    print(format_results(results))
+
+    status = 0
+    baseline_path = Path(args.baseline)
+
+    if baseline_path.is_file() and not args.save:
+        regressions = compare(
+            load_baseline(baseline_path), results, args.threshold,
+            args.min_delta)
+
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over "
+                  f"{args.threshold:g}%:")
+            for reg in regressions:
+                print(f"  {reg}")
+            status = 1
+        else:
+            print(f"\nNo regressions over {args.threshold:g}%.")
+
+    if args.save:
+        save_baseline(baseline_path, results)
+        print(f"\nBaseline written to {baseline_path}")
+
+    return status
+
+
+def add_arguments(parser) -> None:
+    """Add the ``bench`` command line arguments to a parser."""
+    # aoc.workloads imports this module, so it is only loaded here, in
+    # time to list its workloads as --lib choices
+    importlib.import_module("aoc.workloads")
+
+    parser.add_argument(
+        "-y", "--year", type=int, action="append",
+        help="Only benchmark this year. May be repeated.")
+    parser.add_argument(
+        "-d", "--day", type=int, action="append",
+        help="Only benchmark this day of the month. May be repeated.")
+    parser.add_argument(
+        "-i", "--input", default="input.txt",
+        help="Input file name, relative to each day directory. "
+             "Default is 'input.txt'.")
+    parser.add_argument(
+        "-l", "--lib", action="append",
+        choices=sorted(WORKLOADS) + ["all"],
+        help="Benchmark this shared module workload, or 'all'. May be "
+             "repeated. Without -y/-d, no days are benchmarked.")
+    parser.add_argument(
+        "--parse-cache", action="store_true",
+        help="Load parsed inputs from the on-disk cache where a day "
+             "supports it. Same as setting AOC_PARSE_CACHE=1.")
+    parser.add_argument(
+        "-n", "--repeats", type=int, default=5,
+        help="Timed runs per phase. Default is 5.")
+    parser.add_argument(
+        "-w", "--warmup", type=int, default=1,
+        help="Untimed runs per phase before timing. Default is 1.")
+    parser.add_argument(
+        "-b", "--baseline", default=str(DEFAULT_BASELINE),
+        help=f"Baseline file. Default is {DEFAULT_BASELINE}.")
+    parser.add_argument(
+        "-s", "--save", action="store_true",
+        help="Save the results as the new baseline instead of comparing.")
+    parser.add_argument(
+        "-t", "--threshold", type=float, default=10.0,
+        help="Allowed slowdown in percent. Default is 10.")
+    parser.add_argument(
+        "--min-delta", type=float, default=0.001,
+        help="Ignore slowdowns smaller than this many seconds. "
+             "Default is 0.001.")
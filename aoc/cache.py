@@ -0,0 +1,383 @@
+"""On-disk caches keyed by content hashes.
+
+Parsed-input cache
+------------------
+``cached_parse`` wraps a parser (or any function that precomputes something
+from the input file) so its result is stored under ``.aoc/cache/parsed`` and
+loaded on the next call with the same input. The key is a hash of:
+
+* the input file's content (not its name or modification time),
+* the parser's source file and qualified name,
+* a version tag the solution bumps whenever the parser's output changes,
+* any other arguments of the call.
+
+NumPy arrays, and dicts of them, are stored as ``.npz``; anything else is
+pickled. The cache is bounded in size: once it grows past ``max_bytes`` the
+least recently used entries are deleted.
+
+The cache is opt-in. Set ``AOC_PARSE_CACHE=1`` in the environment, or pass
+``--parse-cache`` to ``python -m aoc run`` / ``bench``. Otherwise a decorated
+parser runs as if it was not decorated.
+
+Result cache
+------------
+``python -m aoc run`` keeps the answers and timings of every day it ran
+successfully under ``.aoc/cache/results``, keyed by ``result_key``: a hash of
+the day's source files, the ``aoc`` modules they import, and the input file's
+content. A day whose code and input have not changed is served from there.
+
+Usage
+-----
+from aoc.cache import cached_parse
+
+@cached_parse("1")
+def parse_input(fname: str = 'input.txt') -> list[int]:
+    ...
+"""
+from __future__ import annotations
+
+import ast
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from aoc.discover import PATH_PARAMS, ROOT, STATE_DIR, Day
+from aoc.lazy import lazy_import
+
+# Days that never touch NumPy should not pay for importing it here
+np = lazy_import("numpy")
+
+
+CACHE_DIR = STATE_DIR / "cache"
+
+# Set to a non-empty value other than "0" to turn the parsed-input cache on
+PARSE_CACHE_ENV = "AOC_PARSE_CACHE"
+
+DEFAULT_MAX_BYTES = 256 * 1024 ** 2
+
+_CHUNK = 1024 ** 2
+
+
+def content_hash(f_path: str | Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+
+    with open(f_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def make_key(*parts: Any) -> str:
+    """Hash the string forms of ``parts`` into a cache key."""
+    return hashlib.sha256(
+        "\0".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+
+def _is_arrays(value: Any) -> bool:
+    """Return True if a value can be stored as ``.npz``."""
+    if "numpy" not in sys.modules:
+        return False
+
+    if isinstance(value, np.ndarray):
+        return value.dtype != object
+
+    return (
+        isinstance(value, dict) and bool(value)
+        and all(
+            isinstance(k, str) and isinstance(v, np.ndarray)
+            and v.dtype != object
+            for k, v in value.items()))
+
+
+class DiskCache:
+    """A directory of cached values with size-bounded LRU eviction.
+
+    Each entry is one file named after its key. Reading an entry refreshes
+    its modification time, which is what eviction orders by.
+
+    Parameters
+    ----------
+    directory : str | pathlib.Path
+        Cache directory. Created on the first write.
+    max_bytes : int, optional
+        Size the cache is trimmed down to after every write. Default is
+        256 MiB.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def _entries(self) -> list[Path]:
+        """Return the entry files, oldest use first."""
+        if not self.directory.is_dir():
+            return []
+
+        files = [
+            f for f in self.directory.iterdir()
+            if f.suffix in (".pkl", ".npz")]
+
+        return sorted(files, key=lambda f: f.stat().st_mtime_ns)
+
+    def _find(self, key: str) -> Path | None:
+        """Return the file of an entry, None if there is none."""
+        for suffix in (".pkl", ".npz"):
+            f_path = self.directory / f"{key}{suffix}"
+            if f_path.is_file():
+                return f_path
+
+        return None
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Look up an entry.
+
+        Returns
+        -------
+        tuple[bool, Any]
+            ``(True, value)`` on a hit, ``(False, None)`` on a miss. Entries
+            that cannot be read are deleted and count as misses.
+        """
+        f_path = self._find(key)
+
+        if f_path is None:
+            return False, None
+
+        try:
+            if f_path.suffix == ".npz":
+                with np.load(f_path, allow_pickle=False) as data:
+                    value = (
+                        data["arr_0"] if list(data.keys()) == ["arr_0"]
+                        else {k: data[k] for k in data.keys()})
+            else:
+                with open(f_path, "rb") as f:
+                    value = pickle.load(f)
+        except Exception:  # pylint: disable=broad-except
+            f_path.unlink(missing_ok=True)
+            return False, None
+
+        os.utime(f_path)
+
+        return True, value
+
+    def put(self, key: str, value: Any) -> Path:
+        """Store an entry, then evict old entries if over the size limit.
+
+        Returns
+        -------
+        pathlib.Path
+            File the entry was written to.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        suffix = ".npz" if _is_arrays(value) else ".pkl"
+        f_path = self.directory / f"{key}{suffix}"
+
+        # Write to a temporary file first so readers never see half an entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if suffix == ".npz" and isinstance(value, dict):
+                    np.savez(f, **value)
+                elif suffix == ".npz":
+                    np.savez(f, value)
+                else:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        os.replace(tmp, f_path)
+
+        self.evict()
+
+        return f_path
+
+    def evict(self) -> list[Path]:
+        """Delete least recently used entries until under ``max_bytes``.
+
+        Returns
+        -------
+        list[pathlib.Path]
+            Deleted files.
+        """
+        entries = self._entries()
+        total = sum(f.stat().st_size for f in entries)
+        removed = []
+
+        for f_path in entries:
+            if total <= self.max_bytes:
+                break
+
+            total -= f_path.stat().st_size
+            f_path.unlink(missing_ok=True)
+            removed.append(f_path)
+
+        return removed
+
+    def size(self) -> int:
+        """Return the total size of the entries in bytes."""
+        return sum(f.stat().st_size for f in self._entries())
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for f_path in self._entries():
+            f_path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+
+parse_cache = DiskCache(CACHE_DIR / "parsed")
+
+
+def parse_cache_enabled() -> bool:
+    """Return True if the parsed-input cache is turned on."""
+    return os.environ.get(PARSE_CACHE_ENV, "") not in ("", "0")
+
+
+def enable_parse_cache() -> None:
+    """Turn the parsed-input cache on for this process and its children."""
+    os.environ[PARSE_CACHE_ENV] = "1"
+
+
+def _source_name(func: Callable) -> str:
+    """Return a stable name of a function: its file and qualified name.
+
+    The module name is not used, since a day's module is ``__main__`` when it
+    is run directly and ``p1`` or ``solution`` under the runner.
+    """
+    f_path = Path(inspect.getfile(func)).resolve()
+
+    try:
+        f_path = f_path.relative_to(ROOT)
+    except ValueError:
+        pass
+
+    return f"{f_path.as_posix()}:{func.__qualname__}"
+
+
+def cached_parse(
+    version: str,
+    cache: DiskCache | None = None,
+) -> Callable[[Callable], Callable]:
+    """Cache the result of a parser, keyed by the content of its input file.
+
+    The input file is the first argument named like a path (``f_path``,
+    ``fname``, ...), or else the first argument that is not ``self`` or
+    ``cls``. Defaults are applied, so ``parse_input()`` with a default
+    ``'input.txt'`` is cached too.
+
+    Parameters
+    ----------
+    version : str
+        Version tag of the parser. Change it whenever the parser's output
+        changes, so old entries are not served.
+    cache : DiskCache, optional
+        Cache to use. Default is the shared parsed-input cache.
+
+    Returns
+    -------
+    Callable
+        Decorator.
+    """
+    def decorator(func: Callable) -> Callable:
+        sig = inspect.signature(func)
+        params = [
+            p for p in sig.parameters if p not in ("self", "cls")]
+        path_param = next(
+            (p for p in params if p in PATH_PARAMS), params[0])
+        name = _source_name(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not parse_cache_enabled():
+                return func(*args, **kwargs)
+
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            f_path = bound.arguments[path_param]
+            others = sorted(
+                (k, repr(v)) for k, v in bound.arguments.items()
+                if k not in (path_param, "self", "cls"))
+
+            key = make_key(name, version, content_hash(f_path), others)
+            store = parse_cache if cache is None else cache
+            hit, value = store.get(key)
+
+            if not hit:
+                value = func(*args, **kwargs)
+                store.put(key, value)
+
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+result_cache = DiskCache(CACHE_DIR / "results")
+
+
+def _tooling_imports(f_path: Path) -> set[Path]:
+    """Return the ``aoc`` source files a file imports directly."""
+    tree = ast.parse(f_path.read_bytes(), filename=str(f_path))
+    names = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+            names.update(f"{node.module}.{a.name}" for a in node.names)
+        elif isinstance(node, ast.Import):
+            names.update(a.name for a in node.names)
+
+    found = set()
+    for name in names:
+        if name != "aoc" and not name.startswith("aoc."):
+            continue
+
+        base = ROOT.joinpath(*name.split("."))
+        for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+            if candidate.is_file():
+                found.add(candidate)
+
+    return found
+
+
+def source_hash(sources: Iterable[str | Path]) -> str:
+    """Hash source files together with the ``aoc`` modules they import.
+
+    Shared tooling is followed transitively, so editing ``aoc/grid.py``
+    changes the hash of every day built on it. Sibling modules of a day (a
+    ``p2.py`` importing ``p1.py``) are expected to be in ``sources``.
+    """
+    todo = [Path(f).resolve() for f in sources]
+    seen = set(todo)
+
+    while todo:
+        for dep in _tooling_imports(todo.pop()):
+            if dep not in seen:
+                seen.add(dep)
+                todo.append(dep)
+
+    digest = hashlib.sha256()
+    for f_path in sorted(seen):
+        digest.update(f_path.name.encode("utf-8") + b"\0")
+        digest.update(f_path.read_bytes())
+
+    return digest.hexdigest()
+
+
+def result_key(day: Day, input_path: str | Path) -> str:
+    """Return the result cache key of a day run on an input file."""
+    return make_key(
+        day.name, source_hash(day.sources), content_hash(input_path))
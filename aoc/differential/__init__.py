@@ -0,0 +1,378 @@
+"""Check optimized implementations against reference ones on random inputs.
+
+Several days keep a slow, obviously correct implementation of a part next to
+a faster one. Each is registered here as a *variant* of the part: exactly one
+``reference`` and any number of optimized variants, each a function of the
+input file. The harness generates randomized inputs with ``aoc.generators``
+(several seeds), runs every variant on every input from inside the day
+directory, fails if any variant disagrees with the reference, and reports
+the speedup of each variant over the reference.
+
+Generated inputs only have meaningless answers, but they are the same
+meaningless answers for every correct implementation, which is all a
+differential test needs.
+
+Usage
+-----
+python -m aoc diff -y 2024 -d 10            # 3 generated inputs
+python -m aoc diff -n 20 -s 4 --seed 100    # 20 inputs, 4 times as large
+python -m aoc diff -y 2025 -d 1 -i example.txt
+"""
+from __future__ import annotations
+
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc.discover import Day, find_days
+from aoc.generators import GENERATORS, generate
+from aoc.runner import PhaseResult, run_phase
+
+
+Implementation = Callable[[Path], Any]
+
+
+@dataclass(frozen=True)
+class Variant:
+    """One implementation of a part.
+
+    Attributes
+    ----------
+    name : str
+        Name in reports.
+    func : Implementation
+        Takes the input file and returns (or prints) the answer. Called
+        from inside the day directory, so it can import the day's modules.
+    reference : bool
+        True for the implementation the others are checked against.
+    """
+    name: str
+    func: Implementation
+    reference: bool = False
+
+
+VARIANTS: dict[tuple[int, int, int], list[Variant]] = {}
+
+
+def variant(
+    year: int,
+    day: int,
+    part: int,
+    reference: bool = False,
+    name: str | None = None,
+) -> Callable[[Implementation], Implementation]:
+    """Register an implementation of a part.
+
+    Parameters
+    ----------
+    year : int
+        Calendar year.
+    day : int
+        Day of the month.
+    part : int
+        Part number.
+    reference : bool, optional
+        Check the other variants against this one. Default is False.
+    name : str, optional
+        Name in reports, e.g. where the implementation lives. Default is
+        the function's name.
+
+    Raises
+    ------
+    ValueError
+        A second reference is registered for the same part.
+    """
+    def register(func: Implementation) -> Implementation:
+        variants = VARIANTS.setdefault((year, day, part), [])
+
+        if reference and any(v.reference for v in variants):
+            raise ValueError(
+                f"{year}/{day:02d} part {part} already has a reference")
+
+        variants.append(Variant(name or func.__name__, func, reference))
+        return func
+
+    return register
+
+
+@dataclass
+class Comparison:
+    """Every variant of a part on one input.
+
+    Attributes
+    ----------
+    input : str
+        Input file name.
+    results : dict[str, PhaseResult]
+        Result of each variant, by variant name. The phase is the name.
+    reference : str
+        Name of the reference variant.
+    """
+    input: str
+    results: dict[str, PhaseResult]
+    reference: str
+
+    @property
+    def mismatches(self) -> list[str]:
+        """Return the variants that failed or disagree with the reference."""
+        expected = self.results[self.reference]
+
+        return [
+            name for name, res in self.results.items()
+            if not res.ok or (name != self.reference
+                              and res.answer != expected.answer)]
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every variant ran and gave the same answer."""
+        return not self.mismatches
+
+
+@dataclass
+class DiffRun:
+    """All inputs of one part.
+
+    Attributes
+    ----------
+    day : str
+        Day name, ``YYYY/DD``.
+    part : int
+        Part number.
+    variants : list[Variant]
+        Variants compared, the reference first.
+    comparisons : list[Comparison]
+        One comparison per input.
+    """
+    day: str
+    part: int
+    variants: list[Variant]
+    comparisons: list[Comparison] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every variant agreed on every input."""
+        return all(comp.ok for comp in self.comparisons)
+
+    def total(self, name: str) -> float:
+        """Return the wall-clock seconds of a variant over all inputs."""
+        return sum(comp.results[name].wall for comp in self.comparisons)
+
+    def speedup(self, name: str) -> float:
+        """Return how many times faster than the reference a variant is."""
+        wall = self.total(name)
+        return self.total(self.variants[0].name) / wall if wall else 0.0
+
+
+def variants_of(year: int, day: int, part: int) -> list[Variant]:
+    """Return the variants of a part, the reference first.
+
+    Raises
+    ------
+    ValueError
+        The part has no reference or nothing to compare it with.
+    """
+    variants = VARIANTS.get((year, day, part), [])
+    references = [v for v in variants if v.reference]
+
+    if not references or len(variants) < 2:
+        raise ValueError(
+            f"{year}/{day:02d} part {part} needs a reference and at least "
+            "one other variant")
+
+    return references + [v for v in variants if not v.reference]
+
+
+def generate_inputs(
+    day: Day,
+    directory: Path,
+    count: int = 3,
+    scale: int = 1,
+    seed: int = 0,
+) -> list[Path]:
+    """Write ``count`` generated inputs of a day, one per seed.
+
+    Returns
+    -------
+    list[pathlib.Path]
+        Empty if the day has no generator.
+    """
+    if (day.year, day.day) not in GENERATORS:
+        return []
+
+    paths = []
+
+    for s in range(seed, seed + count):
+        path = directory / f"diff_{day.year}_{day.day:02d}_{s}.txt"
+        path.write_text(
+            generate(day.year, day.day, scale, s), encoding="utf-8")
+        paths.append(path)
+
+    return paths
+
+
+def compare(
+    day: Day,
+    part: int,
+    paths: list[Path],
+    repeats: int = 1,
+) -> DiffRun:
+    """Run every variant of a part on every input and compare the answers.
+
+    Parameters
+    ----------
+    day : Day
+        Day the part belongs to.
+    part : int
+        Part number.
+    paths : list[pathlib.Path]
+        Input files.
+    repeats : int, optional
+        Runs per variant and input; the fastest one is reported. Default
+        is 1.
+
+    Returns
+    -------
+    DiffRun
+    """
+    variants = variants_of(day.year, day.day, part)
+    run = DiffRun(day.name, part, variants)
+
+    with day.context():
+        for path in paths:
+            results = {}
+
+            for var in variants:
+                runs = [
+                    run_phase(day, var.name, var.func, path)[0]
+                    for _ in range(max(1, repeats))]
+                results[var.name] = min(runs, key=lambda res: res.wall)
+
+            run.comparisons.append(
+                Comparison(path.name, results, variants[0].name))
+
+    return run
+
+
+def _cell(res: PhaseResult, width: int = 32) -> str:
+    cell = f"ERROR {res.error}" if res.error else str(res.answer)
+
+    return cell if len(cell) <= width else cell[:width - 3] + "..."
+
+
+def format_report(run: DiffRun) -> str:
+    """Format a differential run as a plain text table.
+
+    One row per input with each variant's answer (the reference first) and
+    wall time, a ``!`` on rows where the variants disagree, then the
+    speedup of every variant over the reference.
+    """
+    names = [var.name for var in run.variants]
+    header = ("", "input", *names, *(f"{name} (s)" for name in names))
+    rows = []
+
+    for comp in run.comparisons:
+        rows.append((
+            "" if comp.ok else "!", comp.input,
+            *(_cell(comp.results[name]) for name in names),
+            *(f"{comp.results[name].wall:.4f}" for name in names)))
+
+    widths = [
+        max(len(row[i]) for row in [header] + rows)
+        for i in range(len(header))]
+
+    def fmt(row: tuple) -> str:
+        return "  ".join(
+            cell.rjust(w) if i >= 2 + len(names) else cell.ljust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))).rstrip()
+
+    lines = [
+        f"{run.day} part {run.part}: reference {names[0]}",
+        fmt(header), "  ".join("-" * w for w in widths)]
+    lines.extend(fmt(row) for row in rows)
+
+    failed = sum(not comp.ok for comp in run.comparisons)
+    lines.append(
+        f"{len(run.comparisons)} input(s), {failed} mismatch(es)")
+
+    for name in names[1:]:
+        lines.append(
+            f"{name}: {run.total(name):.4f}s vs {run.total(names[0]):.4f}s, "
+            f"{run.speedup(name):.2f}x")
+
+    return "\n".join(lines)
+
+
+def diff(args) -> int:
+    """Entry point for ``python -m aoc diff``."""
+    status = 0
+    found = False
+
+    for day in find_days(args.year, args.day):
+        parts = [
+            n for n in args.part or (1, 2)
+            if (day.year, day.day, n) in VARIANTS]
+        if not parts:
+            continue
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = generate_inputs(
+                day, Path(tmp), args.count, args.scale, args.seed)
+            paths += [
+                day.input_path(name) for name in args.input or []
+                if day.input_path(name).is_file()]
+
+            if not paths:
+                print(f"{day.name}: no generator and no inputs\n")
+                continue
+
+            for part in parts:
+                found = True
+                run = compare(day, part, paths, args.repeats)
+
+                print(format_report(run))
+                print()
+
+                if not run.ok:
+                    status = 1
+
+    if not found:
+        print("no days with registered variants")
+        return 1
+
+    return status
+
+
+def add_arguments(parser) -> None:
+    """Add the ``diff`` command line arguments to a parser."""
+    parser.add_argument(
+        "-y", "--year", type=int, action="append",
+        help="Only check this year. May be repeated.")
+    parser.add_argument(
+        "-d", "--day", type=int, action="append",
+        help="Only check this day of the month. May be repeated.")
+    parser.add_argument(
+        "-p", "--part", type=int, action="append", choices=[1, 2],
+        help="Only check this part. May be repeated.")
+    parser.add_argument(
+        "-n", "--count", type=int, default=3,
+        help="Generated inputs per day, one per seed. Default is 3.")
+    parser.add_argument(
+        "-s", "--scale", type=int, default=1,
+        help="Size of the generated inputs relative to a real input. "
+             "Default is 1.")
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="First random seed. Default is 0.")
+    parser.add_argument(
+        "-i", "--input", action="append",
+        help="Also compare on this input file of the day directory, e.g. "
+             "example.txt. May be repeated.")
+    parser.add_argument(
+        "--repeats", type=int, default=1,
+        help="Runs per variant and input; the fastest is reported. "
+             "Default is 1.")
+
+
+# Register the variants
+from aoc.differential import y2024, y2025  # noqa: E402,F401
@@ -0,0 +1,80 @@
+"""Reference and optimized variants of 2024 parts.
+
+The day's modules are imported inside each function: variants are called
+from inside the day directory, where ``p1``, ``p2``, ... are that day's.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from aoc.differential import variant
+
+
+@variant(2024, 10, 1, reference=True, name="p1.Graph")
+def day10_graph_1(path: Path) -> int:
+    from p1 import parse_input, part1
+
+    return part1(parse_input(path))
+
+
+@variant(2024, 10, 1, name="p3.create_matrix")
+def day10_matrix_1(path: Path) -> int:
+    from p1 import parse_input
+    from p3 import create_matrix, part1
+
+    matrix, roots = create_matrix(parse_input(path))
+
+    return sum(len(part1(matrix, root, set(), [])) for root in roots)
+
+
+@variant(2024, 10, 2, reference=True, name="p2.Graph")
+def day10_graph_2(path: Path) -> int:
+    from p1 import parse_input
+    from p2 import part2
+
+    return part2(parse_input(path))
+
+
+@variant(2024, 10, 2, name="p3.create_matrix")
+def day10_matrix_2(path: Path) -> int:
+    from p1 import parse_input
+    from p3 import create_matrix, part2
+
+    matrix, roots = create_matrix(parse_input(path))
+
+    return sum(len(part2(matrix, root, [], [])) for root in roots)
+
+
+@variant(2024, 12, 1, reference=True, name="p1.bfs")
+def day12_sets(path: Path) -> int:
+    from p1 import parse_input, part1
+
+    return part1(parse_input(path))
+
+
+@variant(2024, 12, 1, name="p1_oop.Garden")
+def day12_garden(path: Path) -> int:
+    from p1_oop import Garden, solution
+
+    return solution(Garden.from_file(path))[0]
+
+
+@variant(2024, 18, 2, reference=True, name="MemoryMap.solve")
+def day18_search(path: Path) -> str:
+    from p1 import MemoryMap, parse_input
+
+    points = parse_input(path)
+    mem = MemoryMap(points)
+
+    # solve() returns the path while there is one
+    while isinstance(mem.solve(), list):
+        mem.add_byte()
+
+    return ','.join(map(str, points[mem.byte_idx][::-1]))
+
+
+@variant(2024, 18, 2, name="first_blocker")
+def day18_union_find(path: Path) -> str:
+    from p1 import parse_input, part2
+
+    return part2(parse_input(path))
@@ -0,0 +1,111 @@
+"""Reference and optimized variants of 2025 parts."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from aoc.differential import variant
+
+
+@variant(2025, 1, 1, reference=True, name="part_1")
+def day01_loop(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.part_1(Solution.read_input(path))
+
+
+@variant(2025, 1, 1, name="DialLog")
+def day01_log_landings(path: Path) -> int:
+    from solution import DialLog
+
+    return DialLog.from_file(path).landings()
+
+
+@variant(2025, 1, 2, reference=True, name="part_2_brute")
+def day01_brute(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.part_2_brute(Solution.read_input(path))
+
+
+@variant(2025, 1, 2, name="part_2")
+def day01_crossings(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.part_2(Solution.read_input(path))
+
+
+@variant(2025, 1, 2, name="DialLog")
+def day01_log_clicks(path: Path) -> int:
+    from solution import DialLog
+
+    return DialLog.from_file(path).zero_clicks()
+
+
+@variant(2025, 2, 1, reference=True, name="part_1_brute")
+def day02_scan_twice(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.part_1_brute(Solution.read_input(path))
+
+
+@variant(2025, 2, 1, name="part_1")
+def day02_series_twice(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.part_1(Solution.read_input(path))
+
+
+@variant(2025, 2, 2, reference=True, name="part_2_brute")
+def day02_scan(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.part_2_brute(Solution.read_input(path))
+
+
+@variant(2025, 2, 2, name="part_2")
+def day02_series(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.part_2(Solution.read_input(path))
+
+
+@variant(2025, 3, 1, reference=True, name="part_1_brute")
+def day03_pairs(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.part_1_brute(Solution.read_input(path))
+
+
+@variant(2025, 3, 1, name="part_1")
+def day03_stack_two(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.part_1(Solution.read_input(path))
+
+
+@variant(2025, 3, 2, reference=True, name="part_2_greedy")
+def day03_slices(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.part_2_greedy(Solution.read_input(path))
+
+
+@variant(2025, 3, 2, name="part_2")
+def day03_stack(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.part_2(Solution.read_input(path))
+
+
+@variant(2025, 3, 1, name="batch")
+def day03_batch_two(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.joltage_batch(Solution.read_matrices(path), 2)
+
+
+@variant(2025, 3, 2, name="batch")
+def day03_batch(path: Path) -> int:
+    from solution import Solution
+
+    return Solution.joltage_batch(Solution.read_matrices(path), 12)
@@ -0,0 +1,477 @@
+"""Find and load the solutions for every year of the calendar.
+
+Each year uses a different layout:
+
+    2023/dayNN/main.py          solve_1 / solve_2
+    2024/NN/p1.py, p2.py        parse_input + part1 / part2 / solve / answer
+                                (part2 may also live in p1.py)
+    2025/NN/solution.py         Solution.read_input / part_1 / part_2
+
+Discovery only parses the source with ``ast`` so that finding the days never
+executes a solution (several of them do their work at import time). Loading a
+day imports its modules from inside the day directory, which is what the
+``from p1 import ...`` imports and the relative ``input.txt`` paths expect.
+"""
+from __future__ import annotations
+
+import ast
+import importlib
+import inspect
+import os
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Local, untracked state of the tooling (baselines, caches, profiles)
+STATE_DIR = ROOT / ".aoc"
+
+# Parameter names that mean "give me the input file, not the parsed input"
+PATH_PARAMS = ("f_path", "fpath", "f_name", "fname", "file_path", "path")
+
+# 2024 entry point names, in order of preference
+ENTRY_NAMES_2024 = ("part{n}", "solve", "answer")
+
+
+@dataclass(frozen=True)
+class Day:
+    """A single day of the calendar.
+
+    Attributes
+    ----------
+    year : int
+        Calendar year.
+    day : int
+        Day of the month.
+    directory : pathlib.Path
+        Directory holding the day's source files.
+    layout : str
+        Which year's file layout the day uses.
+    parts : tuple[int, ...]
+        Parts with a callable entry point.
+    """
+    year: int
+    day: int
+    directory: Path
+    layout: str
+    parts: tuple[int, ...]
+
+    @property
+    def name(self) -> str:
+        """Return the day as ``YYYY/DD``."""
+        return f"{self.year}/{self.day:02d}"
+
+    @property
+    def sources(self) -> list[Path]:
+        """Return the Python source files of the day."""
+        return sorted(self.directory.glob("*.py"))
+
+    def input_path(self, f_name: str = "input.txt") -> Path:
+        """Return the path of an input file in the day directory."""
+        return self.directory / f_name
+
+    @contextmanager
+    def context(self) -> Iterator[None]:
+        """Run code as if it had been started from the day directory.
+
+        Changes the working directory, puts the day directory first on
+        ``sys.path`` and hides any cached sibling modules (``p1``, ``p2``,
+        ...) of other days from the import system.
+        """
+        names = [src.stem for src in self.sources]
+        saved = {name: sys.modules.pop(name) for name in names
+                 if name in sys.modules}
+        prev_cwd = os.getcwd()
+
+        sys.path.insert(0, str(self.directory))
+        os.chdir(self.directory)
+
+        try:
+            yield
+        finally:
+            os.chdir(prev_cwd)
+            sys.path.remove(str(self.directory))
+
+            for name in names:
+                sys.modules.pop(name, None)
+
+            sys.modules.update(saved)
+
+    def load(self) -> Phases:
+        """Import the day and return its phases.
+
+        Must be called from inside ``Day.context()``.
+        """
+        return LOADERS[self.layout](self)
+
+
+@dataclass
+class Phases:
+    """Callables for the phases of a day.
+
+    Attributes
+    ----------
+    parse : Callable[[pathlib.Path], Any]
+        Read and parse an input file.
+    parts : dict[int, Callable[[Any, pathlib.Path], Any]]
+        Part number to a callable taking the parsed input and the input path.
+    """
+    parse: Callable[[Path], Any]
+    parts: dict[int, Callable[[Any, Path], Any]]
+
+
+def _positional(func: Callable) -> list[inspect.Parameter]:
+    """Return the positional parameters of a callable."""
+    kinds = (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    )
+
+    return [
+        p for p in inspect.signature(func).parameters.values()
+        if p.kind in kinds]
+
+
+def _path_arg(path: Path, param: inspect.Parameter | None = None) -> Any:
+    """Return the input path the way a solution's parameter expects it.
+
+    Several solutions resolve the name against their own directory (e.g.
+    ``Path(__file__).with_name(fname)``), so files in the day directory are
+    passed by name only. Parameters annotated with ``Path`` get a
+    ``pathlib.Path`` (``file_path.read_text()``), the others a ``str``.
+    """
+    path = Path(path).resolve()
+
+    if path.parent == Path.cwd().resolve():
+        path = Path(path.name)
+
+    if param is not None and "Path" in str(param.annotation):
+        return path
+
+    return str(path)
+
+
+def call_parse(func: Callable, path: Path) -> Any:
+    """Call a parse function, passing the input path if it accepts one."""
+    params = _positional(func)
+
+    if not params:
+        return func()
+
+    return func(_path_arg(path, params[0]))
+
+
+def call_part(func: Callable, inp: Any, path: Path) -> Any:
+    """Call a part function with whatever its signature asks for.
+
+    Parameters
+    ----------
+    func : Callable
+        Part function.
+    inp : Any
+        Parsed input. Tuples are unpacked into as many leading elements as
+        the function has required parameters.
+    path : pathlib.Path
+        Input file, for functions that read the input themselves.
+
+    Returns
+    -------
+    Any
+        Return value of the part function.
+    """
+    params = _positional(func)
+
+    if not params:
+        return func()
+
+    if params[0].name in PATH_PARAMS:
+        return func(_path_arg(path, params[0]))
+
+    if isinstance(inp, tuple):
+        # Tuples are unpacked the way the solutions' own __main__ blocks do,
+        # e.g. ``part_1(*read_input(...))`` or ``part_2(ranges)``.
+        required = [
+            p for p in params if p.default is inspect.Parameter.empty]
+        return func(*inp[:max(len(required), 1)])
+
+    return func(inp)
+
+
+def _functions(tree: ast.Module) -> set[str]:
+    """Return the names of the top-level functions of a module."""
+    return {
+        node.name for node in tree.body
+        if isinstance(node, ast.FunctionDef)}
+
+
+def _parse_source(path: Path) -> ast.Module | None:
+    """Parse a source file, returning None if it does not exist."""
+    if not path.is_file():
+        return None
+
+    return ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+
+def _find_2023(year_dir: Path) -> Iterator[Day]:
+    for directory in sorted(year_dir.glob("day[0-9][0-9]")):
+        tree = _parse_source(directory / "main.py")
+        if tree is None:
+            continue
+
+        funcs = _functions(tree)
+        parts = tuple(n for n in (1, 2) if f"solve_{n}" in funcs)
+
+        yield Day(2023, int(directory.name[3:]), directory, "2023", parts)
+
+
+def _entry_2024(tree: ast.Module | None, part: int) -> str | None:
+    """Return the name of a 2024 part entry point, if there is one."""
+    if tree is None:
+        return None
+
+    funcs = _functions(tree)
+
+    for name in ENTRY_NAMES_2024:
+        if name.format(n=part) in funcs:
+            return name.format(n=part)
+
+    return None
+
+
+def _module_2024(directory: Path, part: int) -> tuple[str, str] | None:
+    """Return the module and function of a 2024 part, if there is one.
+
+    A part lives in ``p{n}.py``; days solved in a single file also have
+    ``part2`` in ``p1.py``.
+    """
+    name = _entry_2024(_parse_source(directory / f"p{part}.py"), part)
+    if name is not None:
+        return f"p{part}", name
+
+    # Only the explicit name: ``solve`` in p1.py is part 1's
+    tree = _parse_source(directory / "p1.py")
+    if part != 1 and tree is not None and f"part{part}" in _functions(tree):
+        return "p1", f"part{part}"
+
+    return None
+
+
+def _find_2024(year_dir: Path) -> Iterator[Day]:
+    for directory in sorted(year_dir.glob("[0-9][0-9]")):
+        parts = tuple(
+            n for n in (1, 2) if _module_2024(directory, n) is not None)
+
+        if (directory / "p1.py").is_file():
+            yield Day(2024, int(directory.name), directory, "2024", parts)
+
+
+def _solution_class(tree: ast.Module) -> ast.ClassDef | None:
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "Solution":
+            return node
+
+    return None
+
+
+def _find_2025(year_dir: Path) -> Iterator[Day]:
+    for directory in sorted(year_dir.glob("[0-9][0-9]")):
+        tree = _parse_source(directory / "solution.py")
+        if tree is None:
+            continue
+
+        cls = _solution_class(tree)
+        methods = set() if cls is None else {
+            node.name for node in cls.body
+            if isinstance(node, ast.FunctionDef)}
+
+        parts = tuple(n for n in (1, 2) if f"part_{n}" in methods)
+
+        yield Day(2025, int(directory.name), directory, "2025", parts)
+
+
+FINDERS = {
+    "2023": _find_2023,
+    "2024": _find_2024,
+    "2025": _find_2025,
+}
+
+
+def find_days(
+    years: list[int] | None = None,
+    days: list[int] | None = None,
+    root: Path = ROOT,
+) -> list[Day]:
+    """Find every day of every year.
+
+    Parameters
+    ----------
+    years : list[int], optional
+        Only return days from these years.
+    days : list[int], optional
+        Only return these days of the month.
+    root : pathlib.Path, optional
+        Repository root. Default is the root this package lives in.
+
+    Returns
+    -------
+    list[Day]
+    """
+    found = []
+
+    for layout, finder in FINDERS.items():
+        if years and int(layout) not in years:
+            continue
+
+        year_dir = root / layout
+        if not year_dir.is_dir():
+            continue
+
+        found.extend(d for d in finder(year_dir) if not days or d.day in days)
+
+    return found
+
+
+def _script_2023(tree: ast.Module) -> tuple[set[str], set[int]]:
+    """Return how a 2023 script drives its functions.
+
+    Only the module-level code (the ``__main__`` block and any bare calls)
+    is looked at, not the function bodies.
+
+    Returns
+    -------
+    called : set[str]
+        Names of the functions it calls, e.g. ``explode``.
+    per_item : set[int]
+        Parts it sums over the input one item at a time, as in
+        ``sum([solve_1(x) for x in inp])``.
+    """
+    called, per_item = set(), set()
+    script = [
+        node for node in tree.body
+        if not isinstance(node, (ast.FunctionDef, ast.ClassDef))]
+
+    for node in (n for stmt in script for n in ast.walk(stmt)):
+        if not isinstance(node, ast.Call) \
+                or not isinstance(node.func, ast.Name):
+            continue
+
+        called.add(node.func.id)
+
+        if node.func.id != "sum" or not node.args:
+            continue
+
+        comp = node.args[0]
+        if isinstance(comp, (ast.ListComp, ast.GeneratorExp)) \
+                and isinstance(comp.elt, ast.Call) \
+                and isinstance(comp.elt.func, ast.Name):
+            name = comp.elt.func.id
+            if name in ("solve_1", "solve_2"):
+                per_item.add(int(name[-1]))
+
+    return called, per_item
+
+
+def _load_2023(day: Day) -> Phases:
+    module = importlib.import_module("main")
+    called, per_item = _script_2023(_parse_source(day.directory / "main.py"))
+
+    read_input = (
+        getattr(module, "read_input", None)
+        or getattr(module, "get_input", None))
+
+    def parse(path: Path) -> Any:
+        if read_input is not None:
+            return call_parse(read_input, path)
+
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+
+        # Some parts explode the lines themselves (day 18)
+        if hasattr(module, "explode") and "explode" in called:
+            return module.explode(lines)
+
+        return lines
+
+    parts = {}
+
+    for n in day.parts:
+        func = getattr(module, f"solve_{n}")
+        parts[n] = _bind_items(func) if n in per_item else _bind(func)
+
+    return Phases(parse, parts)
+
+
+def _load_2024(day: Day) -> Phases:
+    p1 = importlib.import_module("p1")
+    parts = {}
+
+    for n in day.parts:
+        module, name = _module_2024(day.directory, n)
+        parts[n] = _bind(getattr(importlib.import_module(module), name))
+
+    def parse(path: Path) -> Any:
+        if not hasattr(p1, "parse_input"):
+            return None
+
+        return call_parse(p1.parse_input, path)
+
+    return Phases(parse, parts)
+
+
+def _load_2025(day: Day) -> Phases:
+    cls = importlib.import_module("solution").Solution
+
+    if isinstance(inspect.getattr_static(cls, "read_input"), classmethod) \
+            and "__init__" not in vars(cls):
+        def parse(path: Path) -> Any:
+            return call_parse(cls.read_input, path)
+
+        parts = {n: _bind(getattr(cls, f"part_{n}")) for n in day.parts}
+
+        return Phases(parse, parts)
+
+    # Instance-based solutions parse (and precompute) in __init__
+    def parse_instance(path: Path) -> Any:
+        params = _positional(cls)
+        return cls(_path_arg(path, params[0] if params else None))
+
+    def bind_method(name: str) -> Callable[[Any, Path], Any]:
+        def part(inp: Any, path: Path) -> Any:
+            return getattr(inp, name)()
+        return part
+
+    parts = {n: bind_method(f"part_{n}") for n in day.parts}
+
+    return Phases(parse_instance, parts)
+
+
+def _bind(func: Callable) -> Callable[[Any, Path], Any]:
+    """Wrap a part function so it can be called as ``part(inp, path)``."""
+    def part(inp: Any, path: Path) -> Any:
+        return call_part(func, inp, path)
+
+    part.__name__ = func.__name__
+    part.__wrapped__ = func
+
+    return part
+
+
+def _bind_items(func: Callable) -> Callable[[Any, Path], Any]:
+    """Wrap a part function of one input item to sum it over the input."""
+    def part(inp: Any, path: Path) -> Any:
+        return sum(func(item) for item in inp)
+
+    part.__name__ = func.__name__
+    part.__wrapped__ = func
+
+    return part
+
+
+LOADERS = {
+    "2023": _load_2023,
+    "2024": _load_2024,
+    "2025": _load_2025,
+}
@@ -0,0 +1,136 @@
+"""A standard command line for running a single solution file directly.
+
+Every solution used to grow its own ``__main__`` switch (argparse ``-r`` in
+one day, ``sys.argv[1]`` in another, nothing in most). ``day_main`` gives
+them all the same one, backed by the shared tooling, so a day run by hand
+is timed, benchmarked and profiled exactly like ``python -m aoc`` does:
+
+``--mode run``
+    Run every part on the input and print the timing table (the default).
+``--mode test``
+    Call the solution's own ``test`` function, e.g. asserts on the example.
+``--mode bench``
+    Time every phase over several runs, like ``python -m aoc bench``.
+``--mode profile``
+    Run under one of the profilers of ``aoc.profiling``.
+
+Usage
+-----
+from aoc.entry import day_main
+
+if __name__ == "__main__":
+    sys.exit(day_main(__file__, test=test))
+
+then ``python solution.py --mode bench -i input_x10.txt``.
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Callable
+
+from aoc.bench import bench_day, format_results
+from aoc.discover import Day, find_days
+from aoc.profiling import MODES, PROFILE_DIR, enable_profiling
+from aoc.runner import format_table, run_day
+
+
+ENTRY_MODES = ("run", "test", "bench", "profile")
+
+
+def day_of(source_file: str | Path) -> Day:
+    """Return the day a solution source file belongs to.
+
+    Raises
+    ------
+    LookupError
+        The file is not in a day directory of a known layout.
+    """
+    directory = Path(source_file).resolve().parent
+    root = directory.parents[1]
+
+    for day in find_days(root=root):
+        if day.directory.resolve() == directory:
+            return day
+
+    raise LookupError(f"{directory} is not the directory of a known day")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line of a solution file."""
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "-m", "--mode", choices=ENTRY_MODES, default="run",
+        help="What to do. Default is 'run'.")
+    parser.add_argument(
+        "-i", "--input", default="input.txt",
+        help="Input file name, relative to the day directory. "
+             "Default is 'input.txt'.")
+    parser.add_argument(
+        "-p", "--part", type=int, action="append", choices=[1, 2],
+        help="Only run this part. May be repeated.")
+    parser.add_argument(
+        "--profiler", choices=MODES, default="cprofile",
+        help="Profiler of '--mode profile'. Default is 'cprofile'.")
+    parser.add_argument(
+        "--repeats", type=int, default=5,
+        help="Timed runs per phase of '--mode bench'. Default is 5.")
+
+    return parser.parse_args(argv)
+
+
+def day_main(
+    source_file: str | Path,
+    test: Callable[[], None] | None = None,
+    argv: list[str] | None = None,
+) -> int:
+    """Run a solution file in the mode given on the command line.
+
+    Parameters
+    ----------
+    source_file : str | pathlib.Path
+        The solution's ``__file__``.
+    test : Callable[[], None], optional
+        Tests of the solution, run by ``--mode test``. They should raise
+        (e.g. ``AssertionError``) on failure. Default is None: no tests.
+    argv : list[str], optional
+        Command line arguments. Default is None: ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        Exit status: 0 if every phase (or test) passed.
+    """
+    args = parse_args(argv)
+    day = day_of(source_file)
+    parts = tuple(args.part or (1, 2))
+
+    if args.mode == "test":
+        if test is None:
+            print(f"{day.name}: no tests")
+            return 1
+
+        with day.context():
+            test()
+        return 0
+
+    if args.mode == "bench":
+        result = bench_day(day, args.input, args.repeats)
+        if result is None:
+            print(f"{day.name}: no {args.input}")
+            return 1
+
+        print(format_results([result]))
+        return 0 if not result.errors else 1
+
+    if args.mode == "profile":
+        enable_profiling(args.profiler)
+
+    results = run_day(day, args.input, parts)
+    print(format_table(results))
+
+    if args.mode == "profile":
+        print(f"\n{args.profiler} profiles written to {PROFILE_DIR}")
+
+    return 0 if all(r.ok for r in results) else 1
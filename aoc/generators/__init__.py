@@ -0,0 +1,133 @@
+"""Synthetic puzzle inputs at arbitrary scale.
+
+Each generator writes an input in the real format of its day. ``scale=1`` is
+roughly the size of a real puzzle input; larger scales multiply the amount of
+work: the number of lines, points or ranges for list-like inputs, and the
+number of cells (not the side length) for grids.
+
+Generated inputs are meant for measuring how a solution scales, not for
+checking answers; they are valid for the parsers but the answers are
+meaningless.
+
+Usage
+-----
+python -m aoc generate -y 2025 -d 5 -s 100      # writes 2025/05/input_x100.txt
+"""
+from __future__ import annotations
+
+import random
+from math import sqrt
+from pathlib import Path
+from typing import Callable
+
+from aoc.discover import find_days
+
+
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS: dict[tuple[int, int], Generator] = {}
+
+
+def generator(year: int, day: int) -> Callable[[Generator], Generator]:
+    """Register an input generator for a day."""
+    def register(func: Generator) -> Generator:
+        GENERATORS[(year, day)] = func
+        return func
+
+    return register
+
+
+def scaled_side(base: int, scale: int) -> int:
+    """Return the side length of a square grid with ``scale`` times the cells.
+    """
+    return max(1, round(base * sqrt(scale)))
+
+
+def render(grid: list[list[str]]) -> str:
+    """Join a 2D grid of characters into input text."""
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def generate(year: int, day: int, scale: int = 1, seed: int = 0) -> str:
+    """Generate an input for a day.
+
+    Parameters
+    ----------
+    year : int
+        Calendar year.
+    day : int
+        Day of the month.
+    scale : int, optional
+        Size relative to a real input. Default is 1.
+    seed : int, optional
+        Random seed, so inputs are reproducible. Default is 0.
+
+    Returns
+    -------
+    str
+        Input text.
+
+    Raises
+    ------
+    KeyError
+        No generator is registered for the day.
+    ValueError
+        ``scale`` is smaller than 1.
+    """
+    if scale < 1:
+        raise ValueError(f"scale must be at least 1, got {scale}")
+
+    return GENERATORS[(year, day)](scale, random.Random(seed))
+
+
+def input_name(scale: int) -> str:
+    """Return the default file name of a generated input."""
+    return f"input_x{scale}.txt"
+
+
+def generate_cmd(args) -> int:
+    """Entry point for ``python -m aoc generate``."""
+    status = 0
+
+    for day in find_days(args.year, args.day):
+        if (day.year, day.day) not in GENERATORS:
+            if args.day:
+                print(f"{day.name}: no generator")
+                status = 1
+            continue
+
+        for scale in args.scale or [1]:
+            f_path = day.input_path(args.output or input_name(scale))
+            f_path.write_text(
+                generate(day.year, day.day, scale, args.seed),
+                encoding="utf-8")
+
+            size = f_path.stat().st_size
+            print(f"{day.name}: wrote {f_path} ({size:,} bytes)")
+
+    return status
+
+
+def add_arguments(parser) -> None:
+    """Add the ``generate`` command line arguments to a parser."""
+    parser.add_argument(
+        "-y", "--year", type=int, action="append",
+        help="Only generate for this year. May be repeated.")
+    parser.add_argument(
+        "-d", "--day", type=int, action="append",
+        help="Only generate for this day of the month. May be repeated.")
+    parser.add_argument(
+        "-s", "--scale", type=int, action="append",
+        help="Size relative to a real input, e.g. 10, 100 or 1000. "
+             "May be repeated. Default is 1.")
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="Random seed. Default is 0.")
+    parser.add_argument(
+        "-o", "--output",
+        help="Output file name, relative to each day directory. "
+             "Default is 'input_x<scale>.txt'.")
+
+
+# Register the generators
+from aoc.generators import y2023, y2024, y2025  # noqa: E402,F401
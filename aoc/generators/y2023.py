@@ -0,0 +1,156 @@
+"""Input generators for 2023."""
+from __future__ import annotations
+
+import random
+import string
+
+from aoc.generators import generator, render, scaled_side
+
+
+DIGIT_WORDS = [
+    "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+@generator(2023, 1)
+def day01(scale: int, rng: random.Random) -> str:
+    """Calibration lines mixing letters, digits and spelled-out digits."""
+    lines = []
+
+    for _ in range(1000 * scale):
+        parts = []
+        for _ in range(rng.randint(2, 6)):
+            roll = rng.random()
+            if roll < 0.3:
+                parts.append(str(rng.randint(1, 9)))
+            elif roll < 0.6:
+                parts.append(rng.choice(DIGIT_WORDS))
+            else:
+                parts.append("".join(
+                    rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+
+        # Every line needs at least one real digit for Part 1
+        parts.insert(rng.randrange(len(parts) + 1), str(rng.randint(1, 9)))
+        lines.append("".join(parts))
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(2023, 2)
+def day02(scale: int, rng: random.Random) -> str:
+    """Cube games: ``Game N: 3 blue, 4 red; 1 red, 2 green``."""
+    lines = []
+
+    for game in range(1, 100 * scale + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(
+                ", ".join(f"{rng.randint(1, 20)} {c}" for c in colors))
+
+        lines.append(f"Game {game}: {'; '.join(draws)}")
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(2023, 4)
+def day04(scale: int, rng: random.Random) -> str:
+    """Scratchcards with 10 winning numbers and 25 numbers you have.
+
+    Cards near the end never win more copies than there are cards left.
+    """
+    n_cards = 200 * scale
+    lines = []
+
+    for card in range(1, n_cards + 1):
+        winning = rng.sample(range(1, 100), 10)
+        max_matches = min(10, n_cards - card)
+        matches = rng.sample(winning, rng.randint(0, max_matches))
+        others = rng.sample(
+            [x for x in range(1, 100) if x not in winning], 25 - len(matches))
+        have = matches + others
+        rng.shuffle(have)
+
+        lines.append(
+            f"Card {card:>4}: {' '.join(f'{x:>2}' for x in winning)} | "
+            f"{' '.join(f'{x:>2}' for x in have)}")
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(2023, 7)
+def day07(scale: int, rng: random.Random) -> str:
+    """Camel Cards hands and bids."""
+    hands = ("".join(rng.choices("23456789TJQKA", k=5))
+             for _ in range(1000 * scale))
+
+    return "".join(f"{hand} {rng.randint(1, 1000)}\n" for hand in hands)
+
+
+@generator(2023, 8)
+def day08(scale: int, rng: random.Random) -> str:
+    """Left/right instructions and a network with a path from AAA to ZZZ.
+
+    Both branches of every node lead one step further along a shuffled chain
+    of nodes, so the walk always reaches ZZZ.
+    """
+    n_nodes = 750 * scale
+    length = 3
+    while 26 ** length < 2 * n_nodes:
+        length += 1
+
+    names = set()
+    while len(names) < n_nodes:
+        name = "".join(rng.choices(string.ascii_uppercase, k=length))
+        if name not in ("AAA", "ZZZ"):
+            names.add(name)
+
+    chain = ["AAA"] + rng.sample(sorted(names), len(names)) + ["ZZZ"]
+    instructions = "".join(rng.choices("LR", k=280))
+
+    lines = [instructions, ""]
+    for node, nxt in zip(chain, chain[1:] + ["ZZZ"]):
+        lines.append(f"{node} = ({nxt}, {nxt})")
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(2023, 9)
+def day09(scale: int, rng: random.Random) -> str:
+    """OASIS histories: polynomial sequences of 21 values."""
+    lines = []
+
+    for _ in range(200 * scale):
+        coeffs = [rng.randint(-9, 9) for _ in range(rng.randint(1, 5))]
+        start = rng.randint(-5, 5)
+        values = [
+            sum(c * (start + x) ** i for i, c in enumerate(coeffs))
+            for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(2023, 11)
+def day11(scale: int, rng: random.Random) -> str:
+    """Galaxy image with a few empty rows and columns."""
+    side = scaled_side(140, scale)
+    empty_rows = set(rng.sample(range(side), side // 20))
+    empty_cols = set(rng.sample(range(side), side // 20))
+
+    grid = [
+        ["#" if (
+            i not in empty_rows and j not in empty_cols
+            and rng.random() < 0.02) else "."
+         for j in range(side)]
+        for i in range(side)]
+
+    return render(grid)
+
+
+@generator(2023, 14)
+def day14(scale: int, rng: random.Random) -> str:
+    """Platform of round rocks (O), cube rocks (#) and empty space."""
+    side = scaled_side(100, scale)
+
+    return render([
+        rng.choices("O#.", weights=(2, 1, 5), k=side) for _ in range(side)])
@@ -0,0 +1,421 @@
+"""Input generators for 2024."""
+from __future__ import annotations
+
+import random
+import string
+from itertools import combinations, product
+
+from aoc.generators import generator, render, scaled_side
+
+
+MOVES = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+# Directions Day 10 slopes rise in: rows and columns three times as often
+SLOPES_10 = MOVES * 3 + [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+@generator(2024, 1)
+def day01(scale: int, rng: random.Random) -> str:
+    """Two columns of location IDs."""
+    return "".join(
+        f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}\n"
+        for _ in range(1000 * scale))
+
+
+@generator(2024, 2)
+def day02(scale: int, rng: random.Random) -> str:
+    """Reports of 5 to 8 levels that mostly increase or decrease slowly."""
+    lines = []
+
+    for _ in range(1000 * scale):
+        sign = rng.choice((-1, 1))
+        level = rng.randint(10, 90)
+        report = [level]
+
+        for _ in range(rng.randint(4, 7)):
+            level += sign * rng.choice((0, 1, 2, 3, 4))
+            report.append(level)
+
+        lines.append(" ".join(map(str, report)))
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(2024, 3)
+def day03(scale: int, rng: random.Random) -> str:
+    """Corrupted memory with mul(X,Y), do() and don't() instructions."""
+    junk = string.ascii_letters + string.digits + "!@#$%^&*()[]{}<>,;:'? "
+    lines = []
+
+    for _ in range(6 * scale):
+        chunks = []
+        for _ in range(700):
+            roll = rng.random()
+            if roll < 0.25:
+                chunks.append(
+                    f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+            elif roll < 0.28:
+                chunks.append(rng.choice(("do()", "don't()")))
+            else:
+                chunks.append("".join(rng.choices(junk, k=rng.randint(1, 6))))
+        lines.append("".join(chunks))
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(2024, 4)
+def day04(scale: int, rng: random.Random) -> str:
+    """Word search of the letters X, M, A and S."""
+    side = scaled_side(140, scale)
+
+    return render([rng.choices("XMAS", k=side) for _ in range(side)])
+
+
+@generator(2024, 5)
+def day05(scale: int, rng: random.Random) -> str:
+    """Page ordering rules for every pair of 49 pages, then updates."""
+    pages = rng.sample(range(10, 100), 49)
+    rank = {page: i for i, page in enumerate(pages)}
+
+    rules = [
+        f"{a}|{b}" if rank[a] < rank[b] else f"{b}|{a}"
+        for a, b in combinations(pages, 2)]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(200 * scale):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=rank.get)
+        updates.append(",".join(map(str, update)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def _guard_exits(grid: list[list[str]], start: tuple[int, int]) -> bool:
+    """Return True if the Day 6 guard walks off the map instead of looping."""
+    n = len(grid)
+    (i, j), d = start, 0
+    seen = set()
+
+    while 0 <= i < n and 0 <= j < n:
+        if (i, j, d) in seen:
+            return False
+        seen.add((i, j, d))
+
+        ii, jj = i + MOVES[d][0], j + MOVES[d][1]
+        if 0 <= ii < n and 0 <= jj < n and grid[ii][jj] == "#":
+            d = (d + 1) % 4
+        else:
+            i, j = ii, jj
+
+    return True
+
+
+@generator(2024, 6)
+def day06(scale: int, rng: random.Random) -> str:
+    """Lab map with scattered obstructions and a guard facing up.
+
+    Maps where the guard walks in a loop are thrown away, since Part 1 would
+    never finish on them.
+    """
+    side = scaled_side(130, scale)
+
+    while True:
+        grid = [
+            rng.choices(".#", weights=(98, 2), k=side) for _ in range(side)]
+        start = (rng.randrange(side // 4, side), rng.randrange(side))
+        grid[start[0]][start[1]] = "^"
+
+        if _guard_exits(grid, start):
+            return render(grid)
+
+
+@generator(2024, 7)
+def day07(scale: int, rng: random.Random) -> str:
+    """Calibration equations, about half of which can be made true.
+
+    Like the real ones, test values have at most 15 digits: an operator
+    that would go past that is replaced with ``+``.
+    """
+    limit = 10 ** 15 - 2
+    lines = []
+
+    for _ in range(850 * scale):
+        operands = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        total = operands[0]
+
+        for x in operands[1:]:
+            op = rng.choice("+*|")
+            if op == "*" and total * x <= limit:
+                total *= x
+            elif op == "|" and int(f"{total}{x}") <= limit:
+                total = int(f"{total}{x}")
+            else:
+                total += x
+
+        if rng.random() < 0.5:
+            total += 1
+
+        lines.append(f"{total}: {' '.join(map(str, operands))}")
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(2024, 8)
+def day08(scale: int, rng: random.Random) -> str:
+    """Antenna map with a few antennas per frequency."""
+    side = scaled_side(50, scale)
+    grid = [["."] * side for _ in range(side)]
+    freqs = string.ascii_letters + string.digits
+
+    for _ in range(200 * scale):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.choice(freqs)
+
+    return render(grid)
+
+
+@generator(2024, 9)
+def day09(scale: int, rng: random.Random) -> str:
+    """Disk map: alternating file and free-space lengths, odd length."""
+    return "".join(
+        str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9))
+        for i in range(19999 * scale)) + "\n"
+
+
+@generator(2024, 10)
+def day10(scale: int, rng: random.Random) -> str:
+    """Topographic map of heights 0 to 9.
+
+    Tiles of slopes, each rising along a row or a column in a random
+    direction, with some noise, so that there are trails to find (uniformly
+    random heights have next to none). One tile in four rises along a
+    diagonal instead, where trails branch.
+    """
+    side = scaled_side(50, scale)
+    tile = 10
+    n_tiles = side // tile + 1
+    slopes = [
+        [(*rng.choice(SLOPES_10), rng.randrange(10))
+         for _ in range(n_tiles)]
+        for _ in range(n_tiles)]
+
+    grid = []
+    for i in range(side):
+        row = []
+        for j in range(side):
+            di, dj, offset = slopes[i // tile][j // tile]
+            if rng.random() < 0.1:
+                row.append(rng.choice(string.digits))
+            else:
+                row.append(str((di * i + dj * j + offset) % 10))
+        grid.append(row)
+
+    return render(grid)
+
+
+@generator(2024, 11)
+def day11(scale: int, rng: random.Random) -> str:
+    """A single line of stones."""
+    return " ".join(
+        str(rng.randint(0, 9999999)) for _ in range(8 * scale)) + "\n"
+
+
+@generator(2024, 12)
+def day12(scale: int, rng: random.Random) -> str:
+    """Garden of plant regions: coarse random blocks with ragged edges."""
+    side = scaled_side(140, scale)
+    block = 7
+    coarse = [
+        rng.choices(string.ascii_uppercase, k=side // block + 2)
+        for _ in range(side // block + 2)]
+
+    grid = []
+    for i in range(side):
+        row = []
+        for j in range(side):
+            ci = (i + rng.randint(-1, 1)) // block
+            cj = (j + rng.randint(-1, 1)) // block
+            row.append(coarse[max(ci, 0)][max(cj, 0)])
+        grid.append(row)
+
+    return render(grid)
+
+
+@generator(2024, 13)
+def day13(scale: int, rng: random.Random) -> str:
+    """Claw machines: two buttons and a prize each."""
+    machines = []
+
+    for _ in range(320 * scale):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        a, b = rng.randint(1, 100), rng.randint(1, 100)
+        px, py = a * ax + b * bx, a * ay + b * by
+
+        if rng.random() < 0.3:
+            px += 1
+
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={px}, Y={py}\n")
+
+    return "\n".join(machines)
+
+
+@generator(2024, 14)
+def day14(scale: int, rng: random.Random) -> str:
+    """Robots in the 101x103 space: ``p=x,y v=dx,dy``."""
+    return "".join(
+        f"p={rng.randrange(101)},{rng.randrange(103)} "
+        f"v={rng.randint(-99, 99)},{rng.randint(-99, 99)}\n"
+        for _ in range(500 * scale))
+
+
+@generator(2024, 15)
+def day15(scale: int, rng: random.Random) -> str:
+    """Walled warehouse with boxes and a robot, then its moves."""
+    side = scaled_side(50, scale)
+    grid = [
+        ["#" if i in (0, side - 1) or j in (0, side - 1) else
+         rng.choices(".O#", weights=(6, 3, 1))[0]
+         for j in range(side)]
+        for i in range(side)]
+
+    grid[side // 2][side // 2] = "@"
+
+    moves = "".join(rng.choices("<>^v", k=20000 * scale))
+    lines = [moves[i:i + 1000] for i in range(0, len(moves), 1000)]
+
+    return render(grid) + "\n" + "\n".join(lines) + "\n"
+
+
+def _maze(side: int, rng: random.Random) -> list[list[str]]:
+    """Carve a perfect maze with an iterative depth-first search.
+
+    ``side`` must be odd. The border is wall and the cells at odd coordinates
+    are open.
+    """
+    grid = [["#"] * side for _ in range(side)]
+    stack = [(1, 1)]
+    grid[1][1] = "."
+
+    while stack:
+        i, j = stack[-1]
+        options = [
+            (i + 2 * di, j + 2 * dj, di, dj) for di, dj in MOVES
+            if 0 < i + 2 * di < side - 1 and 0 < j + 2 * dj < side - 1
+            and grid[i + 2 * di][j + 2 * dj] == "#"]
+
+        if not options:
+            stack.pop()
+            continue
+
+        ii, jj, di, dj = rng.choice(options)
+        grid[i + di][j + dj] = "."
+        grid[ii][jj] = "."
+        stack.append((ii, jj))
+
+    return grid
+
+
+@generator(2024, 16)
+def day16(scale: int, rng: random.Random) -> str:
+    """Reindeer maze from S (bottom left) to E (top right) with some loops."""
+    side = scaled_side(141, scale) | 1
+    grid = _maze(side, rng)
+
+    # Knock out some walls so there is more than one best path
+    for _ in range(side * side // 50):
+        i, j = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (i + j) % 2 == 1:
+            grid[i][j] = "."
+
+    grid[side - 2][1] = "S"
+    grid[1][side - 2] = "E"
+
+    return render(grid)
+
+
+@generator(2024, 18)
+def day18(scale: int, rng: random.Random) -> str:
+    """Falling bytes on a square memory space: ``x,y`` per line.
+
+    The solution's MemoryMap is 71x71 unless told otherwise; larger scales
+    need ``MemoryMap(..., ni=side, nj=side)``.
+    """
+    side = scaled_side(71, scale)
+    cells = [
+        (x, y) for x in range(side) for y in range(side)
+        if (x, y) not in ((0, 0), (side - 1, side - 1))]
+
+    return "".join(
+        f"{x},{y}\n" for x, y in rng.sample(cells, len(cells) * 7 // 10))
+
+
+@generator(2024, 19)
+def day19(scale: int, rng: random.Random) -> str:
+    """Towel patterns and the designs to build from them."""
+    patterns = {
+        "".join(rng.choices("wubrg", k=rng.randint(1, 8)))
+        for _ in range(450)}
+    designs = [
+        "".join(rng.choices("wubrg", k=rng.randint(20, 60)))
+        for _ in range(400 * scale)]
+
+    return ", ".join(sorted(patterns)) + "\n\n" + "\n".join(designs) + "\n"
+
+
+@generator(2024, 20)
+def day20(scale: int, rng: random.Random) -> str:
+    """Race track: one winding path from S to E through walls.
+
+    The track snakes along every other row, so the walls between rows are
+    one cell thick and can be cheated through. The layout is fixed; ``rng``
+    is unused.
+    """
+    side = scaled_side(141, scale) | 1
+    grid = [["#"] * side for _ in range(side)]
+    rows = list(range(1, side - 1, 2))
+
+    for k, i in enumerate(rows):
+        for j in range(1, side - 1):
+            grid[i][j] = "."
+
+        if k + 1 < len(rows):
+            # Connect to the next row at alternating ends
+            grid[i + 1][side - 2 if k % 2 == 0 else 1] = "."
+
+    grid[1][1] = "S"
+    last = rows[-1]
+    grid[last][1 if len(rows) % 2 == 0 else side - 2] = "E"
+
+    return render(grid)
+
+
+@generator(2024, 22)
+def day22(scale: int, rng: random.Random) -> str:
+    """Initial secret numbers of the buyers."""
+    return "".join(
+        f"{rng.randint(1, 16777215)}\n" for _ in range(2000 * scale))
+
+
+@generator(2024, 23)
+def day23(scale: int, rng: random.Random) -> str:
+    """LAN party: ``ab-cd`` connections between computers."""
+    n_nodes = 520 * scale
+    length = 2
+    while 26 ** length < n_nodes:
+        length += 1
+
+    names = rng.sample(
+        ["".join(x) for x in product(string.ascii_lowercase, repeat=length)],
+        n_nodes)
+
+    edges = set()
+    while len(edges) < 3380 * scale:
+        a, b = rng.sample(names, 2)
+        if (b, a) not in edges:
+            edges.add((a, b))
+
+    return "".join(f"{a}-{b}\n" for a, b in edges)
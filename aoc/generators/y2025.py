@@ -0,0 +1,253 @@
+"""Input generators for 2025."""
+from __future__ import annotations
+
+import random
+import string
+from itertools import count
+from typing import Iterator
+
+from aoc.generators import generator, render, scaled_side
+
+
+@generator(2025, 1)
+def day01(scale: int, rng: random.Random) -> str:
+    """Dial rotations: ``L68``, ``R48``, ..."""
+    return "".join(
+        f"{rng.choice('LR')}{rng.randint(1, 999)}\n"
+        for _ in range(4000 * scale))
+
+
+@generator(2025, 2)
+def day02(scale: int, rng: random.Random) -> str:
+    """Disjoint product ID ranges of 1 to 10 digits, comma separated."""
+    starts = sorted({
+        int(10 ** rng.uniform(1, 10)) for _ in range(35 * scale)})
+    ranges = []
+
+    for first, after in zip(starts, starts[1:] + [10 ** 10]):
+        last = min(first + rng.randint(0, 10 ** rng.randint(1, 5)), after - 1)
+        ranges.append(f"{first}-{last}")
+
+    rng.shuffle(ranges)
+
+    return ",".join(ranges) + "\n"
+
+
+@generator(2025, 3)
+def day03(scale: int, rng: random.Random) -> str:
+    """Battery banks of 100 digits, each from its own digit range."""
+    banks = []
+
+    for _ in range(200 * scale):
+        low = rng.randint(1, 8)
+        digits = "123456789"[low - 1:rng.randint(low + 1, 9)]
+        banks.append("".join(rng.choices(digits, k=100)))
+
+    return "\n".join(banks) + "\n"
+
+
+@generator(2025, 4)
+def day04(scale: int, rng: random.Random) -> str:
+    """Paper roll (@) map."""
+    side = scaled_side(137, scale)
+
+    return render([
+        rng.choices("@.", weights=(3, 2), k=side) for _ in range(side)])
+
+
+@generator(2025, 5)
+def day05(scale: int, rng: random.Random) -> str:
+    """Fresh ID ranges, a blank line, then available IDs."""
+    top = 10 ** 15
+    ranges = []
+
+    for _ in range(190 * scale):
+        start = rng.randint(1, top)
+        ranges.append(f"{start}-{start + rng.randint(0, top // 1000)}")
+
+    ids = "\n".join(str(rng.randint(1, top)) for _ in range(1000 * scale))
+
+    return "\n".join(ranges) + "\n\n" + ids + "\n"
+
+
+@generator(2025, 6)
+def day06(scale: int, rng: random.Random) -> str:
+    """Cephalopod worksheet: four rows of numbers and a row of operators.
+
+    Each problem is a block of columns, with numbers aligned to either side
+    and a blank column between problems.
+    """
+    rows = [[] for _ in range(5)]
+
+    for _ in range(1000 * scale):
+        nums = [str(rng.randint(1, 9999)) for _ in range(4)]
+        width = max(map(len, nums))
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+
+        for row, num in zip(rows, nums):
+            row.append(align(num, width))
+
+        rows[4].append(rng.choice("+*").ljust(width))
+
+    return "\n".join(" ".join(row) for row in rows) + "\n"
+
+
+@generator(2025, 7)
+def day07(scale: int, rng: random.Random) -> str:
+    """Tachyon manifold: a start (S) and rows of splitters (^)."""
+    side = scaled_side(141, scale)
+    grid = [["."] * side for _ in range(side)]
+    grid[0][side // 2] = "S"
+
+    for i in range(2, side, 2):
+        for j in range(1, side - 1):
+            if rng.random() < 0.3 and grid[i][j - 1] != "^":
+                grid[i][j] = "^"
+
+    return render(grid)
+
+
+@generator(2025, 8)
+def day08(scale: int, rng: random.Random) -> str:
+    """Junction box positions: ``x,y,z`` per line."""
+    return "".join(
+        f"{rng.randint(0, 99999)},{rng.randint(0, 99999)},"
+        f"{rng.randint(0, 99999)}\n"
+        for _ in range(1000 * scale))
+
+
+@generator(2025, 9)
+def day09(scale: int, rng: random.Random) -> str:
+    """Red tiles: the corners of a simple rectilinear polygon, in order.
+
+    The polygon has a random upper and lower skyline over a row of columns,
+    so consecutive corners always share an x or y coordinate.
+    """
+    n_cols = 124 * scale
+    xs = sorted(rng.sample(range(1, 100000 * scale), n_cols + 1))
+    mid = 50000
+    tops = [mid + rng.randint(1000, 45000) for _ in range(n_cols)]
+    bottoms = [mid - rng.randint(1000, 45000) for _ in range(n_cols)]
+
+    corners = []
+    for k in range(n_cols):
+        corners.append((xs[k], tops[k]))
+        corners.append((xs[k + 1], tops[k]))
+
+    for k in reversed(range(n_cols)):
+        corners.append((xs[k + 1], bottoms[k]))
+        corners.append((xs[k], bottoms[k]))
+
+    # Drop corners on straight edges (equal neighbouring heights)
+    vertices = []
+    for i, (x, y) in enumerate(corners):
+        (px, py), (nx, ny) = corners[i - 1], corners[(i + 1) % len(corners)]
+        if not (px == x == nx or py == y == ny):
+            vertices.append((x, y))
+
+    return "".join(f"{x},{y}\n" for x, y in vertices)
+
+
+@generator(2025, 10)
+def day10(scale: int, rng: random.Random) -> str:
+    """Machines: indicator lights, buttons and joltage requirements.
+
+    The goal lights and joltages are built from random button presses, so
+    every machine has a solution.
+    """
+    lines = []
+
+    for _ in range(180 * scale):
+        n_lights = rng.randint(4, 10)
+        buttons = [
+            sorted(rng.sample(range(n_lights), rng.randint(1, n_lights - 1)))
+            for _ in range(rng.randint(3, 13))]
+
+        presses = [rng.randint(0, 20) for _ in buttons]
+        lights = [False] * n_lights
+        joltages = [0] * n_lights
+
+        for button, count in zip(buttons, presses):
+            for light in button:
+                joltages[light] += count
+                if count % 2:
+                    lights[light] = not lights[light]
+
+        goal = "".join("#" if x else "." for x in lights)
+        btns = " ".join(f"({','.join(map(str, b))})" for b in buttons)
+        lines.append(f"[{goal}] {btns} {{{','.join(map(str, joltages))}}}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _node_names(reserved: set[str]) -> Iterator[str]:
+    """Yield ``aaa``, ``aab``, ... then longer names, skipping ``reserved``.
+
+    A counter written in base 26, at least three letters long, so there are
+    as many names as any scale needs.
+    """
+    for n in count():
+        letters = []
+        while n or len(letters) < 3:
+            n, digit = divmod(n, 26)
+            letters.append(string.ascii_lowercase[digit])
+
+        name = "".join(reversed(letters))
+        if name not in reserved:
+            yield name
+
+
+@generator(2025, 11)
+def day11(scale: int, rng: random.Random) -> str:
+    """Device graph: a layered DAG from svr through dac and fft to out.
+
+    The first node of every layer links to the first node of the next, so
+    at least one path goes svr -> dac -> fft -> out. ``you`` sits a few
+    layers before ``out`` so that enumerating its paths in Part 1 stays
+    tractable.
+    """
+    n_layers = 24
+    width = 25 * scale
+    names = _node_names({"svr", "you", "fft", "dac", "out"})
+
+    layers = [["svr"]]
+    for k in range(1, n_layers):
+        layers.append([next(names) for _ in range(width)])
+    layers.append(["out"])
+
+    layers[8][0] = "dac"
+    layers[16][0] = "fft"
+    layers[n_layers - 4][0] = "you"
+
+    lines = []
+    for k, layer in enumerate(layers[:-1]):
+        targets = layers[k + 1] + (layers[k + 2] if k + 2 < n_layers else [])
+        for i, node in enumerate(layer):
+            outs = rng.sample(targets, min(len(targets), rng.randint(1, 3)))
+            if i == 0 and layers[k + 1][0] not in outs:
+                outs.append(layers[k + 1][0])
+            lines.append(f"{node}: {' '.join(outs)}")
+
+    rng.shuffle(lines)
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(2025, 12)
+def day12(scale: int, rng: random.Random) -> str:
+    """Present shapes in 3x3 boxes, then regions and the presents for each."""
+    shapes = []
+
+    for i in range(6):
+        cells = [["#" if rng.random() < 0.7 else "." for _ in range(3)]
+                 for _ in range(3)]
+        cells[1][1] = "#"
+        shapes.append(f"{i}:\n" + "\n".join("".join(row) for row in cells))
+
+    regions = []
+    for _ in range(1000 * scale):
+        width, height = rng.randint(35, 50), rng.randint(35, 50)
+        counts = " ".join(str(rng.randint(15, 40)) for _ in range(6))
+        regions.append(f"{width}x{height}: {counts}")
+
+    return "\n\n".join(shapes) + "\n\n" + "\n".join(regions) + "\n"
@@ -0,0 +1,257 @@
+"""Compact 2D character maps.
+
+A ``Grid`` stores a map as one byte per cell in a flat ``bytearray`` with a
+one cell border of padding around it. The same memory is also exposed as a
+2D ``numpy.uint8`` array, so a solution can use whichever fits:
+
+* Scalar loops (BFS, simulations) index ``grid.data`` with flat indices and
+  step with the precomputed ``grid.offsets4`` / ``grid.offsets8``. The padded
+  border means a neighbor of an in-map cell is always a valid index, so there
+  is no bounds checking; pick a ``pad`` character that the loop treats as a
+  wall.
+* Whole-map operations (find, count, masks, neighbor counts) work on the
+  ``grid.inner`` array view without Python loops.
+
+Cells hold character codes, so compare against ``ord("#")`` etc.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import numpy as np
+
+
+Point = tuple[int, int]
+
+# (di, dj) of the orthogonal neighbors, clockwise from up
+DIRS4 = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+# (di, dj) of all eight neighbors, clockwise from up
+DIRS8 = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+
+class Grid:
+    """A 2D map of single byte characters with a padded border.
+
+    Attributes
+    ----------
+    nrows : int
+        Number of rows, not counting the border.
+    ncols : int
+        Number of columns, not counting the border.
+    pad : str
+        Character in the border cells.
+    width : int
+        Row stride of the padded map, ``ncols + 2``.
+    data : bytearray
+        Padded map in row-major order. Index it with ``index()``.
+    array : numpy.ndarray
+        2D uint8 view of ``data``, border included.
+    inner : numpy.ndarray
+        2D uint8 view of ``data`` without the border.
+    offsets4 : tuple[int, ...]
+        Flat index offsets of ``DIRS4``.
+    offsets8 : tuple[int, ...]
+        Flat index offsets of ``DIRS8``.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[str | Sequence[str]],
+        pad: str = "#",
+    ) -> None:
+        """Build a grid from its rows.
+
+        Parameters
+        ----------
+        rows : Iterable[str | Sequence[str]]
+            Rows of the map, as strings or lists of characters. All rows must
+            have the same length.
+        pad : str, optional
+            Character of the border cells. Default is '#'.
+
+        Raises
+        ------
+        ValueError
+            The rows are empty or have different lengths.
+        """
+        rows = [row if isinstance(row, str) else "".join(row) for row in rows]
+
+        if not rows or any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("rows must be non-empty and of equal length")
+
+        ncols = len(rows[0])
+        border = pad * (ncols + 2)
+        text = border + "".join(pad + row + pad for row in rows) + border
+
+        self._setup(bytearray(text, "ascii"), len(rows), ncols, pad)
+
+    def _setup(
+        self,
+        data: bytearray,
+        nrows: int,
+        ncols: int,
+        pad: str,
+    ) -> None:
+        """Set the attributes shared by every constructor."""
+        self.nrows = nrows
+        self.ncols = ncols
+        self.pad = pad
+        self.width = width = ncols + 2
+        self.data = data
+        self.array = np.frombuffer(data, dtype=np.uint8).reshape(
+            nrows + 2, width)
+        self.inner = self.array[1:-1, 1:-1]
+        self.offsets4 = tuple(di * width + dj for di, dj in DIRS4)
+        self.offsets8 = tuple(di * width + dj for di, dj in DIRS8)
+
+    @classmethod
+    def from_file(cls, f_path: str | Path, pad: str = "#") -> Grid:
+        """Read a grid from a text file, skipping blank lines."""
+        return cls.from_text(Path(f_path).read_text(encoding="utf-8"), pad)
+
+    @classmethod
+    def from_text(cls, text: str, pad: str = "#") -> Grid:
+        """Build a grid from text, skipping blank lines."""
+        return cls([x for x in text.splitlines() if x], pad)
+
+    @classmethod
+    def filled(
+        cls,
+        nrows: int,
+        ncols: int,
+        char: str = ".",
+        pad: str = "#",
+    ) -> Grid:
+        """Return a grid with every cell set to ``char``."""
+        return cls([char * ncols] * nrows, pad)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Return the number of rows and columns, not counting the border."""
+        return self.nrows, self.ncols
+
+    def index(self, row: int, col: int) -> int:
+        """Return the flat index of a cell."""
+        return (row + 1) * self.width + col + 1
+
+    def point(self, idx: int) -> Point:
+        """Return the (row, col) of a flat index."""
+        row, col = divmod(idx, self.width)
+        return row - 1, col - 1
+
+    def find(self, char: str) -> list[Point]:
+        """Return the (row, col) of every cell holding ``char``."""
+        rows, cols = np.nonzero(self.inner == ord(char))
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def find_one(self, char: str) -> Point | None:
+        """Return the (row, col) of the first cell holding ``char``."""
+        hits = np.flatnonzero(self.inner == ord(char))
+
+        if not hits.size:
+            return None
+
+        return divmod(int(hits[0]), self.ncols)
+
+    def count(self, char: str) -> int:
+        """Return the number of cells holding ``char``."""
+        return int(np.count_nonzero(self.inner == ord(char)))
+
+    def mask(self, char: str) -> np.ndarray:
+        """Return a boolean array of the cells holding ``char``."""
+        return self.inner == ord(char)
+
+    def positions(self, ignore: str = ".") -> dict[str, list[Point]]:
+        """Return the (row, col) of every cell, grouped by character.
+
+        Parameters
+        ----------
+        ignore : str, optional
+            Characters to leave out. Default is '.'.
+
+        Returns
+        -------
+        dict[str, list[tuple[int, int]]]
+        """
+        counts = np.bincount(self.inner.ravel(), minlength=256)
+
+        return {
+            chr(code): self.find(chr(code))
+            for code in np.flatnonzero(counts).tolist()
+            if chr(code) not in ignore}
+
+    def neighbor_count(self, char: str, diagonal: bool = True) -> np.ndarray:
+        """Count the neighbors of every cell that hold ``char``.
+
+        Border cells count as neighbors, so ``char`` should differ from
+        ``pad``.
+
+        Parameters
+        ----------
+        char : str
+            Character to count.
+        diagonal : bool, optional
+            Count all eight neighbors instead of the four orthogonal ones.
+            Default is True.
+
+        Returns
+        -------
+        numpy.ndarray
+            uint8 array of shape ``(nrows, ncols)``.
+        """
+        hits = (self.array == ord(char)).view(np.uint8)
+        total = np.zeros(self.shape, dtype=np.uint8)
+        n, m = self.shape
+
+        for di, dj in DIRS8 if diagonal else DIRS4:
+            total += hits[1 + di:1 + di + n, 1 + dj:1 + dj + m]
+
+        return total
+
+    def lines(self) -> list[str]:
+        """Return the rows of the map as strings, without the border."""
+        return [row.tobytes().decode("ascii") for row in self.inner]
+
+    def copy(self) -> Grid:
+        """Return an independent copy of the grid."""
+        return _rebuild(
+            type(self), bytes(self.data), self.nrows, self.ncols, self.pad)
+
+    def __contains__(self, point: Point) -> bool:
+        return 0 <= point[0] < self.nrows and 0 <= point[1] < self.ncols
+
+    def __getitem__(self, point: Point) -> str:
+        return chr(self.data[self.index(*point)])
+
+    def __setitem__(self, point: Point, char: str) -> None:
+        self.data[self.index(*point)] = ord(char)
+
+    def __len__(self) -> int:
+        return self.nrows
+
+    def __reduce__(self) -> tuple:
+        # data and the numpy views share memory; copy and pickle them as one
+        return _rebuild, (
+            type(self), bytes(self.data), self.nrows, self.ncols, self.pad)
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines())
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.nrows}x{self.ncols}>"
+
+
+def _rebuild(
+    cls: type[Grid],
+    data: bytes,
+    nrows: int,
+    ncols: int,
+    pad: str,
+) -> Grid:
+    """Rebuild a grid from its padded bytes, for copying and pickling."""
+    grid = cls.__new__(cls)
+    grid._setup(bytearray(data), nrows, ncols, pad)
+
+    return grid
@@ -0,0 +1,189 @@
+"""Measure how long it takes to import each day's modules.
+
+Every module is imported in a fresh interpreter started with
+``python -X importtime``, from inside its day directory, and the report
+shows its total import time and the heaviest modules it pulled in. This is
+the cold start every ``batch`` worker pays before a day can run, so heavy
+libraries that only one part needs should be deferred with
+``aoc.lazy.lazy_import``.
+
+A few older days do their work at import time; their "import" time is their
+run time, which is a cold start cost all the same.
+
+Usage
+-----
+python -m aoc imports -y 2025           # every 2025 solution module
+python -m aoc imports --max-ms 200      # fail if any module takes longer
+"""
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+from aoc.discover import Day, find_days
+
+
+# Modules imported to load a day, by layout
+DAY_MODULES = {
+    "2023": ("main",),
+    "2024": ("p1", "p2"),
+    "2025": ("solution",),
+}
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+@dataclass
+class ImportTime:
+    """Import cost of one module.
+
+    Attributes
+    ----------
+    day : str
+        Day name, ``YYYY/DD``.
+    module : str
+        Module name.
+    total_ms : float
+        Time to import the module and everything it imports, in ms.
+    heaviest : list[tuple[str, float]]
+        Direct imports of the module and their cumulative ms, slowest first.
+    error : str | None
+        Why the module could not be measured.
+    """
+    day: str
+    module: str
+    total_ms: float = 0.0
+    heaviest: list[tuple[str, float]] = field(default_factory=list)
+    error: str | None = None
+
+
+def parse_importtime(text: str, module: str) -> tuple[float, list]:
+    """Read a module's cost out of ``-X importtime`` output.
+
+    Parameters
+    ----------
+    text : str
+        stderr of the interpreter.
+    module : str
+        Module that was imported.
+
+    Returns
+    -------
+    float
+        Cumulative ms of the module.
+    list[tuple[str, float]]
+        Its direct imports and their cumulative ms, slowest first.
+
+    Raises
+    ------
+    ValueError
+        The module is not in the output.
+    """
+    children = []
+
+    # Nested imports are listed before the module importing them, one level
+    # of indentation deeper
+    for line in text.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+
+        cumulative = int(match.group(2)) / 1000
+        depth = len(match.group(3)) // 2
+        name = match.group(4)
+
+        if depth == 0:
+            if name == module:
+                return cumulative, sorted(children, key=lambda x: -x[1])
+            children = []
+        elif depth == 1:
+            children.append((name, cumulative))
+
+    raise ValueError(f"no import of {module!r} found")
+
+
+def measure(day: Day, module: str, timeout: float = 60) -> ImportTime:
+    """Import a module of a day in a fresh interpreter and time it."""
+    result = ImportTime(day.name, module)
+
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=day.directory, capture_output=True, text=True,
+            timeout=timeout, check=False)
+    except subprocess.TimeoutExpired:
+        result.error = f"timed out after {timeout:g}s"
+        return result
+
+    try:
+        result.total_ms, result.heaviest = parse_importtime(
+            proc.stderr, module)
+    except ValueError:
+        lines = proc.stderr.strip().splitlines()
+        result.error = lines[-1] if lines else "no output"
+
+    return result
+
+
+def format_report(results: list[ImportTime], top: int = 3) -> str:
+    """Format import times as a plain text table, slowest first."""
+    header = ("day", "module", "ms", "heaviest imports")
+    rows = []
+
+    for res in sorted(results, key=lambda r: -r.total_ms):
+        detail = f"ERROR {res.error}" if res.error else ", ".join(
+            f"{name} {ms:.0f}" for name, ms in res.heaviest[:top])
+        rows.append((res.day, res.module, f"{res.total_ms:.1f}", detail))
+
+    widths = [
+        max(len(row[i]) for row in [header] + rows) for i in range(3)]
+
+    def fmt(row: tuple) -> str:
+        return "  ".join((
+            row[0].ljust(widths[0]), row[1].ljust(widths[1]),
+            row[2].rjust(widths[2]), row[3])).rstrip()
+
+    lines = [fmt(header), fmt(tuple("-" * w for w in widths) + ("-" * 16,))]
+    lines.extend(fmt(row) for row in rows)
+
+    return "\n".join(lines)
+
+
+def imports(args) -> int:
+    """Entry point for ``python -m aoc imports``."""
+    results = []
+
+    for day in find_days(args.year, args.day):
+        for module in DAY_MODULES[day.layout]:
+            if (day.directory / f"{module}.py").is_file():
+                results.append(measure(day, module, args.timeout))
+
+    print(format_report(results))
+
+    status = 0
+    if args.max_ms is not None:
+        slow = [r for r in results if r.total_ms > args.max_ms]
+        for res in slow:
+            print(f"{res.day} {res.module}: {res.total_ms:.1f} ms is over "
+                  f"{args.max_ms:g} ms")
+        status = 1 if slow else 0
+
+    return status
+
+
+def add_arguments(parser) -> None:
+    """Add the ``imports`` command line arguments to a parser."""
+    parser.add_argument(
+        "-y", "--year", type=int, action="append",
+        help="Only measure this year. May be repeated.")
+    parser.add_argument(
+        "-d", "--day", type=int, action="append",
+        help="Only measure this day of the month. May be repeated.")
+    parser.add_argument(
+        "--max-ms", type=float,
+        help="Exit non-zero if any module takes longer than this to import.")
+    parser.add_argument(
+        "--timeout", type=float, default=60,
+        help="Seconds to wait for each import. Default is 60.")
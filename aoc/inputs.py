@@ -0,0 +1,342 @@
+"""Run a day on a whole directory of inputs, loading it only once.
+
+Checking a solution against many inputs one ``python solution.py`` at a time
+pays for starting the interpreter and importing the day (and NumPy, ...) on
+every input. Here a day is loaded once per process and every input is fed
+through the same warm modules, each one parsed and solved on its own, with a
+fresh copy of the parsed input per part like ``run``. With ``-j`` the inputs
+are dealt out over a pool of worker processes, each loading the day once.
+
+Solutions must take their input as arguments for this to be correct: state
+kept in module globals or in a cache that outlives one input would leak from
+one input into the next (see ``aoc.memo`` for memoization bound to its
+input).
+
+The report has one row per input and the throughput in inputs per second,
+including the time to load the day.
+
+Usage
+-----
+python -m aoc inputs -y 2025 -d 11 inputs/           # one warm process
+python -m aoc inputs -y 2025 -d 11 inputs/ -j 4      # four workers
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc.batch import pool_context
+from aoc.discover import Day, find_days
+from aoc.runner import PhaseResult, run_phases
+
+
+@dataclass
+class InputResult:
+    """Outcome of every phase of a day on one input.
+
+    Attributes
+    ----------
+    day : str
+        Day name, ``YYYY/DD``.
+    input : str
+        Input file name.
+    phases : list[PhaseResult]
+        Results of the parse and part phases.
+    """
+    day: str
+    input: str
+    phases: list[PhaseResult] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every phase ran without raising."""
+        return all(res.ok for res in self.phases)
+
+    @property
+    def wall(self) -> float:
+        """Return the wall-clock seconds of all phases."""
+        return sum(res.wall for res in self.phases)
+
+
+@dataclass
+class InputsRun:
+    """All inputs of one day.
+
+    Attributes
+    ----------
+    day : str
+        Day name, ``YYYY/DD``.
+    results : list[InputResult]
+        One result per input, in input order.
+    setup : float
+        Seconds spent loading the day, summed over the processes.
+    elapsed : float
+        Wall-clock seconds from start to end, setup included.
+    """
+    day: str
+    results: list[InputResult]
+    setup: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of inputs handled per second."""
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+
+def find_inputs(
+    day: Day,
+    directory: str | Path,
+    pattern: str = "*.txt",
+) -> list[Path]:
+    """Return the input files of a day, sorted by name.
+
+    Parameters
+    ----------
+    day : Day
+        Day the inputs are for.
+    directory : str | pathlib.Path
+        Directory of inputs. Relative paths are looked up in the day
+        directory.
+    pattern : str, optional
+        Glob pattern of the input files. Default is '*.txt'.
+
+    Returns
+    -------
+    list[pathlib.Path]
+        Empty if the directory does not exist.
+    """
+    path = day.input_path(str(directory))
+
+    return sorted(p for p in path.glob(pattern) if p.is_file())
+
+
+def run_inputs(
+    day: Day,
+    paths: list[Path],
+    parts: tuple[int, ...] = (1, 2),
+) -> tuple[float, list[InputResult]]:
+    """Load a day once and run it on every input in this process.
+
+    Parameters
+    ----------
+    day : Day
+        Day to run.
+    paths : list[pathlib.Path]
+        Input files.
+    parts : tuple[int, ...], optional
+        Parts to run. Default is both.
+
+    Returns
+    -------
+    float
+        Seconds spent loading the day.
+    list[InputResult]
+        One result per input, in the order of ``paths``.
+    """
+    results = [InputResult(day.name, path.name) for path in paths]
+
+    with day.context():
+        start = time.perf_counter()
+
+        try:
+            phases = day.load()
+        except Exception as exc:  # pylint: disable=broad-except
+            error = f"{type(exc).__name__}: {exc}"
+            for res in results:
+                res.phases = [PhaseResult(day.name, "import", error=error)]
+            return time.perf_counter() - start, results
+
+        setup = time.perf_counter() - start
+
+        for res, path in zip(results, paths):
+            res.phases = run_phases(day, phases, path, parts)
+
+    return setup, results
+
+
+def run_pool(
+    day: Day,
+    paths: list[Path],
+    parts: tuple[int, ...] = (1, 2),
+    jobs: int | None = None,
+) -> tuple[float, list[InputResult]]:
+    """Deal inputs out over worker processes that each load the day once.
+
+    Returns the same as ``run_inputs``, with the setup time summed over the
+    workers. A worker that dies fails its own inputs only.
+    """
+    jobs = min(jobs or os.cpu_count() or 1, len(paths)) or 1
+
+    # Round robin, so that inputs of similar size are spread evenly
+    chunks = [paths[i::jobs] for i in range(jobs)]
+    by_path: dict[Path, InputResult] = {}
+    setup = 0.0
+
+    with ProcessPoolExecutor(
+            max_workers=jobs, mp_context=pool_context()) as pool:
+        futures = [
+            (chunk, pool.submit(run_inputs, day, chunk, parts))
+            for chunk in chunks]
+
+        for chunk, future in futures:
+            try:
+                chunk_setup, chunk_results = future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                error = f"{type(exc).__name__}: {exc}"
+                chunk_results = [
+                    InputResult(day.name, path.name, [
+                        PhaseResult(day.name, "worker", error=error)])
+                    for path in chunk]
+                chunk_setup = 0.0
+
+            setup += chunk_setup
+            by_path.update(zip(chunk, chunk_results))
+
+    return setup, [by_path[path] for path in paths]
+
+
+def run_day_inputs(
+    day: Day,
+    paths: list[Path],
+    parts: tuple[int, ...] = (1, 2),
+    jobs: int | None = 1,
+) -> InputsRun:
+    """Run a day on many inputs, in this process if ``jobs`` is 1.
+
+    Parameters
+    ----------
+    day : Day
+        Day to run.
+    paths : list[pathlib.Path]
+        Input files.
+    parts : tuple[int, ...], optional
+        Parts to run. Default is both.
+    jobs : int | None, optional
+        Worker processes; 1 runs everything in this process and 0 or None
+        uses one per CPU. Default is 1.
+
+    Returns
+    -------
+    InputsRun
+    """
+    start = time.perf_counter()
+
+    if jobs == 1:
+        setup, results = run_inputs(day, paths, parts)
+    else:
+        setup, results = run_pool(day, paths, parts, jobs)
+
+    return InputsRun(day.name, results, setup, time.perf_counter() - start)
+
+
+def _cell(res: PhaseResult, width: int) -> str:
+    cell = f"ERROR {res.error}" if res.error else str(res.answer)
+
+    return cell if len(cell) <= width else cell[:width - 3] + "..."
+
+
+def format_report(run: InputsRun, width: int = 30) -> str:
+    """Format the results of a day on many inputs as a plain text table.
+
+    There is a column per part, and an ``error`` column if an input could
+    not be parsed (or the day loaded).
+    """
+    part_names = sorted({
+        res.phase for inp in run.results for res in inp.phases
+        if res.phase.startswith("part_")})
+    errors = [
+        next((res for res in inp.phases
+              if not res.ok and res.phase not in part_names), None)
+        for inp in run.results]
+
+    header = ("day", "input", "wall (s)", *part_names)
+    if any(errors):
+        header += ("error",)
+
+    rows = []
+
+    for inp, error in zip(run.results, errors):
+        by_phase = {res.phase: res for res in inp.phases}
+        cells = [
+            _cell(by_phase[name], width) if name in by_phase else ""
+            for name in part_names]
+
+        if len(header) > 3 + len(part_names):
+            cells.append("" if error is None else _cell(error, width * 2))
+
+        rows.append((inp.day, inp.input, f"{inp.wall:.4f}", *cells))
+
+    widths = [
+        max(len(row[i]) for row in [header] + rows)
+        for i in range(len(header))]
+
+    def fmt(row: tuple) -> str:
+        return "  ".join(
+            cell.rjust(w) if i == 2 else cell.ljust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))).rstrip()
+
+    lines = [fmt(header), "  ".join("-" * w for w in widths)]
+    lines.extend(fmt(row) for row in rows)
+
+    failed = sum(not inp.ok for inp in run.results)
+    lines.append(
+        f"{run.day}: {len(run.results)} input(s) in {run.elapsed:.2f}s "
+        f"(setup {run.setup:.2f}s), {run.throughput:.1f} inputs/s, "
+        f"{failed} failed")
+
+    return "\n".join(lines)
+
+
+def inputs(args) -> int:
+    """Entry point for ``python -m aoc inputs``."""
+    parts = tuple(args.part or (1, 2))
+    status = 0
+    found = False
+
+    for day in find_days(args.year, args.day):
+        paths = find_inputs(day, args.directory, args.pattern)
+        if not paths:
+            continue
+
+        found = True
+        run = run_day_inputs(day, paths, parts, args.jobs)
+
+        print(format_report(run))
+        print()
+
+        if not all(inp.ok for inp in run.results):
+            status = 1
+
+    if not found:
+        print(f"no inputs matching {args.pattern!r} in {args.directory}")
+        return 1
+
+    return status
+
+
+def add_arguments(parser) -> None:
+    """Add the ``inputs`` command line arguments to a parser."""
+    parser.add_argument(
+        "directory",
+        help="Directory of inputs, relative to each day directory or "
+             "absolute.")
+    parser.add_argument(
+        "-y", "--year", type=int, action="append",
+        help="Only run this year. May be repeated.")
+    parser.add_argument(
+        "-d", "--day", type=int, action="append",
+        help="Only run this day of the month. May be repeated.")
+    parser.add_argument(
+        "-p", "--part", type=int, action="append", choices=[1, 2],
+        help="Only run this part. May be repeated.")
+    parser.add_argument(
+        "--pattern", default="*.txt",
+        help="Glob pattern of the input files. Default is '*.txt'.")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="Number of worker processes, each loading the day once. "
+             "0 uses one per CPU. Default is 1: run in this process.")
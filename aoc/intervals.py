@@ -0,0 +1,247 @@
+"""Sets of integers stored as sorted, disjoint, inclusive intervals.
+
+Puzzle inputs describe huge sets of integers as ranges (``3-5``, ``10-14``,
+a seed range of a billion numbers). Materializing them does not fit in
+memory, and checking every number against every range is O(ranges x
+numbers). An ``IntervalSet`` keeps the ranges merged and sorted instead, in
+two parallel lists of starts and ends, so that:
+
+- building one from n ranges is a sort and a single merge pass,
+- membership is a binary search, O(log n), and ``contains_many`` answers a
+  whole array of numbers at once with NumPy,
+- union, intersection and difference are linear merges of two sets,
+- ``shift_map`` moves the parts inside mapped source ranges by an offset
+  (2023 Day 5's almanac maps) without visiting the numbers,
+- ``total`` is the number of integers in the set.
+
+Intervals are inclusive at both ends, like the puzzle inputs, and touching
+intervals are merged: ``{(1, 2), (3, 4)}`` is stored as ``(1, 4)``.
+
+Usage
+-----
+from aoc.intervals import IntervalSet
+
+fresh = IntervalSet([(3, 5), (10, 14), (16, 20), (12, 18)])
+fresh.total()          # 14
+17 in fresh            # True
+"""
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+Interval = tuple[int, int]
+
+
+class IntervalSet:
+    """A set of integers as sorted, disjoint, non-touching intervals.
+
+    Sets are not modified in place: every operation returns a new set.
+
+    Attributes
+    ----------
+    starts : list[int]
+        First integer of every interval, increasing.
+    ends : list[int]
+        Last integer of every interval; ``ends[k] + 1 < starts[k + 1]``.
+    """
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        """Build a set from inclusive intervals, in any order.
+
+        Overlapping and touching intervals are merged; empty ones (``start >
+        end``) are ignored.
+
+        Parameters
+        ----------
+        intervals : Iterable[tuple[int, int]], optional
+            ``(start, end)`` pairs. Default is the empty set.
+        """
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self._merge_sorted(sorted(iv for iv in intervals if iv[0] <= iv[1]))
+
+    def _merge_sorted(self, intervals: Iterable[Interval]) -> None:
+        """Append intervals sorted by start, merging as they come."""
+        starts, ends = self.starts, self.ends
+
+        for start, end in intervals:
+            if ends and start <= ends[-1] + 1:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+
+    @classmethod
+    def _from_lists(cls, starts: list[int], ends: list[int]) -> IntervalSet:
+        """Wrap lists that are already sorted, disjoint and not touching."""
+        new = cls.__new__(cls)
+        new.starts = starts
+        new.ends = ends
+        return new
+
+    # Queries
+
+    def __contains__(self, value: int) -> bool:
+        k = bisect_right(self.starts, value) - 1
+        return k >= 0 and value <= self.ends[k]
+
+    def contains_many(self, values: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Return which of many values are in the set, as a bool array.
+
+        Every value is located with one vectorized binary search; values and
+        bounds must fit in int64.
+        """
+        values = np.asarray(values, dtype=np.int64)
+
+        if not self.starts:
+            return np.zeros(values.shape, dtype=bool)
+
+        starts = np.array(self.starts, dtype=np.int64)
+        ends = np.array(self.ends, dtype=np.int64)
+        k = np.searchsorted(starts, values, side="right") - 1
+
+        return (k >= 0) & (values <= ends[np.maximum(k, 0)])
+
+    def total(self) -> int:
+        """Return the number of integers in the set."""
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def overlapping(self, start: int, end: int) -> list[Interval]:
+        """Return the parts of the set inside ``[start, end]``.
+
+        Finds the first overlapping interval with a binary search, so it
+        costs O(log n + k) for k intervals returned.
+        """
+        starts, ends = self.starts, self.ends
+        k = bisect_left(ends, start)
+        parts = []
+
+        while k < len(starts) and starts[k] <= end:
+            parts.append((max(starts[k], start), min(ends[k], end)))
+            k += 1
+
+        return parts
+
+    # Set algebra
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        """Return the integers in either set."""
+        merged = IntervalSet()
+        merged._merge_sorted(heapq.merge(self, other))
+        return merged
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        """Return the integers in both sets."""
+        a_starts, a_ends = self.starts, self.ends
+        b_starts, b_ends = other.starts, other.ends
+        starts, ends = [], []
+        i = j = 0
+
+        while i < len(a_starts) and j < len(b_starts):
+            lo = max(a_starts[i], b_starts[j])
+            hi = min(a_ends[i], b_ends[j])
+
+            if lo <= hi:
+                starts.append(lo)
+                ends.append(hi)
+
+            if a_ends[i] < b_ends[j]:
+                i += 1
+            else:
+                j += 1
+
+        # Pieces of different intervals of either set have a gap between
+        return IntervalSet._from_lists(starts, ends)
+
+    def difference(self, other: IntervalSet) -> IntervalSet:
+        """Return the integers in this set but not in the other."""
+        b_starts, b_ends = other.starts, other.ends
+        starts, ends = [], []
+        j = 0
+
+        for start, end in zip(self.starts, self.ends):
+            while j < len(b_starts) and b_ends[j] < start:
+                j += 1
+
+            curr = start
+            k = j
+            while k < len(b_starts) and b_starts[k] <= end:
+                if b_starts[k] > curr:
+                    starts.append(curr)
+                    ends.append(b_starts[k] - 1)
+                curr = max(curr, b_ends[k] + 1)
+                k += 1
+
+            if curr <= end:
+                starts.append(curr)
+                ends.append(end)
+
+        return IntervalSet._from_lists(starts, ends)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    # Mapping
+
+    def shift(self, offset: int) -> IntervalSet:
+        """Return the set with every integer moved by ``offset``."""
+        return IntervalSet._from_lists(
+            [s + offset for s in self.starts],
+            [e + offset for e in self.ends])
+
+    def shift_map(self, rules: Iterable[tuple[int, int, int]]) -> IntervalSet:
+        """Move the parts of the set inside source ranges by their offsets.
+
+        Integers outside every source range stay where they are.
+
+        Parameters
+        ----------
+        rules : Iterable[tuple[int, int, int]]
+            ``(start, end, offset)``: integers in ``[start, end]`` move by
+            ``offset``. Source ranges must not overlap.
+
+        Returns
+        -------
+        IntervalSet
+        """
+        rules = list(rules)
+        moved = [
+            (lo + offset, hi + offset)
+            for start, end, offset in rules
+            for lo, hi in self.overlapping(start, end)]
+        sources = IntervalSet((start, end) for start, end, _ in rules)
+        kept = self.difference(sources)
+
+        return IntervalSet(moved + list(kept))
+
+    # Container protocol
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self.starts, self.ends)
+
+    def __len__(self) -> int:
+        """Return the number of intervals, not of integers (see ``total``)."""
+        return len(self.starts)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self) -> str:
+        shown = ", ".join(f"({s}, {e})" for s, e in list(self)[:4])
+        more = ", ..." if len(self) > 4 else ""
+        return f"{type(self).__name__}([{shown}{more}])"
+
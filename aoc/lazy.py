@@ -0,0 +1,71 @@
+"""Deferred imports of heavy third-party modules.
+
+``lazy_import("shapely")`` returns a stand-in module right away; the real
+import happens the first time one of its attributes is used. Discovering,
+importing and running the parts of a day that do not need the library then
+costs nothing, and a missing optional dependency only fails the part that
+uses it.
+
+Usage
+-----
+from aoc.lazy import lazy_import
+
+z3 = lazy_import("z3")
+
+and refer to names through the module (``z3.Optimize()``), since
+``from z3 import Optimize`` would import it immediately.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from typing import Any
+
+
+class LazyModule(types.ModuleType):
+    """A module that imports itself on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_loaded"] = False
+
+    def _load(self) -> types.ModuleType:
+        """Import the real module and take over its namespace."""
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        self.__dict__["_lazy_loaded"] = True
+
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for names not already in the namespace
+        if self.__dict__["_lazy_loaded"]:
+            raise AttributeError(
+                f"module {self.__name__!r} has no attribute {attr!r}")
+
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_loaded"] else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Return a module, importing it only once it is used.
+
+    Modules that are already imported are returned as they are.
+
+    Parameters
+    ----------
+    name : str
+        Absolute module name, e.g. ``"shapely.prepared"``.
+
+    Returns
+    -------
+    types.ModuleType
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    return LazyModule(name)
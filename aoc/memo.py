@@ -0,0 +1,228 @@
+"""Memoization bound to one input at a time, with size bounds and stats.
+
+``functools.cache`` over a module global (``@cache def count(design)`` that
+reads ``patterns``) is only correct for the first input a process sees: a
+second input finds the first one's results. ``memoize`` instead takes the
+input as an ordinary argument. With ``scoped=True`` the first argument is
+the scope: it is left out of the cache key, and the cache is cleared
+whenever the function is called with a different scope object, so a batch
+of inputs in one process stays both correct and fast.
+
+The cache can be bounded by number of entries, by bytes, or both; the least
+recently used entries are evicted first. Bytes are estimated with
+``sys.getsizeof`` of the key and the value, which does not follow nested
+objects. Hits, misses and evictions are counted in ``stats``.
+
+Usage
+-----
+from aoc.memo import memoize
+
+@memoize(scoped=True)
+def count(patterns: list[str], design: str) -> int:
+    ...
+    return sum(count(patterns, design[len(p):]) for p in ...)
+"""
+from __future__ import annotations
+
+import functools
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+
+@dataclass
+class MemoStats:
+    """Counters of a memoized function since it was created or cleared.
+
+    A scoped function's entries are dropped when its input changes, but the
+    counters keep counting.
+
+    Attributes
+    ----------
+    hits : int
+        Calls answered from the cache.
+    misses : int
+        Calls that ran the function.
+    evictions : int
+        Entries dropped to stay within the bounds.
+    entries : int
+        Entries in the cache now.
+    nbytes : int
+        Estimated size of the cache now, in bytes.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    nbytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of calls answered from the cache."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+_NO_SCOPE = object()
+
+
+class Memo:
+    """A memoized function. Create with ``memoize``.
+
+    Parameters
+    ----------
+    func : Callable
+        Function to memoize. Its arguments must be hashable, except for the
+        scope.
+    max_entries : int | None, optional
+        Most entries to keep. Default is None: no limit.
+    max_bytes : int | None, optional
+        Most estimated bytes to keep. Default is None: no limit.
+    scoped : bool, optional
+        Treat the first argument as the input the cache belongs to. Default
+        is False.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        scoped: bool = False,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.scoped = scoped
+        self._bounded = max_entries is not None or max_bytes is not None
+        self._cache: dict[Hashable, Any] = {}
+        self._sizes: dict[Hashable, int] = {}
+        self._scope: Any = _NO_SCOPE if scoped else None
+        self._stats = MemoStats()
+
+    def __call__(self, *args, **kwargs) -> Any:
+        if self.scoped:
+            scope, key_args = args[0], args[1:]
+            if scope is not self._scope:
+                self._drop_entries()
+                self._scope = scope
+        else:
+            scope, key_args = self._scope, args
+
+        key = (key_args, tuple(kwargs.items())) if kwargs else key_args
+        cache = self._cache
+
+        try:
+            value = cache[key]
+        except KeyError:
+            pass
+        else:
+            self._stats.hits += 1
+            if self._bounded:
+                # Move to the back: dicts keep insertion order
+                del cache[key]
+                cache[key] = value
+            return value
+
+        self._stats.misses += 1
+        value = self.func(*args, **kwargs)
+
+        # A nested call with another scope has replaced this one's cache
+        if scope is not self._scope:
+            return value
+
+        cache[key] = value
+
+        if self._bounded:
+            size = sys.getsizeof(key) + sys.getsizeof(value)
+            self._sizes[key] = size
+            self._stats.nbytes += size
+            self._evict()
+
+        return value
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries until within the bounds."""
+        cache = self._cache
+
+        while cache and (
+                (self.max_entries is not None
+                 and len(cache) > self.max_entries)
+                or (self.max_bytes is not None
+                    and self._stats.nbytes > self.max_bytes)):
+            key = next(iter(cache))
+            del cache[key]
+            self._stats.nbytes -= self._sizes.pop(key)
+            self._stats.evictions += 1
+
+    @property
+    def stats(self) -> MemoStats:
+        """Return a copy of the counters."""
+        return MemoStats(
+            self._stats.hits, self._stats.misses, self._stats.evictions,
+            len(self._cache), self._stats.nbytes)
+
+    def _drop_entries(self) -> None:
+        self._cache.clear()
+        self._sizes.clear()
+        self._stats.nbytes = 0
+
+    def clear(self) -> None:
+        """Empty the cache, forget the scope and reset the counters."""
+        self._drop_entries()
+        self._scope = _NO_SCOPE if self.scoped else None
+        self._stats = MemoStats()
+
+    # functools.lru_cache compatible name
+    cache_clear = clear
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __repr__(self) -> str:
+        stats = self.stats
+        return (
+            f"<{type(self).__name__} {self.__qualname__} "
+            f"hits={stats.hits} misses={stats.misses} "
+            f"evictions={stats.evictions} entries={stats.entries}>")
+
+
+def memoize(
+    func: Callable | None = None,
+    *,
+    max_entries: int | None = None,
+    max_bytes: int | None = None,
+    scoped: bool = False,
+) -> Memo | Callable[[Callable], Memo]:
+    """Memoize a function, optionally bounded and scoped to its input.
+
+    Use as ``@memoize`` or ``@memoize(max_entries=..., scoped=True)``.
+
+    Parameters
+    ----------
+    func : Callable, optional
+        Function to memoize, when used without arguments.
+    max_entries : int | None, optional
+        Most entries to keep. Default is None: no limit.
+    max_bytes : int | None, optional
+        Most estimated bytes to keep. Default is None: no limit.
+    scoped : bool, optional
+        The first argument is the input the cache belongs to. It is not part
+        of the key and does not need to be hashable; calling with a
+        different object (by identity) clears the cache. Default is False.
+
+    Returns
+    -------
+    Memo | Callable[[Callable], Memo]
+        The memoized function, or a decorator making one.
+    """
+    def decorator(f: Callable) -> Memo:
+        return Memo(f, max_entries, max_bytes, scoped)
+
+    return decorator if func is None else decorator(func)
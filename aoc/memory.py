@@ -0,0 +1,389 @@
+"""Memory budget mode: peak memory and allocation hot spots of every phase.
+
+Each phase of a day is run once while two things are measured:
+
+* the peak resident set size (RSS) of the process. On Linux the kernel's
+  high-water mark is reset before every phase, so each phase gets its own
+  peak; elsewhere the peak can only grow over the run and is marked as such.
+  Either way the peak includes memory already in use when the phase
+  started, such as the parsed input.
+* in a second run under ``tracemalloc``, the peak of the memory allocated by
+  Python and the source lines holding the most of it. A watcher thread
+  snapshots the traced allocations every time they grow by half again, so
+  the reported sites are those of a snapshot within 1.5x of the peak.
+  Tracing is slow and memory hungry, which is why it does not share a run
+  with the RSS measurement; ``--top 0`` skips it.
+
+Any phase whose peak RSS is over its ceiling fails the run, so memory
+regressions are caught like slowdowns in ``bench``. Ceilings come from
+``--max-mb`` or a JSON budget file mapping ``"YYYY/DD"`` or
+``"YYYY/DD part_1"`` to MiB.
+
+Usage
+-----
+python -m aoc memory -y 2025 --max-mb 512
+python -m aoc memory --budget memory_budget.json --top 10
+"""
+from __future__ import annotations
+
+import copy
+import ctypes
+import ctypes.util
+import gc
+import json
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from aoc.discover import ROOT, Day, find_days
+from aoc.profiling import PeakSnapshots
+from aoc.runner import run_phase
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+_STATUS = Path("/proc/self/status")
+_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+MIB = 1024 ** 2
+
+# aoc modules that do the measuring; their allocations are not reported
+INSTRUMENTATION = ("cache", "memory", "profiling", "runner")
+
+
+@dataclass
+class PhaseMemory:
+    """Memory use of a single phase of a day.
+
+    Attributes
+    ----------
+    day : str
+        Day name, ``YYYY/DD``.
+    phase : str
+        ``parse``, ``part_1`` or ``part_2``.
+    peak_rss : int
+        Peak resident set size in bytes.
+    per_phase : bool
+        True if ``peak_rss`` covers only this phase, False if it is the
+        peak of the whole process so far.
+    traced_peak : int
+        Peak of the memory traced by ``tracemalloc`` in bytes, 0 if tracing
+        was off.
+    sites : list[tuple[str, int]]
+        ``file:line`` and bytes of the biggest allocation sites near the peak.
+    error : str | None
+        Exception summary if the phase failed.
+    """
+    day: str
+    phase: str
+    peak_rss: int = 0
+    per_phase: bool = False
+    traced_peak: int = 0
+    sites: list[tuple[str, int]] = field(default_factory=list)
+    error: str | None = None
+
+
+def peak_rss() -> int:
+    """Return the peak resident set size of the process in bytes."""
+    if _STATUS.is_file():
+        for line in _STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+
+    if resource is None:
+        return 0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _release_memory() -> None:
+    """Collect garbage and hand freed heap memory back to the OS (glibc)."""
+    gc.collect()
+
+    libc_name = ctypes.util.find_library("c")
+    if libc_name is None:
+        return
+
+    try:
+        ctypes.CDLL(libc_name).malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+def reset_peak_rss() -> bool:
+    """Reset the peak RSS to the current RSS, where the OS allows it.
+
+    Memory freed by earlier phases is released first, so it does not count
+    towards the next phase.
+
+    Returns
+    -------
+    bool
+        True if the peak was reset.
+    """
+    _release_memory()
+
+    try:
+        _CLEAR_REFS.write_text("5")
+    except OSError:
+        return False
+
+    return True
+
+
+def _sites(
+    snapshot: tracemalloc.Snapshot,
+    top: int,
+    min_size: int = 4096,
+) -> list[tuple]:
+    """Return the ``top`` source lines holding the most memory.
+
+    Lines holding less than ``min_size`` bytes are left out, and so are the
+    measuring tools themselves. Shared helpers such as ``aoc.search`` and
+    ``aoc.grid`` allocate on behalf of the solutions and are kept.
+    """
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        *(tracemalloc.Filter(False, str(ROOT / "aoc" / f"{name}.py"))
+          for name in INSTRUMENTATION),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ))
+
+    return [
+        (f"{Path(stat.traceback[0].filename).name}:"
+         f"{stat.traceback[0].lineno}", stat.size)
+        for stat in snapshot.statistics("lineno")[:top]
+        if stat.size >= min_size]
+
+
+@contextmanager
+def track_rss(usage: PhaseMemory) -> Iterator[None]:
+    """Record the peak RSS of the code it wraps in ``usage``."""
+    usage.per_phase = reset_peak_rss()
+
+    try:
+        yield
+    finally:
+        usage.peak_rss = peak_rss()
+
+
+@contextmanager
+def track_allocations(usage: PhaseMemory, top: int = 5) -> Iterator[None]:
+    """Record the traced peak and top allocation sites in ``usage``.
+
+    Parameters
+    ----------
+    usage : PhaseMemory
+        Filled in with the traced peak and allocation sites.
+    top : int, optional
+        Number of allocation sites to keep. Default is 5.
+    """
+    tracemalloc.start()
+    snaps = PeakSnapshots()
+
+    try:
+        with snaps:
+            yield
+    finally:
+        _, usage.traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        if snaps.snapshot is not None:
+            usage.sites = _sites(snaps.snapshot, top)
+
+
+def memory_day(
+    day: Day,
+    input_name: str = "input.txt",
+    parts: tuple[int, ...] = (1, 2),
+    top: int = 5,
+) -> list[PhaseMemory]:
+    """Measure the memory of every phase of a day.
+
+    Every phase runs once untraced for its peak RSS, then, if ``top`` is not
+    0, once more under ``tracemalloc`` for its allocation sites. Parts are
+    given a fresh copy of the parsed input for every run, copied from the
+    untouched parsed input before the measurement starts.
+
+    Parameters
+    ----------
+    day : Day
+        Day to measure.
+    input_name : str, optional
+        Input file name or path. Default is 'input.txt'.
+    parts : tuple[int, ...], optional
+        Parts to measure. Default is both.
+    top : int, optional
+        Allocation sites to report per phase. 0 turns tracing off. Default
+        is 5.
+
+    Returns
+    -------
+    list[PhaseMemory]
+        Empty if the day has no input file.
+    """
+    path = day.input_path(input_name)
+
+    if not path.is_file():
+        return []
+
+    results = []
+
+    with day.context():
+        try:
+            phases = day.load()
+        except Exception as exc:  # pylint: disable=broad-except
+            return [PhaseMemory(day.name, "import", error=repr(exc))]
+
+        def measure(name, func, make_args):
+            usage = PhaseMemory(day.name, name)
+            results.append(usage)
+
+            args = make_args()
+            with track_rss(usage):
+                result, value = run_phase(day, name, func, *args)
+            usage.error = result.error
+            del args
+
+            if top and result.ok:
+                # A fresh copy of the pristine input: the untraced run may
+                # have mutated its own (2025/04 part 2 empties the grid)
+                args = make_args()
+                with track_allocations(usage, top):
+                    run_phase(day, name, func, *args)
+
+            return value
+
+        inp = measure("parse", phases.parse, lambda: (path,))
+
+        if results[-1].error is not None:
+            return results
+
+        for n in parts:
+            if n in phases.parts:
+                measure(
+                    f"part_{n}", phases.parts[n],
+                    lambda: (copy.deepcopy(inp), path))
+
+    return results
+
+
+def load_budget(f_path: str | Path) -> dict[str, float]:
+    """Read ceilings in MiB, keyed by ``YYYY/DD`` or ``YYYY/DD phase``."""
+    return json.loads(Path(f_path).read_text(encoding="utf-8"))
+
+
+def ceiling(
+    usage: PhaseMemory,
+    budget: dict[str, float],
+    max_mb: float | None = None,
+) -> float | None:
+    """Return the ceiling of a phase in MiB, the most specific one first."""
+    for key in (f"{usage.day} {usage.phase}", usage.day):
+        if key in budget:
+            return budget[key]
+
+    return max_mb
+
+
+def format_report(results: list[PhaseMemory], sites: int = 3) -> str:
+    """Format memory use as a plain text table."""
+    header = ("day", "phase", "peak RSS (MiB)", "traced (MiB)", "top sites")
+    rows = []
+
+    for res in results:
+        if res.error:
+            detail = f"ERROR {res.error}"
+        else:
+            detail = ", ".join(
+                f"{site} {size / MIB:.1f}" for site, size in res.sites[:sites])
+
+        rss = f"{res.peak_rss / MIB:.1f}" + ("" if res.per_phase else "+")
+        rows.append((
+            res.day, res.phase, rss, f"{res.traced_peak / MIB:.1f}", detail))
+
+    widths = [
+        max(len(row[i]) for row in [header] + rows) for i in range(4)]
+
+    def fmt(row: tuple) -> str:
+        cells = [
+            cell.rjust(w) if i in (2, 3) else cell.ljust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))]
+        return "  ".join(cells + [row[4]]).rstrip()
+
+    lines = [fmt(header), fmt(tuple("-" * w for w in widths) + ("-" * 9,))]
+    lines.extend(fmt(row) for row in rows)
+
+    if any(not r.per_phase for r in results):
+        lines.append("+ peak of the whole process so far, not of the phase")
+
+    return "\n".join(lines)
+
+
+def memory(args) -> int:
+    """Entry point for ``python -m aoc memory``."""
+    budget = load_budget(args.budget) if args.budget else {}
+    results = []
+
+    for day in find_days(args.year, args.day):
+        results.extend(memory_day(
+            day, args.input, tuple(args.part or (1, 2)), args.top))
+
+    print(format_report(results))
+
+    status = 0 if all(r.error is None for r in results) else 1
+    over = []
+
+    for res in results:
+        limit = ceiling(res, budget, args.max_mb)
+        if limit is not None and res.peak_rss > limit * MIB:
+            over.append(
+                f"{res.day} {res.phase}: {res.peak_rss / MIB:.1f} MiB is "
+                f"over its {limit:g} MiB ceiling")
+
+    if over:
+        print(f"\n{len(over)} phase(s) over budget:")
+        for line in over:
+            print(f"  {line}")
+        status = 1
+
+    return status
+
+
+def add_arguments(parser) -> None:
+    """Add the ``memory`` command line arguments to a parser."""
+    parser.add_argument(
+        "-y", "--year", type=int, action="append",
+        help="Only measure this year. May be repeated.")
+    parser.add_argument(
+        "-d", "--day", type=int, action="append",
+        help="Only measure this day of the month. May be repeated.")
+    parser.add_argument(
+        "-p", "--part", type=int, action="append", choices=[1, 2],
+        help="Only measure this part. May be repeated.")
+    parser.add_argument(
+        "-i", "--input", default="input.txt",
+        help="Input file name, relative to each day directory. "
+             "Default is 'input.txt'.")
+    parser.add_argument(
+        "--max-mb", type=float,
+        help="Fail if any phase's peak RSS is over this many MiB.")
+    parser.add_argument(
+        "--budget",
+        help="JSON file of ceilings in MiB, keyed by 'YYYY/DD' or "
+             "'YYYY/DD part_N'. Takes precedence over --max-mb.")
+    parser.add_argument(
+        "--top", type=int, default=5,
+        help="Allocation sites to report per phase; 0 turns tracemalloc "
+             "off. Default is 5.")
@@ -0,0 +1,281 @@
+"""Opt-in profilers around the phases of a day.
+
+Three profilers are available:
+
+``cprofile``
+    Deterministic ``cProfile`` of every call. Writes ``<phase>.prof``, which
+    ``python -m pstats`` or snakeviz can read, and ``<phase>.stats.txt`` with
+    the top functions by cumulative time. Adds a lot of overhead to code
+    that makes many small calls.
+``sample``
+    A background thread records the stack of the running phase every few
+    milliseconds. Writes ``<phase>.collapsed``: one ``frame;frame;... count``
+    line per distinct stack, the input format of ``flamegraph.pl`` and
+    speedscope. Low overhead, but only sees Python frames.
+``tracemalloc``
+    Traces every allocation. Writes ``<phase>.memory.txt`` with the peak
+    traced memory and the lines holding the most memory in a snapshot
+    taken within 1.5x of that peak, and ``<phase>.snapshot`` (the same
+    snapshot) for ``tracemalloc.Snapshot.load``.
+
+Output goes to ``.aoc/profiles/YYYY/DD/``. Profiling is turned on with
+``--profile MODE`` on ``python -m aoc run`` / ``batch``, or by setting
+``AOC_PROFILE=MODE``. Timings of profiled runs include the profiler's
+overhead.
+"""
+from __future__ import annotations
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import ContextManager, Iterator
+
+from aoc.discover import STATE_DIR
+
+
+PROFILE_DIR = STATE_DIR / "profiles"
+
+# Set to one of MODES to profile every phase the runner runs
+PROFILE_ENV = "AOC_PROFILE"
+
+MODES = ("cprofile", "sample", "tracemalloc")
+
+
+def profile_mode() -> str | None:
+    """Return the profiler turned on for this process, if any.
+
+    Raises
+    ------
+    ValueError
+        ``AOC_PROFILE`` is set to an unknown mode.
+    """
+    mode = os.environ.get(PROFILE_ENV, "")
+
+    if not mode:
+        return None
+
+    if mode not in MODES:
+        raise ValueError(
+            f"{PROFILE_ENV} must be one of {', '.join(MODES)}, got {mode!r}")
+
+    return mode
+
+
+def enable_profiling(mode: str) -> None:
+    """Turn a profiler on for this process and its children."""
+    os.environ[PROFILE_ENV] = mode
+
+
+def output_dir(day_name: str) -> Path:
+    """Return the profile directory of a day (``YYYY/DD``)."""
+    return PROFILE_DIR.joinpath(*day_name.split("/"))
+
+
+class Sampler:
+    """Record the Python stack of a thread at a fixed interval.
+
+    Parameters
+    ----------
+    interval : float, optional
+        Seconds between samples. Default is 0.005.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.counts: Counter[str] = Counter()
+        self._target = threading.get_ident()
+        self._outer: list = []
+        self._outer_ids: set[int] = set()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        """Start sampling the calling thread."""
+        # Frames that exist now belong to the caller, not the profiled code.
+        # They are kept alive so that their ids cannot be reused.
+        frame = sys._getframe(1)  # pylint: disable=protected-access
+        while frame is not None:
+            self._outer.append(frame)
+            frame = frame.f_back
+        self._outer_ids = set(map(id, self._outer))
+
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+        self._outer.clear()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(  # pylint: disable=W0212
+                self._target)
+            stack = []
+
+            while frame is not None and id(frame) not in self._outer_ids:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({Path(code.co_filename).name}:"
+                    f"{code.co_firstlineno})")
+                frame = frame.f_back
+
+            # Skip the sample taken while the sampler itself is shutting down
+            if stack and not stack[-1].startswith("stop (profiling.py"):
+                self.counts[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Return the samples as collapsed stacks, most frequent first."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.counts.most_common())
+
+
+class PeakSnapshots:
+    """Snapshot traced allocations whenever they grow by ``factor``.
+
+    A watcher thread checks the traced memory every ``interval`` seconds,
+    so ``snapshot`` ends up within ``factor`` of the peak instead of being
+    whatever is left when the traced code returns. Must be used while
+    ``tracemalloc`` is tracing.
+    """
+
+    def __init__(self, factor: float = 1.5, interval: float = 0.01) -> None:
+        self.factor = factor
+        self.interval = interval
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self._size = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _take(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+
+        if self.snapshot is None or current > self._size * self.factor:
+            # Drop the old snapshot first, it can be as big as the new one
+            self.snapshot = None
+            self.snapshot = tracemalloc.take_snapshot()
+            self._size = current
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._take()
+
+    def __enter__(self) -> PeakSnapshots:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._take()
+
+
+def _out(base: Path, suffix: str) -> Path:
+    """Return an output file next to ``base``, e.g. ``part_1.prof``."""
+    return base.parent / f"{base.name}{suffix}"
+
+
+@contextmanager
+def _cprofile(base: Path) -> Iterator[None]:
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(_out(base, ".prof"))
+
+        out = io.StringIO()
+        stats = pstats.Stats(profiler, stream=out)
+        stats.sort_stats("cumulative").print_stats(30)
+        _out(base, ".stats.txt").write_text(
+            out.getvalue(), encoding="utf-8")
+
+
+@contextmanager
+def _sample(base: Path) -> Iterator[None]:
+    sampler = Sampler()
+    sampler.start()
+
+    try:
+        yield
+    finally:
+        sampler.stop()
+        _out(base, ".collapsed").write_text(
+            sampler.collapsed(), encoding="utf-8")
+
+
+@contextmanager
+def _tracemalloc(base: Path, top: int = 20) -> Iterator[None]:
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+
+    snaps = PeakSnapshots()
+
+    try:
+        with snaps:
+            yield
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        # Leave out the profiler's own allocations
+        snapshot = snaps.snapshot.filter_traces((
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+        if not already_tracing:
+            tracemalloc.stop()
+
+        snapshot.dump(str(_out(base, ".snapshot")))
+
+        lines = [f"peak traced memory: {peak / 1024 ** 2:,.1f} MiB", ""]
+        lines.append(f"top {top} lines by memory held near the peak:")
+        lines.extend(
+            f"  {stat}" for stat in snapshot.statistics("lineno")[:top])
+        _out(base, ".memory.txt").write_text(
+            "\n".join(lines) + "\n", encoding="utf-8")
+
+
+PROFILERS = {
+    "cprofile": _cprofile,
+    "sample": _sample,
+    "tracemalloc": _tracemalloc,
+}
+
+
+def profile_phase(day_name: str, phase: str) -> ContextManager:
+    """Profile a phase with the profiler turned on, if any.
+
+    Parameters
+    ----------
+    day_name : str
+        Day name, ``YYYY/DD``.
+    phase : str
+        Phase name, used as the output file name.
+
+    Returns
+    -------
+    ContextManager
+        Profiles the code it wraps, or does nothing if profiling is off.
+    """
+    mode = profile_mode()
+
+    if mode is None:
+        return nullcontext()
+
+    directory = output_dir(day_name)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    return PROFILERS[mode](directory / phase)
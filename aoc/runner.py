@@ -0,0 +1,403 @@
+"""Run the parse, part 1 and part 2 phases of each day and time them.
+
+Every phase is timed separately with both a wall clock
+(``time.perf_counter``) and the process CPU clock (``time.process_time``), so
+days that are waiting on something (I/O, a solver subprocess) stand out from
+days that are simply doing a lot of work.
+
+Anything a solution prints is captured. If a part returns None (several of
+them print their answer instead), the last line it printed is reported as the
+answer.
+
+Days that ran cleanly are remembered in the result cache (see ``aoc.cache``).
+Rerunning a day whose sources and input have not changed reports the stored
+answers and timings instead of running it again; those rows are marked with
+a ``*``. ``--no-cache`` always runs everything.
+"""
+from __future__ import annotations
+
+import copy
+import io
+import time
+import traceback
+from contextlib import redirect_stdout
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc.cache import DiskCache, enable_parse_cache, result_cache, result_key
+from aoc.discover import Day, Phases, find_days
+from aoc.profiling import MODES, PROFILE_DIR, enable_profiling, profile_phase
+
+
+@dataclass
+class PhaseResult:
+    """Timing and outcome of a single phase of a day.
+
+    Attributes
+    ----------
+    day : str
+        Day name, ``YYYY/DD``.
+    phase : str
+        ``parse``, ``part_1`` or ``part_2``.
+    wall : float
+        Elapsed wall-clock time in seconds.
+    cpu : float
+        Elapsed process CPU time in seconds.
+    answer : Any
+        Return value, or the last printed line if the phase returned None.
+    error : str | None
+        Exception summary if the phase failed.
+    cached : bool
+        True if the result was served from the result cache.
+    """
+    day: str
+    phase: str
+    wall: float = 0.0
+    cpu: float = 0.0
+    answer: Any = None
+    error: str | None = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the phase ran without raising."""
+        return self.error is None
+
+
+def timed(func: Callable, *args: Any) -> tuple[Any, float, float, str]:
+    """Call a function and measure it.
+
+    Parameters
+    ----------
+    func : Callable
+        Function to call.
+    *args : Any
+        Positional arguments for the function.
+
+    Returns
+    -------
+    Any
+        Return value of the function.
+    float
+        Wall-clock seconds.
+    float
+        CPU seconds.
+    str
+        Everything the function printed.
+    """
+    out = io.StringIO()
+
+    with redirect_stdout(out):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        value = func(*args)
+
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+
+    return value, wall, cpu, out.getvalue()
+
+
+def _answer(value: Any, printed: str) -> Any:
+    """Return the value, falling back to the last printed line."""
+    if value is not None:
+        return value
+
+    lines = [line for line in printed.splitlines() if line.strip()]
+
+    return lines[-1].strip() if lines else None
+
+
+def describe(inp: Any) -> str:
+    """Return a short description of a parsed input, e.g. ``list[140]``."""
+    name = type(inp).__name__
+
+    if isinstance(inp, tuple):
+        return f"({', '.join(describe(x) for x in inp)})"
+
+    try:
+        return f"{name}[{len(inp)}]"
+    except TypeError:
+        return name
+
+
+def _error(exc: BaseException) -> str:
+    """Return a one line summary of an exception."""
+    frame = traceback.extract_tb(exc.__traceback__)[-1]
+    where = f"{Path(frame.filename).name}:{frame.lineno}"
+
+    return f"{type(exc).__name__}: {exc} ({where})"
+
+
+def run_phase(
+    day: Day,
+    phase: str,
+    func: Callable,
+    *args: Any,
+) -> tuple[PhaseResult, Any]:
+    """Run one phase and record the result.
+
+    Returns
+    -------
+    PhaseResult
+    Any
+        Return value of the phase, or None if it failed.
+    """
+    result = PhaseResult(day.name, phase)
+
+    try:
+        with profile_phase(day.name, phase):
+            value, result.wall, result.cpu, printed = timed(func, *args)
+    except Exception as exc:  # pylint: disable=broad-except
+        result.error = _error(exc)
+        return result, None
+
+    result.answer = _answer(value, printed)
+
+    return result, value
+
+
+def run_phases(
+    day: Day,
+    phases: Phases,
+    path: Path,
+    parts: tuple[int, ...] = (1, 2),
+) -> list[PhaseResult]:
+    """Parse an input and run the parts of a loaded day on it.
+
+    Must be called from inside ``Day.context()``. Each part gets its own
+    copy of the parsed input, since several parts modify their input in
+    place.
+
+    Parameters
+    ----------
+    day : Day
+        Day the phases belong to.
+    phases : Phases
+        Phases returned by ``Day.load()``.
+    path : pathlib.Path
+        Input file.
+    parts : tuple[int, ...], optional
+        Parts to run. Default is both.
+
+    Returns
+    -------
+    list[PhaseResult]
+        The parse phase, then the parts; only the parse phase if it failed.
+    """
+    result, inp = run_phase(day, "parse", phases.parse, path)
+    result.answer = describe(inp)
+    results = [result]
+
+    if not result.ok:
+        return results
+
+    for n in parts:
+        if n not in phases.parts:
+            continue
+
+        result, _ = run_phase(
+            day, f"part_{n}", phases.parts[n], copy.deepcopy(inp), path)
+        results.append(result)
+
+    return results
+
+
+def _cached_results(
+    day: Day,
+    parts: tuple[int, ...],
+    cache: DiskCache,
+    key: str,
+) -> list[PhaseResult] | None:
+    """Return the stored results of a day, None unless every phase is there.
+    """
+    hit, stored = cache.get(key)
+    wanted = ["parse"] + [f"part_{n}" for n in parts if n in day.parts]
+
+    if not hit or any(phase not in stored for phase in wanted):
+        return None
+
+    return [replace(stored[phase], cached=True) for phase in wanted]
+
+
+def _store_results(
+    results: list[PhaseResult],
+    cache: DiskCache,
+    key: str,
+) -> None:
+    """Add the results of a clean run of a day to the result cache."""
+    if not all(r.ok for r in results):
+        return
+
+    _, stored = cache.get(key)
+    stored = stored or {}
+    stored.update((r.phase, r) for r in results)
+
+    try:
+        cache.put(key, stored)
+    except Exception:  # pylint: disable=broad-except
+        # Answers that cannot be pickled are simply not cached
+        pass
+
+
+def run_day(
+    day: Day,
+    input_name: str = "input.txt",
+    parts: tuple[int, ...] = (1, 2),
+    cache: DiskCache | None = None,
+) -> list[PhaseResult]:
+    """Run every phase of a day.
+
+    Parameters
+    ----------
+    day : Day
+        Day to run.
+    input_name : str, optional
+        Input file name or path. Relative names are looked up in the day
+        directory. Default is 'input.txt'.
+    parts : tuple[int, ...], optional
+        Parts to run. Default is both.
+    cache : DiskCache, optional
+        Result cache to serve unchanged days from and store clean runs in.
+        Default is None: always run.
+
+    Returns
+    -------
+    list[PhaseResult]
+    """
+    path = day.input_path(input_name)
+
+    if not path.is_file():
+        return [PhaseResult(day.name, "skip", answer=f"no {input_name}")]
+
+    if cache is not None:
+        key = result_key(day, path)
+        cached = _cached_results(day, parts, cache, key)
+
+        if cached is not None:
+            return cached
+
+    with day.context():
+        try:
+            phases = day.load()
+        except Exception as exc:  # pylint: disable=broad-except
+            return [PhaseResult(day.name, "import", error=_error(exc))]
+
+        results = run_phases(day, phases, path, parts)
+
+    if cache is not None:
+        _store_results(results, cache, key)
+
+    return results
+
+
+def format_table(results: list[PhaseResult], width: int = 40) -> str:
+    """Format phase results as a plain text table.
+
+    Parameters
+    ----------
+    results : list[PhaseResult]
+        Results to format.
+    width : int, optional
+        Maximum width of the answer column. Default is 40.
+
+    Returns
+    -------
+    str
+    """
+    header = ("day", "phase", "wall (s)", "cpu (s)", "answer")
+    rows = []
+
+    for res in results:
+        answer = f"ERROR {res.error}" if res.error else str(res.answer)
+
+        if len(answer) > width:
+            answer = answer[:width - 3] + "..."
+
+        rows.append((
+            res.day, res.phase + ("*" if res.cached else ""),
+            f"{res.wall:.4f}", f"{res.cpu:.4f}", answer))
+
+    widths = [
+        max(len(str(row[i])) for row in [header] + rows)
+        for i in range(len(header))]
+
+    def fmt(row: tuple) -> str:
+        cells = [
+            str(cell).rjust(w) if i in (2, 3) else str(cell).ljust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))]
+        return "  ".join(cells).rstrip()
+
+    lines = [fmt(header), "  ".join("-" * w for w in widths)]
+    lines.extend(fmt(row) for row in rows)
+
+    total_wall = sum(r.wall for r in results)
+    total_cpu = sum(r.cpu for r in results)
+    lines.append(
+        f"total: {total_wall:.4f}s wall, {total_cpu:.4f}s cpu "
+        f"over {len(results)} phases")
+
+    n_cached = sum(r.cached for r in results)
+    if n_cached:
+        lines.append(
+            f"* {n_cached} phase(s) served from the result cache "
+            "(--no-cache to rerun)")
+
+    return "\n".join(lines)
+
+
+def run(args) -> int:
+    """Entry point for ``python -m aoc run``."""
+    if args.parse_cache:
+        enable_parse_cache()
+
+    if args.profile:
+        enable_profiling(args.profile)
+
+    results = []
+
+    # Profiling needs the phases to actually run
+    cache = None if args.no_cache or args.profile else result_cache
+
+    for day in find_days(args.year, args.day):
+        results.extend(run_day(
+            day, args.input, tuple(args.part or (1, 2)), cache))
+
+    print(format_table(results))
+
+    if args.profile:
+        print(f"\n{args.profile} profiles written to {PROFILE_DIR}")
+
+    return 0 if all(r.ok for r in results) else 1
+
+
+def add_arguments(parser) -> None:
+    """Add the ``run`` command line arguments to a parser."""
+    parser.add_argument(
+        "-y", "--year", type=int, action="append",
+        help="Only run this year. May be repeated.")
+    parser.add_argument(
+        "-d", "--day", type=int, action="append",
+        help="Only run this day of the month. May be repeated.")
+    parser.add_argument(
+        "-p", "--part", type=int, action="append", choices=[1, 2],
+        help="Only run this part. May be repeated.")
+    parser.add_argument(
+        "-i", "--input", default="input.txt",
+        help="Input file name, relative to each day directory. "
+             "Default is 'input.txt'.")
+    parser.add_argument(
+        "--parse-cache", action="store_true",
+        help="Load parsed inputs from the on-disk cache where a day "
+             "supports it. Same as setting AOC_PARSE_CACHE=1.")
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Run every day, even if its sources and input are unchanged "
+             "since a cached run.")
+    parser.add_argument(
+        "--profile", choices=MODES,
+        help="Profile every phase and write the results under "
+             f"{PROFILE_DIR}. Same as setting AOC_PROFILE. Implies "
+             "--no-cache.")
@@ -0,0 +1,387 @@
+"""Breadth-first, Dijkstra and A* search over integer-encoded states.
+
+States are plain ints so they hash fast and fit in flat lookup tables: a
+grid cell is its flat ``Grid`` index, a cell plus a heading is
+``index * 4 + heading`` (see ``StateCodec``), a set of lights is a bitmask.
+
+Every search takes the start state(s), a ``neighbors`` function and an
+optional ``goal``, and returns a ``SearchResult`` with the cost of every
+settled state and its predecessors. Searches stop as soon as a goal state is
+settled.
+
+Pass a ``SearchStats`` to see how much work a search did. The counters are
+plain local ints inside the loop and are only written to the stats object
+once the search ends, so they are cheap enough to leave on.
+"""
+from __future__ import annotations
+
+import heapq
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+
+State = int
+
+Goal = Callable[[State], bool] | State | None
+
+
+@dataclass
+class SearchResult:
+    """Costs and predecessors found by a search.
+
+    Attributes
+    ----------
+    dist : dict[int, int]
+        Lowest known cost of every state reached. Final for every state the
+        search got past, not necessarily for states still in the frontier
+        when it stopped.
+    pred : dict[int, int]
+        The state each state was first reached from on a best path. Start
+        states have no entry.
+    preds : dict[int, list[int]]
+        Every state each state is reached from on a best path. Only filled
+        when the search is run with ``dag=True``.
+    goal : int or None
+        The goal state the search stopped at, None if no goal was reached.
+    goals : list[int]
+        Every goal state settled at the best cost. Only ``dag=True`` keeps
+        searching for more than one.
+    """
+    dist: dict[State, int] = field(default_factory=dict)
+    pred: dict[State, State] = field(default_factory=dict)
+    preds: dict[State, list[State]] = field(default_factory=dict)
+    goal: State | None = None
+    goals: list[State] = field(default_factory=list)
+
+    @property
+    def cost(self) -> int | None:
+        """Return the cost of the goal, None if no goal was reached."""
+        return None if self.goal is None else self.dist[self.goal]
+
+    def path(self, state: State | None = None) -> list[State]:
+        """Return a best path from a start to ``state`` (default: the goal).
+
+        Returns an empty list if the state was not reached.
+        """
+        state = self.goal if state is None else state
+
+        if state is None or state not in self.dist:
+            return []
+
+        path = [state]
+        while state in self.pred:
+            state = self.pred[state]
+            path.append(state)
+
+        return path[::-1]
+
+    def on_best_paths(self, states: Iterable[State] | None = None) -> set:
+        """Return every state on any best path to ``states``.
+
+        ``states`` defaults to the goals. Needs ``dag=True`` to see more than
+        one path.
+        """
+        seen = set(self.goals if states is None else states)
+        stack = list(seen)
+
+        while stack:
+            state = stack.pop()
+
+            if state in self.preds:
+                prevs = self.preds[state]
+            elif state in self.pred:
+                prevs = (self.pred[state],)
+            else:
+                continue
+
+            for prev in prevs:
+                if prev not in seen:
+                    seen.add(prev)
+                    stack.append(prev)
+
+        return seen
+
+
+@dataclass
+class SearchStats:
+    """Work done by one or more searches.
+
+    Passing the same object to several searches adds their counts up; the
+    peaks are the largest of any single search.
+
+    Attributes
+    ----------
+    searches : int
+        Number of searches run.
+    expansions : int
+        States taken off the frontier and expanded.
+    pushes : int
+        States added to the frontier, starts included.
+    duplicate_skips : int
+        Neighbors (BFS) or popped entries (Dijkstra) skipped because the
+        state had already been reached more cheaply.
+    peak_frontier : int
+        Largest frontier size.
+    visited_bytes : int
+        Approximate memory of the visited/cost/predecessor tables, in bytes.
+        Counts the containers, not the int objects in them.
+    """
+    searches: int = 0
+    expansions: int = 0
+    pushes: int = 0
+    duplicate_skips: int = 0
+    peak_frontier: int = 0
+    visited_bytes: int = 0
+
+    def add(
+        self,
+        expansions: int,
+        pushes: int,
+        duplicate_skips: int,
+        peak_frontier: int,
+        tables: Iterable,
+    ) -> None:
+        """Add the counts of a finished search."""
+        self.searches += 1
+        self.expansions += expansions
+        self.pushes += pushes
+        self.duplicate_skips += duplicate_skips
+        self.peak_frontier = max(self.peak_frontier, peak_frontier)
+        self.visited_bytes = max(
+            self.visited_bytes, sum(map(sys.getsizeof, tables)))
+
+    def __str__(self) -> str:
+        return (
+            f"{self.searches} search(es): {self.expansions:,} expanded, "
+            f"{self.pushes:,} pushed, {self.duplicate_skips:,} duplicates "
+            f"skipped, peak frontier {self.peak_frontier:,}, "
+            f"visited ~{self.visited_bytes / 1024:,.0f} KiB")
+
+
+class StateCodec:
+    """Pack tuples of bounded non-negative ints into one int and back.
+
+    Parameters
+    ----------
+    *sizes : int
+        Number of values of each field, e.g. ``StateCodec(n_cells, 4)`` for
+        a cell and a heading.
+    """
+
+    def __init__(self, *sizes: int) -> None:
+        self.sizes = sizes
+
+    def encode(self, *values: int) -> State:
+        """Pack one value per field into a state."""
+        state = 0
+        for value, size in zip(values, self.sizes):
+            state = state * size + value
+
+        return state
+
+    def decode(self, state: State) -> tuple[int, ...]:
+        """Unpack a state into its fields."""
+        values = []
+        for size in reversed(self.sizes[1:]):
+            state, value = divmod(state, size)
+            values.append(value)
+        values.append(state)
+
+        return tuple(values[::-1])
+
+
+def _goal_test(goal: Goal) -> tuple[State | None, Callable | None]:
+    """Split a goal into a target state and a goal predicate.
+
+    Comparing against a single target state is much cheaper than calling a
+    predicate for every state, so it is kept separate.
+    """
+    if goal is None or callable(goal):
+        return None, goal
+
+    return goal, None
+
+
+def _starts(start: State | Iterable[State]) -> list[State]:
+    """Accept a single start state or several."""
+    return [start] if isinstance(start, int) else list(start)
+
+
+def bfs(
+    start: State | Iterable[State],
+    neighbors: Callable[[State], Iterable[State]],
+    goal: Goal = None,
+    dag: bool = False,
+    stats: SearchStats | None = None,
+) -> SearchResult:
+    """Breadth-first search: every move costs 1.
+
+    Parameters
+    ----------
+    start : int | Iterable[int]
+        Start state, or several start states at cost 0.
+    neighbors : Callable[[int], Iterable[int]]
+        Returns the states one move away from a state.
+    goal : int | Callable[[int], bool], optional
+        Goal state or goal test. The search stops once a goal is dequeued.
+        Default is None: visit everything reachable.
+    dag : bool, optional
+        Keep every predecessor on a shortest path, not only the first.
+        Default is False.
+    stats : SearchStats, optional
+        Counters to add this search's work to. Default is None.
+
+    Returns
+    -------
+    SearchResult
+    """
+    target, is_goal = _goal_test(goal)
+    result = SearchResult()
+    dist, pred, preds = result.dist, result.pred, result.preds
+
+    queue = deque()
+    for state in _starts(start):
+        if state not in dist:
+            dist[state] = 0
+            queue.append(state)
+
+    popleft, append = queue.popleft, queue.append
+    expansions = seen = 0
+    peak = len(queue)
+
+    while queue:
+        if len(queue) > peak:
+            peak = len(queue)
+
+        state = popleft()
+
+        if state == target or (is_goal is not None and is_goal(state)):
+            result.goal = state
+            result.goals.append(state)
+            break
+
+        expansions += 1
+        depth = dist[state] + 1
+
+        for nxt in neighbors(state):
+            seen += 1
+
+            if nxt not in dist:
+                dist[nxt] = depth
+                pred[nxt] = state
+                append(nxt)
+
+                if dag:
+                    preds[nxt] = [state]
+            elif dag and dist[nxt] == depth:
+                preds[nxt].append(state)
+
+    if stats is not None:
+        # Every state but the starts was pushed once, when first seen
+        stats.add(
+            expansions, len(dist), seen - len(pred), peak,
+            (dist, pred, preds))
+
+    return result
+
+
+def dijkstra(
+    start: State | Iterable[State],
+    neighbors: Callable[[State], Iterable[tuple[State, int]]],
+    goal: Goal = None,
+    heuristic: Callable[[State], int] | None = None,
+    dag: bool = False,
+    stats: SearchStats | None = None,
+) -> SearchResult:
+    """Lowest cost search with a binary heap; A* if given a heuristic.
+
+    Parameters
+    ----------
+    start : int | Iterable[int]
+        Start state, or several start states at cost 0.
+    neighbors : Callable[[int], Iterable[tuple[int, int]]]
+        Returns ``(state, move cost)`` pairs. Costs must not be negative.
+    goal : int | Callable[[int], bool], optional
+        Goal state or goal test. The search stops once a goal is settled.
+        Default is None: settle everything reachable.
+    heuristic : Callable[[int], int], optional
+        Lower bound of the remaining cost to a goal. Must be consistent
+        (never drop by more than the cost of a move) for the result to be
+        optimal. Default is None: plain Dijkstra.
+    dag : bool, optional
+        Keep every predecessor on a lowest cost path, not only the first, and
+        settle every goal state that ties with the best one. Default is False.
+    stats : SearchStats, optional
+        Counters to add this search's work to. Default is None.
+
+    Returns
+    -------
+    SearchResult
+    """
+    target, is_goal = _goal_test(goal)
+    result = SearchResult()
+    dist, pred, preds = result.dist, result.pred, result.preds
+    done = set()
+    heap = []
+    best = None
+
+    for state in _starts(start):
+        dist[state] = 0
+        heap.append((heuristic(state) if heuristic else 0, 0, state))
+    heapq.heapify(heap)
+
+    heappop, heappush = heapq.heappop, heapq.heappush
+    pushes = peak = len(heap)
+    skips = 0
+
+    while heap:
+        if len(heap) > peak:
+            peak = len(heap)
+
+        priority, cost, state = heappop(heap)
+
+        if state in done or cost > dist[state]:
+            skips += 1
+            continue
+
+        if best is not None and priority > best:
+            break
+
+        done.add(state)
+
+        if state == target or (is_goal is not None and is_goal(state)):
+            if result.goal is None:
+                result.goal = state
+                best = cost
+            result.goals.append(state)
+
+            if not dag:
+                break
+            continue
+
+        for nxt, step in neighbors(state):
+            new_cost = cost + step
+            known = dist.get(nxt)
+
+            if known is None or new_cost < known:
+                dist[nxt] = new_cost
+                pred[nxt] = state
+                pushes += 1
+                heappush(
+                    heap,
+                    (new_cost + heuristic(nxt) if heuristic else new_cost,
+                     new_cost, nxt))
+
+                if dag:
+                    preds[nxt] = [state]
+            elif dag and new_cost == known and nxt not in done:
+                preds[nxt].append(state)
+
+    if stats is not None:
+        stats.add(
+            len(done) - len(result.goals), pushes, skips, peak,
+            (dist, pred, preds, done))
+
+    return result
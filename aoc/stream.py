@@ -0,0 +1,125 @@
+"""Read inputs a line or a section at a time instead of all at once.
+
+``Path(f).read_text().split()`` holds the whole file as one string and then
+again as a list of lines. For days that handle each line on its own, a
+``Lines`` object can stand in for that list: it reads the file lazily every
+time it is iterated, so memory stays flat however big the input gets.
+
+``Lines`` and ``Sections`` are re-iterable (each loop reads the file again)
+and cheap to copy, so the runner's per-part copy of the parsed input costs
+nothing. They have no length and cannot be indexed; a solution that needs
+either should keep using a list.
+
+Usage
+-----
+from aoc.stream import Lines
+
+def parse_input(fname: str = 'input.txt') -> Lines:
+    return Lines(fname, lambda line: [int(x) for x in line.split()])
+"""
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+
+BUFFER_SIZE = 1024 ** 2
+
+
+def read_lines(f_path: str | Path, use_mmap: bool = False) -> Iterator[str]:
+    """Yield every line of a file, blank ones included, without newlines.
+
+    Parameters
+    ----------
+    f_path : str | pathlib.Path
+        Input file.
+    use_mmap : bool, optional
+        Memory-map the file instead of reading it through a buffer. Lets the
+        OS page the file in and out; mostly useful for files larger than
+        memory. Default is False.
+    """
+    if use_mmap:
+        with open(f_path, "rb") as f:
+            if not Path(f_path).stat().st_size:
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    yield line.decode("utf-8").rstrip("\r\n")
+        return
+
+    with open(f_path, encoding="utf-8", buffering=BUFFER_SIZE) as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+def iter_sections(lines: Iterable[str]) -> Iterator[list[str]]:
+    """Group lines into blank-line separated sections.
+
+    Runs of blank lines count as one separator; leading and trailing blank
+    lines make no empty sections.
+    """
+    section = []
+
+    for line in lines:
+        if line.strip():
+            section.append(line)
+        elif section:
+            yield section
+            section = []
+
+    if section:
+        yield section
+
+
+class Lines:
+    """The non-blank lines of a file, read lazily on every iteration.
+
+    Parameters
+    ----------
+    f_path : str | pathlib.Path
+        Input file.
+    func : Callable[[str], Any], optional
+        Applied to every line, e.g. ``int``. Default is None: yield the
+        lines as they are.
+    use_mmap : bool, optional
+        Memory-map the file. Default is False.
+    """
+
+    def __init__(
+        self,
+        f_path: str | Path,
+        func: Callable[[str], Any] | None = None,
+        use_mmap: bool = False,
+    ) -> None:
+        self.f_path = Path(f_path).resolve()
+        self.func = func
+        self.use_mmap = use_mmap
+
+    def __iter__(self) -> Iterator[Any]:
+        lines = (
+            line for line in read_lines(self.f_path, self.use_mmap)
+            if line.strip())
+
+        return lines if self.func is None else map(self.func, lines)
+
+    def __deepcopy__(self, memo: dict) -> Lines:
+        # Nothing is held in memory, so there is nothing to copy
+        return self
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.f_path.name!r})"
+
+
+class Sections(Lines):
+    """The blank-line separated sections of a file, read lazily.
+
+    Each section is a list of its lines; ``func`` is applied to whole
+    sections.
+    """
+
+    def __iter__(self) -> Iterator[Any]:
+        sections = iter_sections(read_lines(self.f_path, self.use_mmap))
+
+        return sections if self.func is None else map(self.func, sections)
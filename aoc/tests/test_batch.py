@@ -0,0 +1,99 @@
+"""Tests for the process-pool batch runner."""
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from aoc import batch, discover
+
+
+P1_2024 = '''
+from pathlib import Path
+
+
+def parse_input(fname='input.txt'):
+    return [int(x) for x in Path(fname).read_text().split()]
+
+
+def part1(nums):
+    return sum(nums)
+'''
+
+
+P2_2024 = '''
+from p1 import parse_input
+
+
+def part2(nums):
+    while True:
+        pass
+'''
+
+
+SOLUTION_2025 = '''
+from pathlib import Path
+
+
+class Solution:
+
+    @classmethod
+    def read_input(cls, f_path):
+        return Path(f_path).read_text().split()
+
+    @classmethod
+    def part_1(cls, inp):
+        return len(bytearray(2 * 1024 ** 3))
+'''
+
+
+def write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(text), encoding="utf-8")
+
+
+class TestBatch(unittest.TestCase):
+    """Tasks run in their day directory and within their limits."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+
+        write(root / "2024" / "03" / "p1.py", P1_2024)
+        write(root / "2024" / "03" / "p2.py", P2_2024)
+        write(root / "2024" / "03" / "input.txt", "1 2 3\n")
+        write(root / "2025" / "04" / "solution.py", SOLUTION_2025)
+        write(root / "2025" / "04" / "input.txt", "a b\n")
+
+        self.days = discover.find_days(root=root)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_make_tasks(self) -> None:
+        """Split tasks cover each part of each day once."""
+        tasks = batch.make_tasks(self.days, (1, 2), split_parts=True)
+
+        self.assertEqual(
+            [(t.day.name, t.parts) for t in tasks],
+            [("2024/03", (1,)), ("2024/03", (2,)), ("2025/04", (1,))])
+        self.assertEqual(len(batch.make_tasks(self.days)), 2)
+
+    def test_limits(self) -> None:
+        """A runaway part times out and a memory hog fails alone."""
+        tasks = batch.make_tasks(self.days, (1, 2), split_parts=True)
+        results = batch.run_batch(
+            tasks, jobs=2, time_limit=2, memory_mb=1024, use_cache=False)
+
+        self.assertEqual(
+            [(r.day, r.phase) for r in results],
+            [("2024/03", "parse"), ("2024/03", "part_1"),
+             ("2024/03", "timeout"), ("2025/04", "parse"),
+             ("2025/04", "part_1")])
+
+        self.assertEqual(results[1].answer, 6)
+        self.assertIn("time limit", results[2].error)
+        self.assertIn("MemoryError", results[4].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Tests for the benchmark statistics and baseline comparison."""
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc import bench, workloads
+
+
+class TestBench(unittest.TestCase):
+    """Percentiles, baselines and regression detection."""
+
+    def test_percentile(self) -> None:
+        """Percentiles interpolate between ranks."""
+        samples = [5.0, 1.0, 3.0, 2.0, 4.0]
+
+        self.assertEqual(bench.percentile(samples, 50), 3.0)
+        self.assertEqual(bench.percentile(samples, 100), 5.0)
+        self.assertAlmostEqual(bench.percentile(samples, 95), 4.8)
+        self.assertEqual(bench.percentile([7.0], 95), 7.0)
+
+    def test_compare(self) -> None:
+        """Only slowdowns over the threshold and the noise floor count."""
+        baseline = {
+            "2025/05": {
+                "parse": bench.PhaseStats(0.100, 0.1, 0.1, 5),
+                "part_1": bench.PhaseStats(0.100, 0.1, 0.1, 5),
+                "part_2": bench.PhaseStats(0.0001, 0.1, 0.1, 5),
+            },
+        }
+        current = [bench.DayBench("2025/05", {
+            "parse": bench.PhaseStats(0.105, 0.1, 0.1, 5),
+            "part_1": bench.PhaseStats(0.150, 0.1, 0.1, 5),
+            "part_2": bench.PhaseStats(0.0003, 0.1, 0.1, 5),
+        })]
+
+        regressions = bench.compare(baseline, current, threshold=10)
+
+        self.assertEqual([r.phase for r in regressions], ["part_1"])
+        self.assertAlmostEqual(regressions[0].slowdown, 50.0)
+
+    def test_baseline_round_trip(self) -> None:
+        """Saved baselines load back and merge with earlier days."""
+        with tempfile.TemporaryDirectory() as tmp:
+            f_path = Path(tmp) / "baseline.json"
+            stats = bench.PhaseStats(0.5, 0.6, 0.4, 3)
+
+            bench.save_baseline(
+                f_path, [bench.DayBench("2024/06", {"parse": stats})])
+            bench.save_baseline(
+                f_path, [bench.DayBench("2025/09", {"part_2": stats})])
+
+            loaded = bench.load_baseline(f_path)
+
+        self.assertEqual(loaded["2024/06"]["parse"], stats)
+        self.assertEqual(loaded["2025/09"]["part_2"], stats)
+
+    def test_workload(self) -> None:
+        """Workloads are timed per operation and reported as aoc/<name>."""
+        data = list(range(1000))
+
+        @bench.workload("sum")
+        def sums():
+            return {"sum": lambda: sum(data), "fail": lambda: data[2000]}
+
+        self.addCleanup(bench.WORKLOADS.pop, "sum")
+        result = bench.bench_workload("sum", repeats=3, warmup=0)
+
+        self.assertEqual(result.day, "aoc/sum")
+        self.assertEqual(result.phases["sum"].runs, 3)
+        self.assertIn("IndexError", result.errors["fail"])
+        self.assertIn("aoc/sum  sum", bench.format_results([result]))
+        self.assertIs(bench.WORKLOADS["intervals"], workloads.intervals)
+
+
+if __name__ == '__main__':
+    unittest.main()
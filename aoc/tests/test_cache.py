@@ -0,0 +1,117 @@
+"""Tests for the on-disk caches."""
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from aoc.cache import PARSE_CACHE_ENV, DiskCache, cached_parse
+
+
+class TestDiskCache(unittest.TestCase):
+    """Storing, loading and evicting entries."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_round_trip(self) -> None:
+        """Arrays are stored as .npz, anything else is pickled."""
+        arrays = {"a": np.arange(5), "b": np.ones((2, 2))}
+
+        self.assertEqual(self.cache.put("x", arrays).suffix, ".npz")
+        self.assertEqual(self.cache.put("y", [(1, 2)]).suffix, ".pkl")
+
+        hit, value = self.cache.get("x")
+        self.assertTrue(hit)
+        np.testing.assert_array_equal(value["a"], arrays["a"])
+        np.testing.assert_array_equal(value["b"], arrays["b"])
+        self.assertEqual(self.cache.get("y"), (True, [(1, 2)]))
+        self.assertEqual(self.cache.get("z"), (False, None))
+
+    def test_corrupt_entry(self) -> None:
+        """Unreadable entries are misses and get deleted."""
+        f_path = self.cache.put("x", [1])
+        f_path.write_bytes(b"not a pickle")
+
+        self.assertEqual(self.cache.get("x"), (False, None))
+        self.assertFalse(f_path.exists())
+
+    def test_evict_lru(self) -> None:
+        """The least recently used entries go first."""
+        for key in "abc":
+            f_path = self.cache.put(key, bytes(1000))
+            # Spread the modification times out, whatever the clock precision
+            stamp = time.time() - 100 + "abc".index(key)
+            os.utime(f_path, (stamp, stamp))
+
+        self.cache.get("a")
+        self.cache.max_bytes = 2 * Path(f_path).stat().st_size
+        self.cache.evict()
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertFalse(self.cache.get("b")[0])
+        self.assertTrue(self.cache.get("a")[0])
+        self.assertTrue(self.cache.get("c")[0])
+
+
+class TestCachedParse(unittest.TestCase):
+    """Keys follow the input content and the parser version."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(Path(self.tmp.name) / "cache")
+        self.input = Path(self.tmp.name) / "input.txt"
+        self.input.write_text("1\n2\n3\n", encoding="utf-8")
+        self.calls = 0
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def parser(self, version: str = "1"):
+        """Return a counting parser cached under ``version``."""
+        @cached_parse(version, cache=self.cache)
+        def parse_input(fname: str, scale: int = 1) -> list[int]:
+            self.calls += 1
+            text = Path(fname).read_text(encoding="utf-8")
+            return [int(x) * scale for x in text.split()]
+
+        return parse_input
+
+    def test_disabled(self) -> None:
+        """Without the opt-in the parser always runs."""
+        parse_input = self.parser()
+
+        with mock.patch.dict(os.environ, {PARSE_CACHE_ENV: "0"}):
+            parse_input(self.input)
+            parse_input(self.input)
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_hit_and_invalidation(self) -> None:
+        """Content, version and argument changes are misses."""
+        with mock.patch.dict(os.environ, {PARSE_CACHE_ENV: "1"}):
+            self.assertEqual(self.parser()(self.input), [1, 2, 3])
+            self.assertEqual(self.parser()(fname=self.input), [1, 2, 3])
+            self.assertEqual(self.calls, 1)
+
+            self.assertEqual(self.parser()(self.input, 2), [2, 4, 6])
+            self.assertEqual(self.calls, 2)
+
+            self.parser("2")(self.input)
+            self.assertEqual(self.calls, 3)
+
+            self.input.write_text("4\n", encoding="utf-8")
+            self.assertEqual(self.parser()(self.input), [4])
+            self.assertEqual(self.calls, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
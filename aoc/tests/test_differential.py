@@ -0,0 +1,120 @@
+"""Tests for the differential testing harness."""
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from aoc import differential, discover
+
+
+SOLUTION_2025 = '''
+from pathlib import Path
+
+
+class Solution:
+
+    @classmethod
+    def read_input(cls, f_path):
+        return [int(x) for x in Path(f_path).read_text().split()]
+
+    @classmethod
+    def part_1(cls, nums):
+        return sum(nums)
+
+    @classmethod
+    def part_1_slow(cls, nums):
+        total = 0
+        for x in nums:
+            total += x
+        return total
+
+    @classmethod
+    def part_1_wrong(cls, nums):
+        return sum(nums[1:])
+'''
+
+KEY = (2025, 13, 1)
+
+
+class TestDifferential(unittest.TestCase):
+    """Variants are checked against the reference, input by input."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+
+        day_dir = root / "2025" / "13"
+        day_dir.mkdir(parents=True)
+        (day_dir / "solution.py").write_text(
+            textwrap.dedent(SOLUTION_2025), encoding="utf-8")
+
+        self.paths = []
+        for name, text in (("a.txt", "1 2 3"), ("b.txt", "0 5")):
+            (day_dir / name).write_text(text, encoding="utf-8")
+            self.paths.append(day_dir / name)
+
+        self.day, = discover.find_days(root=root)
+
+        def method(name):
+            def func(path):
+                from solution import Solution  # pylint: disable=import-error
+                return getattr(Solution, name)(Solution.read_input(path))
+            return func
+
+        register = differential.variant
+        register(*KEY, reference=True, name="slow")(method("part_1_slow"))
+        register(*KEY, name="fast")(method("part_1"))
+        self.add_wrong = lambda: register(*KEY, name="wrong")(
+            method("part_1_wrong"))
+
+    def tearDown(self) -> None:
+        differential.VARIANTS.pop(KEY, None)
+        self.tmp.cleanup()
+
+    def test_agree(self) -> None:
+        run = differential.compare(self.day, 1, self.paths)
+
+        self.assertTrue(run.ok)
+        self.assertEqual(
+            [comp.results["fast"].answer for comp in run.comparisons], [6, 5])
+        self.assertGreater(run.speedup("fast"), 0)
+        self.assertIn("0 mismatch(es)", differential.format_report(run))
+
+    def test_mismatch(self) -> None:
+        """Only inputs where a variant disagrees fail."""
+        self.add_wrong()
+        run = differential.compare(self.day, 1, self.paths)
+
+        self.assertFalse(run.ok)
+        self.assertEqual(
+            [comp.mismatches for comp in run.comparisons], [["wrong"], []])
+        self.assertIn("1 mismatch(es)", differential.format_report(run))
+
+    def test_registration(self) -> None:
+        with self.assertRaises(ValueError):
+            differential.variant(*KEY, reference=True)(len)
+
+        with self.assertRaises(ValueError):
+            differential.variants_of(2025, 13, 2)
+
+        names = [v.name for v in differential.variants_of(*KEY)]
+        self.assertEqual(names, ["slow", "fast"])
+
+    def test_generate_inputs(self) -> None:
+        """Days without a generator get no inputs."""
+        self.assertEqual(
+            differential.generate_inputs(self.day, Path(self.tmp.name)), [])
+
+    def test_registered_variants(self) -> None:
+        """The variants registered for a real day agree on an input."""
+        day, = discover.find_days([2024], [12])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = differential.generate_inputs(day, Path(tmp), count=1)
+            run = differential.compare(day, 1, paths)
+
+        self.assertTrue(run.ok, differential.format_report(run))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Tests for the standard command line of solution files."""
+import contextlib
+import importlib.util
+import io
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc import discover
+from aoc.entry import day_main, day_of
+
+
+CREATE_SOLUTION = discover.ROOT / "2025" / "create_solution.py"
+
+
+def load_create_solution():
+    spec = importlib.util.spec_from_file_location(
+        "create_solution", CREATE_SOLUTION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestEntry(unittest.TestCase):
+    """A day made from the template runs in every mode."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.create = load_create_solution()
+
+        day_dir = self.root / "2025" / "13"
+        day_dir.mkdir(parents=True)
+        self.source = day_dir / "solution.py"
+        self.source.write_text(
+            self.create.TEMPLATE.format(day_number="13"), encoding="utf-8")
+        for name in ("input.txt", "example.txt"):
+            (day_dir / name).write_text("a\n\nb\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def main(self, *argv: str, test=None) -> tuple[int, str]:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            status = day_main(self.source, test, list(argv))
+        return status, out.getvalue()
+
+    def test_template(self) -> None:
+        day = day_of(self.source)
+
+        self.assertEqual((day.year, day.day, day.parts), (2025, 13, (1, 2)))
+
+        with day.context():
+            phases = day.load()
+            self.assertEqual(phases.parse(self.source.parent / "input.txt"),
+                             ["a", "b"])
+
+    def test_run(self) -> None:
+        status, out = self.main()
+
+        self.assertEqual(status, 0)
+        self.assertIn("2025/13  part_2", out)
+
+    def test_test(self) -> None:
+        calls = []
+
+        self.assertEqual(self.main("--mode", "test")[0], 1)
+        self.assertEqual(
+            self.main("--mode", "test", test=lambda: calls.append(1))[0], 0)
+        self.assertEqual(calls, [1])
+
+    def test_bench(self) -> None:
+        status, out = self.main("--mode", "bench", "--repeats", "2")
+
+        self.assertEqual(status, 0)
+        self.assertIn("part_1", out)
+
+        self.assertEqual(self.main("--mode", "bench", "-i", "nope.txt")[0], 1)
+
+    def test_not_a_day(self) -> None:
+        with self.assertRaises(LookupError):
+            day_of(self.root / "solution.py")
+
+    def test_generator_stub(self) -> None:
+        """A stub is added once and only for days without a generator."""
+        f_path = self.root / "y2025.py"
+        f_path.write_text(
+            "@generator(2025, 1)\ndef day01(scale, rng):\n    pass\n",
+            encoding="utf-8")
+
+        self.assertFalse(self.create.add_generator("01", f_path))
+        self.assertTrue(self.create.add_generator("13", f_path))
+        self.assertFalse(self.create.add_generator("13", f_path))
+
+        namespace = {
+            "generator": lambda year, day: lambda func: func,
+            "random": random}
+        exec(f_path.read_text(encoding="utf-8"), namespace)
+
+        text = namespace["day13"](2, random.Random(0))
+        self.assertEqual(len(text.splitlines()), 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
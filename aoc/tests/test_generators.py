@@ -0,0 +1,69 @@
+"""Tests for the synthetic input generators."""
+import unittest
+
+from aoc import generators
+
+
+class TestGenerators(unittest.TestCase):
+    """Reproducibility and scaling of generated inputs."""
+
+    def test_deterministic(self) -> None:
+        """The same seed gives the same input."""
+        for year, day in generators.GENERATORS:
+            with self.subTest(year=year, day=day):
+                self.assertEqual(
+                    generators.generate(year, day, seed=3),
+                    generators.generate(year, day, seed=3))
+
+    def test_scale(self) -> None:
+        """Larger scales give larger inputs."""
+        for year, day in [(2024, 1), (2024, 4), (2025, 5)]:
+            with self.subTest(year=year, day=day):
+                small = generators.generate(year, day, 1)
+                large = generators.generate(year, day, 4)
+                self.assertGreater(len(large), 3 * len(small))
+
+    def test_realistic_shapes(self) -> None:
+        """Generated inputs keep the properties of the real ones."""
+        values = [
+            int(line.split(":")[0])
+            for line in generators.generate(2024, 7, 2).splitlines()]
+        self.assertLess(max(values), 10 ** 15)
+
+        text = generators.generate(2025, 2, 2).strip()
+        ranges = sorted(
+            tuple(map(int, r.split("-"))) for r in text.split(","))
+        self.assertTrue(all(a[1] < b[0] for a, b in zip(ranges, ranges[1:])))
+
+        # Part 1's answer is not 99 for every bank
+        banks = generators.generate(2025, 3).split()
+        self.assertGreater(len({max(bank) for bank in banks}), 1)
+        self.assertEqual({len(bank) for bank in banks}, {100})
+
+    def test_day11_large_scale(self) -> None:
+        """Names never run out, and a path runs svr -> dac -> fft -> out."""
+        lines = generators.generate(2025, 11, 100).splitlines()
+        graph = {
+            node: outs.split()
+            for node, outs in (line.split(": ") for line in lines)}
+
+        self.assertEqual(len(graph), len(lines))
+        self.assertGreater(len(graph), 26 ** 3)
+
+        def reaches(start: str, goal: str) -> bool:
+            seen, stack = {start}, [start]
+            while stack:
+                for nxt in graph.get(stack.pop(), []):
+                    if nxt not in seen:
+                        seen.add(nxt)
+                        stack.append(nxt)
+            return goal in seen
+
+        for start, goal in (("svr", "dac"), ("dac", "fft"), ("fft", "out")):
+            with self.subTest(start=start, goal=goal):
+                self.assertTrue(reaches(start, goal))
+
+    def test_bad_scale(self) -> None:
+        """Scales below 1 are rejected."""
+        with self.assertRaises(ValueError):
+            generators.generate(2025, 1, 0)
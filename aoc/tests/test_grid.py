@@ -0,0 +1,62 @@
+"""Tests for the padded Grid type."""
+import copy
+import pickle
+import unittest
+
+from aoc.grid import Grid
+
+
+class TestGrid(unittest.TestCase):
+    """Indexing, whole-map queries and copies."""
+
+    def setUp(self) -> None:
+        self.grid = Grid(["#.@", "@@.", "..S"], pad=" ")
+
+    def test_indexing(self) -> None:
+        """Flat indices and points round trip through the padded layout."""
+        grid = self.grid
+        idx = grid.index(2, 2)
+
+        self.assertEqual(grid.shape, (3, 3))
+        self.assertEqual(grid.width, 5)
+        self.assertEqual(grid.point(idx), (2, 2))
+        self.assertEqual(chr(grid.data[idx]), "S")
+        self.assertEqual(grid[1, 0], "@")
+        self.assertEqual(chr(grid.data[idx + grid.offsets4[1]]), " ")
+        self.assertIn((0, 2), grid)
+        self.assertNotIn((3, 0), grid)
+
+    def test_queries(self) -> None:
+        """find, count, positions and neighbor counts see the same cells."""
+        grid = self.grid
+
+        self.assertEqual(grid.find("@"), [(0, 2), (1, 0), (1, 1)])
+        self.assertEqual(grid.find_one("S"), (2, 2))
+        self.assertIsNone(grid.find_one("X"))
+        self.assertEqual(grid.count("@"), 3)
+        self.assertEqual(
+            grid.positions(), {
+                "#": [(0, 0)], "@": [(0, 2), (1, 0), (1, 1)],
+                "S": [(2, 2)]})
+        self.assertEqual(
+            grid.neighbor_count("@").tolist(),
+            [[2, 3, 1], [1, 2, 2], [2, 2, 1]])
+        self.assertEqual(
+            grid.neighbor_count("@", diagonal=False).tolist(),
+            [[1, 2, 0], [1, 1, 2], [1, 1, 0]])
+
+    def test_copy(self) -> None:
+        """Copies do not share memory and keep the array views in sync."""
+        for dup in (
+            self.grid.copy(), copy.deepcopy(self.grid),
+            pickle.loads(pickle.dumps(self.grid)),
+        ):
+            dup[0, 0] = "."
+            self.assertEqual(dup.inner[0, 0], ord("."))
+            self.assertEqual(self.grid[0, 0], "#")
+            self.assertEqual(dup.lines(), ["..@", "@@.", "..S"])
+
+    def test_ragged(self) -> None:
+        """Rows of different lengths are rejected."""
+        with self.assertRaises(ValueError):
+            Grid(["..", "."])
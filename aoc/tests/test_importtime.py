@@ -0,0 +1,34 @@
+"""Tests for the import time report."""
+import unittest
+
+from aoc.importtime import parse_importtime
+
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | _io
+import time:        50 |         50 |     numpy.core
+import time:      9000 |      90000 |   numpy
+import time:       300 |        300 |   re
+import time:      2000 |      95000 | solution
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    """Reading ``python -X importtime`` output."""
+
+    def test_parse(self) -> None:
+        """The module's total and its direct imports are picked out."""
+        total, heaviest = parse_importtime(OUTPUT, "solution")
+
+        self.assertEqual(total, 95.0)
+        self.assertEqual(heaviest, [("numpy", 90.0), ("re", 0.3)])
+
+    def test_missing(self) -> None:
+        """A module that never got imported is an error."""
+        with self.assertRaises(ValueError):
+            parse_importtime(OUTPUT, "p1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Tests for running a day on a directory of inputs."""
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from aoc import discover, inputs
+
+
+SOLUTION_2025 = '''
+from pathlib import Path
+
+
+class Solution:
+
+    @classmethod
+    def read_input(cls, f_path):
+        return [int(x) for x in Path(f_path).read_text().split()]
+
+    @classmethod
+    def part_1(cls, nums):
+        return sum(nums)
+
+    @classmethod
+    def part_2(cls, nums):
+        nums.append(100)
+        return max(nums)
+'''
+
+
+def write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(text), encoding="utf-8")
+
+
+class TestInputs(unittest.TestCase):
+    """Every input gets its own answers, in order, in and out of process."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+
+        write(root / "2025" / "03" / "solution.py", SOLUTION_2025)
+        for name, text in (("a", "1 2"), ("b", "3 4 5"), ("c", "x")):
+            write(root / "2025" / "03" / "many" / f"{name}.txt", text)
+        write(root / "2025" / "03" / "many" / "notes.md", "skip me")
+
+        self.day, = discover.find_days(root=root)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def check(self, run: inputs.InputsRun) -> None:
+        answers = [
+            [res.answer for res in inp.phases[1:]] for inp in run.results]
+
+        self.assertEqual([inp.input for inp in run.results],
+                         ["a.txt", "b.txt", "c.txt"])
+        self.assertEqual(answers[:2], [[3, 100], [12, 100]])
+        self.assertFalse(run.results[2].ok)
+        self.assertEqual(run.results[2].phases[0].phase, "parse")
+        self.assertGreater(run.throughput, 0)
+
+    def test_find_inputs(self) -> None:
+        paths = inputs.find_inputs(self.day, "many")
+
+        self.assertEqual([p.name for p in paths], ["a.txt", "b.txt", "c.txt"])
+        self.assertEqual(inputs.find_inputs(self.day, "missing"), [])
+
+    def test_one_process(self) -> None:
+        paths = inputs.find_inputs(self.day, "many")
+        self.check(inputs.run_day_inputs(self.day, paths, jobs=1))
+
+    def test_pool(self) -> None:
+        paths = inputs.find_inputs(self.day, "many")
+        self.check(inputs.run_day_inputs(self.day, paths, jobs=2))
+
+    def test_report(self) -> None:
+        paths = inputs.find_inputs(self.day, "many")
+        report = inputs.format_report(
+            inputs.run_day_inputs(self.day, paths))
+
+        self.assertIn("error", report.splitlines()[0])
+        self.assertIn("3 input(s)", report)
+        self.assertIn("1 failed", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
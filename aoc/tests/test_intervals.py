@@ -0,0 +1,124 @@
+"""Tests for the sorted interval set."""
+import itertools
+import random
+import unittest
+
+from aoc.intervals import IntervalSet
+
+
+def as_set(intervals) -> set[int]:
+    return {x for start, end in intervals for x in range(start, end + 1)}
+
+
+def random_intervals(rng: random.Random, n: int) -> list[tuple[int, int]]:
+    intervals = []
+    for _ in range(n):
+        start = rng.randrange(200)
+        intervals.append((start, start + rng.randrange(-2, 15)))
+    return intervals
+
+
+def naive_merge(intervals) -> list[tuple[int, int]]:
+    """Merge pairs of overlapping or touching intervals until none are left."""
+    merged = [iv for iv in intervals if iv[0] <= iv[1]]
+    changed = True
+
+    while changed:
+        changed = False
+        for i, j in itertools.combinations(range(len(merged)), 2):
+            (s1, e1), (s2, e2) = merged[i], merged[j]
+            if s1 <= e2 + 1 and s2 <= e1 + 1:
+                merged[i] = (min(s1, s2), max(e1, e2))
+                del merged[j]
+                changed = True
+                break
+
+    return sorted(merged)
+
+
+class TestIntervalSet(unittest.TestCase):
+    """Every operation agrees with Python sets of the same integers."""
+
+    def test_merge(self) -> None:
+        """Overlapping and touching intervals merge; empty ones vanish."""
+        iset = IntervalSet([(10, 14), (3, 5), (16, 20), (12, 18), (6, 6),
+                            (30, 29)])
+
+        self.assertEqual(list(iset), [(3, 6), (10, 20)])
+        self.assertEqual(iset.total(), 15)
+        self.assertEqual(len(iset), 2)
+        self.assertFalse(IntervalSet())
+
+    def test_random_workload(self) -> None:
+        """Large sparse intervals merge like the naive pairwise merge."""
+        rng = random.Random(1)
+
+        for _ in range(20):
+            intervals = []
+            for _ in range(rng.randrange(1, 150)):
+                start = rng.randrange(10 ** 12, 10 ** 12 + 10 ** 6)
+                intervals.append((start, start + rng.randrange(-10, 10 ** 4)))
+
+            iset = IntervalSet(intervals)
+            expected = naive_merge(intervals)
+            values = [rng.randrange(10 ** 12 - 10, 10 ** 12 + 10 ** 6 + 10)
+                      for _ in range(200)] + [s for s, _ in intervals]
+
+            with self.subTest(intervals=intervals):
+                self.assertEqual(list(iset), expected)
+                self.assertEqual(
+                    iset.total(), sum(e - s + 1 for s, e in expected))
+                self.assertEqual(
+                    iset.contains_many(values).tolist(),
+                    [any(s <= x <= e for s, e in expected) for x in values])
+
+    def test_membership(self) -> None:
+        iset = IntervalSet([(3, 5), (10, 14)])
+        values = [2, 3, 5, 6, 9, 10, 14, 15]
+
+        self.assertEqual(
+            [x in iset for x in values],
+            [False, True, True, False, False, True, True, False])
+        self.assertEqual(
+            iset.contains_many(values).tolist(), [x in iset for x in values])
+        self.assertEqual(
+            IntervalSet().contains_many([1, 2]).tolist(), [False, False])
+
+    def test_overlapping(self) -> None:
+        iset = IntervalSet([(3, 5), (10, 14), (20, 25)])
+
+        self.assertEqual(iset.overlapping(4, 12), [(4, 5), (10, 12)])
+        self.assertEqual(iset.overlapping(6, 9), [])
+
+    def test_algebra(self) -> None:
+        rng = random.Random(0)
+
+        for _ in range(200):
+            a = random_intervals(rng, rng.randrange(8))
+            b = random_intervals(rng, rng.randrange(8))
+            sa, sb = IntervalSet(a), IntervalSet(b)
+
+            with self.subTest(a=a, b=b):
+                self.assertEqual(as_set(sa | sb), as_set(a) | as_set(b))
+                self.assertEqual(as_set(sa & sb), as_set(a) & as_set(b))
+                self.assertEqual(as_set(sa - sb), as_set(a) - as_set(b))
+                self.assertEqual((sa | sb).total(), len(as_set(a + b)))
+
+                # Results are canonical: equal to a set built from scratch
+                self.assertEqual(sa & sb, IntervalSet(sa & sb))
+                self.assertEqual(sa - sb, IntervalSet(sa - sb))
+
+    def test_shift_map(self) -> None:
+        """2023 Day 5: seed 79 goes to soil 81, seed 14 stays at 14."""
+        soil = [(98, 99, -48), (50, 97, 2)]
+        seeds = IntervalSet([(79, 92), (14, 14), (55, 67)])
+
+        self.assertEqual(
+            list(seeds.shift_map(soil)), [(14, 14), (57, 69), (81, 94)])
+        self.assertEqual(list(IntervalSet([(96, 99)]).shift_map(soil)),
+                         [(50, 51), (98, 99)])
+        self.assertEqual(list(seeds.shift(-14)), [(0, 0), (41, 53), (65, 78)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Tests for the vectorized integer extractor."""
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from aoc.ints import MAX_DIGITS, extract_ints, ints_by_line, read_ints
+
+
+TEXT = "p=0,4 v=3,-3\n\n190: 10 19\n-5-3 abc 123456789012345678\n7"
+
+
+class TestInts(unittest.TestCase):
+    """extract_ints agrees with a regex and int()."""
+
+    def test_signed(self) -> None:
+        values = extract_ints(TEXT)
+
+        self.assertEqual(values.dtype, np.int64)
+        self.assertEqual(
+            values.tolist(), [int(x) for x in re.findall(r"-?\d+", TEXT)])
+
+    def test_unsigned(self) -> None:
+        self.assertEqual(
+            extract_ints(TEXT, signed=False).tolist(),
+            [int(x) for x in re.findall(r"\d+", TEXT)])
+
+    def test_bytes_and_str(self) -> None:
+        self.assertEqual(
+            extract_ints(TEXT.encode()).tolist(), extract_ints(TEXT).tolist())
+
+    def test_no_numbers(self) -> None:
+        for text in ("", "abc\n", "-"):
+            with self.subTest(text=text):
+                self.assertEqual(extract_ints(text).tolist(), [])
+
+    def test_long_numbers(self) -> None:
+        """Numbers too long for int64 come back as Python ints."""
+        big = "9" * (MAX_DIGITS + 2)
+        values = extract_ints(f"1 -{big} 2")
+
+        self.assertEqual(values.tolist(), [1, -int(big), 2])
+
+    def test_by_line(self) -> None:
+        """Blank lines and lines without numbers are kept, empty."""
+        values, offsets = ints_by_line(TEXT)
+        lines = [
+            values[a:b].tolist() for a, b in zip(offsets[:-1], offsets[1:])]
+
+        self.assertEqual(lines, [
+            [0, 4, 3, -3], [], [190, 10, 19], [-5, -3, 123456789012345678],
+            [7]])
+
+    def test_by_line_trailing_newline(self) -> None:
+        _, offsets = ints_by_line("1 2\n3\n")
+        self.assertEqual(offsets.tolist(), [0, 2, 3])
+
+        _, offsets = ints_by_line("")
+        self.assertEqual(offsets.tolist(), [0])
+
+    def test_read_ints(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "input.txt"
+            path.write_text("162,817,812\r\n57,618,57\r\n", encoding="utf-8")
+
+            self.assertEqual(
+                read_ints(path).reshape(-1, 3).tolist(),
+                [[162, 817, 812], [57, 618, 57]])
+
+
+if __name__ == "__main__":
+    unittest.main()
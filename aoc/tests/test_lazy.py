@@ -0,0 +1,39 @@
+"""Tests for deferred imports."""
+import sys
+import unittest
+
+from aoc.lazy import LazyModule, lazy_import
+
+
+class TestLazyImport(unittest.TestCase):
+    """Modules load on first use, and only then."""
+
+    def test_deferred(self) -> None:
+        """Creating the stand-in imports nothing."""
+        sys.modules.pop("colorsys", None)
+        colorsys = lazy_import("colorsys")
+
+        self.assertIsInstance(colorsys, LazyModule)
+        self.assertNotIn("colorsys", sys.modules)
+
+        self.assertEqual(colorsys.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertIn("colorsys", sys.modules)
+        self.assertIn("hsv_to_rgb", dir(colorsys))
+
+        with self.assertRaises(AttributeError):
+            colorsys.not_a_function  # pylint: disable=pointless-statement
+
+    def test_loaded(self) -> None:
+        """Modules that are already imported are returned directly."""
+        self.assertIs(lazy_import("unittest"), unittest)
+
+    def test_missing(self) -> None:
+        """A missing module only fails when it is used."""
+        missing = lazy_import("no_such_module_for_aoc")
+
+        with self.assertRaises(ModuleNotFoundError):
+            missing.anything  # pylint: disable=pointless-statement
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for the scoped, bounded memoization."""
+import unittest
+
+from aoc.memo import memoize
+
+
+class TestMemo(unittest.TestCase):
+    """Results are cached per input, within bounds, and counted."""
+
+    def test_hits_and_misses(self) -> None:
+        calls = []
+
+        @memoize
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+
+        self.assertEqual([square(2), square(3), square(2)], [4, 9, 4])
+        self.assertEqual(calls, [2, 3])
+
+        stats = square.stats
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 2, 2))
+        self.assertAlmostEqual(stats.hit_rate, 1 / 3)
+
+    def test_keyword_arguments(self) -> None:
+        @memoize
+        def add(x: int, y: int = 0) -> int:
+            return x + y
+
+        self.assertEqual(add(1, y=2), 3)
+        self.assertEqual(add(1), 1)
+        self.assertEqual(add.stats.misses, 2)
+
+    def test_scoped(self) -> None:
+        """A new input drops the old input's results."""
+        @memoize(scoped=True)
+        def ways(patterns: list[str], design: str) -> int:
+            if not design:
+                return 1
+            return sum(
+                ways(patterns, design[len(p):])
+                for p in patterns if design.startswith(p))
+
+        self.assertEqual(ways(["r", "rr"], "rrrr"), 5)
+        self.assertEqual(ways(["r"], "rrrr"), 1)
+        self.assertEqual(ways(["r", "rr"], "rrrr"), 5)
+
+        # Unhashable scope, counters kept across inputs
+        self.assertGreater(ways.stats.hits, 0)
+        self.assertEqual(ways.stats.entries, 5)
+
+    def test_nested_scope_switch(self) -> None:
+        """A result computed under one scope is not stored in another."""
+        @memoize(scoped=True)
+        def func(scope: list, x: int) -> int:
+            if x == 0 and scope[0] == "outer":
+                func(["inner"], 1)
+            return len(scope[0])
+
+        self.assertEqual(func(["outer"], 0), 5)
+
+        # Only the inner call's result, under the inner scope
+        self.assertEqual(len(func), 1)
+        self.assertEqual(func.stats.misses, 2)
+
+    def test_max_entries(self) -> None:
+        """The least recently used entries are evicted first."""
+        @memoize(max_entries=2)
+        def ident(x: int) -> int:
+            return x
+
+        ident(1)
+        ident(2)
+        ident(1)
+        ident(3)
+
+        self.assertEqual(ident.stats.evictions, 1)
+        ident(1)
+        self.assertEqual(ident.stats.hits, 2)
+        ident(2)
+        self.assertEqual(ident.stats.misses, 4)
+
+    def test_max_bytes(self) -> None:
+        @memoize(max_bytes=2000)
+        def text(n: int) -> str:
+            return "x" * n
+
+        for n in range(10):
+            text(500 + n)
+
+        stats = text.stats
+        self.assertLessEqual(stats.nbytes, 2000)
+        self.assertGreater(stats.evictions, 0)
+        self.assertEqual(stats.entries + stats.evictions, 10)
+
+    def test_clear(self) -> None:
+        @memoize(max_entries=4)
+        def ident(x: int) -> int:
+            return x
+
+        ident(1)
+        ident(1)
+        ident.clear()
+
+        self.assertEqual(len(ident), 0)
+        self.assertEqual(ident.stats.hits, 0)
+        self.assertEqual(ident.stats.nbytes, 0)
+
+    def test_invalid_bounds(self) -> None:
+        with self.assertRaises(ValueError):
+            memoize(lambda x: x, max_entries=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
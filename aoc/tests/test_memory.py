@@ -0,0 +1,83 @@
+"""Tests for the memory budget mode."""
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from aoc import discover, memory
+
+
+SOLUTION_2025 = '''
+from pathlib import Path
+
+
+class Solution:
+
+    @classmethod
+    def read_input(cls, f_path):
+        return [int(Path(f_path).read_text())]
+
+    @classmethod
+    def part_1(cls, inp):
+        blocks = [bytes(1024) for _ in range(inp.pop())]
+        return len(blocks)
+
+    @classmethod
+    def part_2(cls, inp):
+        from aoc.unionfind import UnionFind
+        return UnionFind(inp.pop() * 10).count
+'''
+
+
+class TestMemory(unittest.TestCase):
+    """Peaks, allocation sites and ceilings."""
+
+    def test_track_rss(self) -> None:
+        """A big allocation shows up in the peak RSS."""
+        usage = memory.PhaseMemory("2025/01", "part_1")
+
+        with memory.track_rss(usage):
+            block = bytearray(64 * memory.MIB)
+            block[::4096] = b"x" * len(block[::4096])
+            del block
+
+        self.assertGreater(usage.peak_rss, 64 * memory.MIB)
+
+    def test_memory_day(self) -> None:
+        """The line making the allocations is reported as the hot spot.
+
+        Both runs of a part get the parsed input, although the parts empty
+        it, and allocations made in shared aoc modules are reported.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            day_dir = Path(tmp) / "2025" / "02"
+            day_dir.mkdir(parents=True)
+            (day_dir / "solution.py").write_text(
+                textwrap.dedent(SOLUTION_2025), encoding="utf-8")
+            (day_dir / "input.txt").write_text("20000\n", encoding="utf-8")
+
+            day, = discover.find_days(root=Path(tmp))
+            parse, part_1, part_2 = memory.memory_day(day)
+
+        self.assertEqual(
+            (parse.phase, part_1.phase, part_1.error),
+            ("parse", "part_1", None))
+        self.assertGreater(part_1.traced_peak, 20000 * 1024)
+        self.assertEqual(part_1.sites[0][0], "solution.py:13")
+        self.assertTrue(part_2.sites[0][0].startswith("unionfind.py:"))
+
+    def test_ceiling(self) -> None:
+        """Phase ceilings beat day ceilings, which beat the global one."""
+        budget = {"2025/08": 300, "2025/08 part_2": 100}
+
+        def limit(day: str, phase: str) -> float | None:
+            return memory.ceiling(
+                memory.PhaseMemory(day, phase), budget, max_mb=50)
+
+        self.assertEqual(limit("2025/08", "part_2"), 100)
+        self.assertEqual(limit("2025/08", "parse"), 300)
+        self.assertEqual(limit("2025/07", "parse"), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Tests for the phase profilers."""
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aoc import profiling
+
+
+def busy(seconds: float = 0.1) -> list[int]:
+    """Burn CPU in Python code for a while."""
+    end = time.perf_counter() + seconds
+    junk = []
+
+    while time.perf_counter() < end:
+        junk.append(len(junk))
+
+    return junk
+
+
+def temporary(seconds: float = 0.1) -> int:
+    """Hold a big allocation for a while, then free it before returning."""
+    block = [bytes(1024) for _ in range(20000)]
+    time.sleep(seconds)
+    size = len(block)
+    del block
+
+    return size
+
+
+class TestProfiling(unittest.TestCase):
+    """Each mode writes its files; no mode writes nothing."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        patcher = mock.patch.object(profiling, "PROFILE_DIR", self.dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def profile(self, mode: str) -> list[str]:
+        """Profile ``busy`` and return the files written."""
+        with mock.patch.dict(os.environ, {profiling.PROFILE_ENV: mode}):
+            with profiling.profile_phase("2025/03", "part_1"):
+                busy()
+
+        day_dir = self.dir / "2025" / "03"
+        return sorted(f.name for f in day_dir.iterdir())
+
+    def test_off(self) -> None:
+        """Without AOC_PROFILE nothing is written."""
+        with mock.patch.dict(os.environ, {profiling.PROFILE_ENV: ""}):
+            with profiling.profile_phase("2025/03", "part_1"):
+                busy(0.01)
+
+        self.assertEqual(list(self.dir.iterdir()), [])
+
+    def test_cprofile(self) -> None:
+        self.assertEqual(
+            self.profile("cprofile"), ["part_1.prof", "part_1.stats.txt"])
+
+    def test_sample(self) -> None:
+        """Collapsed stacks start at the profiled code."""
+        self.assertEqual(self.profile("sample"), ["part_1.collapsed"])
+
+        text = (self.dir / "2025" / "03" / "part_1.collapsed").read_text()
+        stack, count = text.splitlines()[0].rsplit(" ", 1)
+
+        self.assertTrue(stack.startswith("busy (test_profiling.py:"))
+        self.assertGreater(int(count), 0)
+
+    def test_tracemalloc(self) -> None:
+        self.assertEqual(
+            self.profile("tracemalloc"),
+            ["part_1.memory.txt", "part_1.snapshot"])
+
+        text = (self.dir / "2025" / "03" / "part_1.memory.txt").read_text()
+        peak = float(text.split()[3].replace(",", ""))
+        self.assertGreater(peak, 0)
+        self.assertNotIn(profiling.__file__, text)
+
+    def test_tracemalloc_peak(self) -> None:
+        """Memory freed before the phase ends is still reported."""
+        with mock.patch.dict(
+                os.environ, {profiling.PROFILE_ENV: "tracemalloc"}):
+            with profiling.profile_phase("2025/03", "part_1"):
+                temporary()
+
+        text = (self.dir / "2025" / "03" / "part_1.memory.txt").read_text()
+        top = text.splitlines()[3]
+
+        self.assertIn("test_profiling.py", top)
+        self.assertIn("MiB", top)
+
+    def test_bad_mode(self) -> None:
+        with mock.patch.dict(os.environ, {profiling.PROFILE_ENV: "perf"}):
+            with self.assertRaises(ValueError):
+                profiling.profile_mode()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,347 @@
+"""Tests for day discovery and the runner.
+
+Usage
+-----
+python -m pytest aoc/tests
+"""
+import shutil
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from aoc import discover, runner
+from aoc.cache import DiskCache
+
+
+SOLUTION_2025 = '''
+from pathlib import Path
+
+
+class Solution:
+
+    @classmethod
+    def read_input(cls, f_path):
+        return [int(x) for x in Path(f_path).read_text().split()]
+
+    @classmethod
+    def part_1(cls, inp):
+        return sum(inp)
+
+    @classmethod
+    def part_2(cls, inp):
+        print(f"The solution for Part 2 is {max(inp)}")
+'''
+
+
+P1_2024 = '''
+from pathlib import Path
+
+
+def parse_input(fname='input.txt'):
+    nums = [int(x) for x in Path(fname).read_text().split()]
+    return nums[::2], nums[1::2]
+
+
+def part1(evens, odds):
+    return sum(evens) - sum(odds)
+'''
+
+
+P2_2024 = '''
+from p1 import parse_input
+
+
+def part2(evens, odds):
+    return len(evens) * len(odds)
+'''
+
+
+P1_ONLY_2024 = '''
+def parse_input(fname='input.txt'):
+    return open(fname).read().split()
+
+
+def part1(words):
+    return len(words)
+
+
+def part2(words):
+    return len(set(words))
+'''
+
+
+# Puzzle examples for the 2023 days, trimmed so that every line is valid
+# for both parts
+SAMPLES_2023 = {
+    1: """
+        two1nine
+        abcone2threexyz
+        xtwone3four
+        4nineeightseven2
+        zoneight234
+        7pqrstsixteen
+        """,
+    2: """
+        Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
+        Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue
+        Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green
+        Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 15 blue, 14 red
+        Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green
+        """,
+    4: """
+        Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
+        Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19
+        Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1
+        Card 4: 41 92 73 84 69 | 59 84 76 51 58  5 54 83
+        Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36
+        Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11
+        """,
+    5: """
+        seeds: 79 14 55 13
+
+        seed-to-soil map:
+        50 98 2
+        52 50 48
+
+        soil-to-fertilizer map:
+        0 15 37
+        37 52 2
+        39 0 15
+
+        fertilizer-to-water map:
+        49 53 8
+        0 11 42
+        42 0 7
+        57 7 4
+
+        water-to-light map:
+        88 18 7
+        18 25 70
+
+        light-to-temperature map:
+        45 77 23
+        81 45 19
+        68 64 13
+
+        temperature-to-humidity map:
+        0 69 1
+        1 0 69
+
+        humidity-to-location map:
+        60 56 37
+        56 93 4
+        """,
+    6: """
+        Time:      7  15   30
+        Distance:  9  40  200
+        """,
+    7: """
+        32T3K 765
+        T55J5 684
+        KK677 28
+        KTJJT 220
+        QQQJA 483
+        """,
+    8: """
+        LLR
+
+        AAA = (BBB, BBB)
+        BBB = (AAA, ZZZ)
+        ZZZ = (ZZZ, ZZZ)
+        """,
+    9: """
+        0 3 6 9 12 15
+        1 3 6 10 15 21
+        10 13 16 21 30 45
+        """,
+    10: """
+        .....
+        .S-7.
+        .|.|.
+        .L-J.
+        .....
+        """,
+    11: """
+        ...#......
+        .......#..
+        #.........
+        ..........
+        ......#...
+        .#........
+        .........#
+        ..........
+        .......#..
+        #...#.....
+        """,
+    12: """
+        ???.### 1,1,3
+        .??..??...?##. 1,1,3
+        """,
+    14: """
+        O....#....
+        O.OO#....#
+        .....##...
+        OO.#O....O
+        .O.....O#.
+        O.#..O.#.#
+        ..O..#O..O
+        .......O..
+        #....###..
+        #OO..#....
+        """,
+    18: """
+        R 2 (#70c710)
+        D 1 (#0dc571)
+        L 2 (#5713f0)
+        """,
+}
+
+# What each script computes on its sample: an answer, or the exception
+# it raises (unfinished parts, and day 4's part 1 that fails standalone)
+EXPECTED_2023 = {
+    1: ["209", "198"],
+    2: [8, 2286],
+    4: [AttributeError, 30],
+    5: [35, 46],
+    6: [],
+    7: [6440, 6440],
+    8: [6, NotImplementedError],
+    9: [114, 2],
+    10: [4, NotImplementedError],
+    11: [374, 82000210],
+    12: [NotImplementedError, NotImplementedError],
+    14: [136, 64],
+    18: ["['.', '#', '.']"],
+}
+
+
+def write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(text), encoding="utf-8")
+
+
+class TestRunner(unittest.TestCase):
+    """Discovery and timing of fake days in all layouts."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+        write(self.root / "2025" / "01" / "solution.py", SOLUTION_2025)
+        write(self.root / "2025" / "01" / "input.txt", "1 2 3\n")
+        write(self.root / "2024" / "07" / "p1.py", P1_2024)
+        write(self.root / "2024" / "07" / "p2.py", P2_2024)
+        write(self.root / "2024" / "07" / "input.txt", "5 1 4 2 3 3\n")
+        write(self.root / "2024" / "08" / "p1.py", P1_ONLY_2024)
+        write(self.root / "2024" / "08" / "input.txt", "a b a\n")
+        write(self.root / "2024" / "09" / "p1.py", "def solve(x): pass\n")
+        write(self.root / "2023" / "day02" / "main.py", "print('hi')\n")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_find_days(self) -> None:
+        """Every layout is found and only real entry points count as parts."""
+        days = discover.find_days(root=self.root)
+
+        self.assertEqual(
+            [(d.name, d.parts) for d in days],
+            [("2023/02", ()), ("2024/07", (1, 2)), ("2024/08", (1, 2)),
+             ("2024/09", (1,)), ("2025/01", (1, 2))])
+
+    def test_run_2025(self) -> None:
+        """Printed answers are picked up when a part returns None."""
+        day, = discover.find_days([2025], root=self.root)
+        results = runner.run_day(day)
+
+        self.assertEqual(
+            [(r.phase, r.answer) for r in results],
+            [("parse", "list[3]"), ("part_1", 6),
+             ("part_2", "The solution for Part 2 is 3")])
+
+    def test_run_2024(self) -> None:
+        """Tuples from parse_input are unpacked and p2 finds its own p1."""
+        day, = discover.find_days([2024], [7], root=self.root)
+        results = runner.run_day(day)
+
+        self.assertEqual([r.answer for r in results[1:]], [6, 9])
+        self.assertTrue(all(r.wall >= 0 and r.cpu >= 0 for r in results))
+
+    def test_run_2024_single_file(self) -> None:
+        """Both parts can live in p1.py."""
+        day, = discover.find_days([2024], [8], root=self.root)
+        results = runner.run_day(day)
+
+        self.assertEqual([r.answer for r in results[1:]], [3, 2])
+
+    def test_missing_input(self) -> None:
+        """Days without an input file are skipped, not failed."""
+        day, = discover.find_days([2024], [7], root=self.root)
+        result, = runner.run_day(day, "missing.txt")
+
+        self.assertEqual(result.phase, "skip")
+        self.assertTrue(result.ok)
+
+    def test_result_cache(self) -> None:
+        """Unchanged days are served from the cache, edited ones rerun."""
+        cache = DiskCache(self.root / "cache")
+        day, = discover.find_days([2024], [7], root=self.root)
+
+        first = runner.run_day(day, cache=cache)
+        second = runner.run_day(day, cache=cache)
+
+        self.assertFalse(any(r.cached for r in first))
+        self.assertTrue(all(r.cached for r in second))
+        self.assertEqual(
+            [r.answer for r in first], [r.answer for r in second])
+
+        # Editing the sibling p1.py invalidates the entry of the whole day
+        with open(day.directory / "p1.py", "a", encoding="utf-8") as f:
+            f.write("# edited\n")
+
+        third = runner.run_day(day, cache=cache)
+        self.assertFalse(any(r.cached for r in third))
+
+        write(day.input_path(), "1 1\n")
+        self.assertEqual(runner.run_day(day, cache=cache)[1].answer, 0)
+
+
+class TestRunner2023(unittest.TestCase):
+    """The runner reproduces what every real 2023 script computes."""
+
+    def test_every_day(self) -> None:
+        days = discover.find_days([2023])
+        self.assertEqual(
+            sorted(d.day for d in days), sorted(SAMPLES_2023))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for day in days:
+                directory = Path(tmp) / "2023" / day.directory.name
+                shutil.copytree(
+                    day.directory, directory,
+                    ignore=shutil.ignore_patterns("__pycache__", "*.txt"))
+                (directory / "input.txt").write_text(
+                    textwrap.dedent(SAMPLES_2023[day.day]).lstrip(),
+                    encoding="utf-8")
+
+            for day in discover.find_days([2023], root=Path(tmp)):
+                with self.subTest(day=day.name):
+                    results = runner.run_day(day)
+                    self.assertTrue(results[0].ok, results[0].error)
+                    self.check(results[1:], EXPECTED_2023[day.day])
+
+    def check(self, results: list, expected: list) -> None:
+        self.assertEqual(len(results), len(expected))
+
+        for res, exp in zip(results, expected):
+            if isinstance(exp, type):
+                self.assertFalse(res.ok)
+                self.assertTrue(res.error.startswith(exp.__name__))
+            else:
+                self.assertTrue(res.ok, res.error)
+                self.assertEqual(res.answer, exp)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""Tests for the BFS, Dijkstra and A* search helpers."""
+import unittest
+
+from aoc.grid import Grid
+from aoc.search import SearchStats, StateCodec, bfs, dijkstra
+
+
+MAZE = Grid([
+    "S..#",
+    ".#..",
+    "...E",
+])
+
+
+def open_cells(idx: int) -> list[int]:
+    """Orthogonal moves into open cells of MAZE."""
+    return [
+        idx + move for move in MAZE.offsets4
+        if MAZE.data[idx + move] != ord("#")]
+
+
+class TestSearch(unittest.TestCase):
+    """Shortest paths, goals and predecessor DAGs."""
+
+    def setUp(self) -> None:
+        self.start = MAZE.index(*MAZE.find_one("S"))
+        self.end = MAZE.index(*MAZE.find_one("E"))
+
+    def test_bfs(self) -> None:
+        """BFS finds the shortest path and stops at the goal."""
+        result = bfs(self.start, open_cells, goal=self.end)
+
+        self.assertEqual(result.cost, 5)
+        self.assertEqual(len(result.path()), 6)
+        self.assertEqual(result.path()[0], self.start)
+        self.assertEqual(result.path()[-1], self.end)
+
+    def test_bfs_no_goal(self) -> None:
+        """Without a goal every reachable state is visited."""
+        result = bfs(self.start, open_cells)
+
+        self.assertIsNone(result.goal)
+        self.assertEqual(len(result.dist), 10)
+
+    def test_multi_source(self) -> None:
+        """Several starts all begin at cost 0."""
+        result = bfs([self.start, self.end], open_cells)
+
+        self.assertEqual(max(result.dist.values()), 2)
+
+    def test_dag(self) -> None:
+        """With dag=True every shortest path is kept."""
+        single = bfs(self.start, open_cells, goal=self.end)
+        result = bfs(self.start, open_cells, goal=self.end, dag=True)
+
+        # Three paths of length 5 cover every open cell
+        self.assertEqual(len(single.on_best_paths()), 6)
+        self.assertEqual(len(result.on_best_paths()), 10)
+
+    def test_dijkstra(self) -> None:
+        """Weighted costs, goal predicates and heuristics agree."""
+        def weighted(idx):
+            return [(nxt, 1 if nxt // MAZE.width == 1 else 3)
+                    for nxt in open_cells(idx)]
+
+        def manhattan(idx):
+            row, col = MAZE.point(idx)
+            return abs(row - 2) + abs(col - 3)
+
+        plain = dijkstra(self.start, weighted, goal=self.end)
+        astar = dijkstra(
+            self.start, weighted, goal=lambda idx: idx == self.end,
+            heuristic=manhattan)
+
+        self.assertEqual(plain.cost, 11)
+        self.assertEqual(astar.cost, 11)
+        self.assertLessEqual(len(astar.dist), len(plain.dist))
+
+    def test_codec(self) -> None:
+        """States round trip through the codec."""
+        codec = StateCodec(100, 4, 3)
+
+        self.assertEqual(codec.decode(codec.encode(57, 3, 2)), (57, 3, 2))
+        self.assertEqual(codec.encode(1, 0, 0), 12)
+
+
+class TestSearchStats(unittest.TestCase):
+    """Work counters of the searches."""
+
+    def test_bfs_stats(self) -> None:
+        """BFS counts every state once and sums over searches."""
+        stats = SearchStats()
+        start = MAZE.index(0, 0)
+        bfs(start, open_cells, stats=stats)
+
+        self.assertEqual(stats.searches, 1)
+        self.assertEqual(stats.expansions, 10)
+        self.assertEqual(stats.pushes, 10)
+        # 11 open-open adjacencies, seen from both ends, 9 are discoveries
+        self.assertEqual(stats.duplicate_skips, 22 - 9)
+        self.assertGreater(stats.visited_bytes, 0)
+
+        bfs(start, open_cells, stats=stats)
+        self.assertEqual(stats.searches, 2)
+        self.assertEqual(stats.expansions, 20)
+
+    def test_dijkstra_stats(self) -> None:
+        """Dijkstra counts stale heap entries as duplicate skips."""
+        stats = SearchStats()
+        dijkstra(
+            0, lambda s: [(1, 5), (2, 1)] if s == 0 else
+            [(1, 1)] if s == 2 else [], stats=stats)
+
+        self.assertEqual(stats.expansions, 3)
+        self.assertEqual(stats.pushes, 4)
+        self.assertEqual(stats.duplicate_skips, 1)
+        self.assertEqual(stats.peak_frontier, 2)
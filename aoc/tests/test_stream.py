@@ -0,0 +1,57 @@
+"""Tests for the streaming line readers."""
+import copy
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc.stream import Lines, Sections, iter_sections, read_lines
+
+
+TEXT = "1 2\r\n\n3 4\n\n\n5\n6"
+
+
+class TestStream(unittest.TestCase):
+    """Lines and sections read the same with and without mmap."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "input.txt"
+        self.path.write_bytes(TEXT.encode("utf-8"))
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_read_lines(self) -> None:
+        """Newlines are stripped and blank lines kept."""
+        expected = ["1 2", "", "3 4", "", "", "5", "6"]
+
+        for use_mmap in (False, True):
+            with self.subTest(use_mmap=use_mmap):
+                self.assertEqual(
+                    list(read_lines(self.path, use_mmap)), expected)
+
+    def test_empty_file(self) -> None:
+        self.path.write_bytes(b"")
+
+        for use_mmap in (False, True):
+            with self.subTest(use_mmap=use_mmap):
+                self.assertEqual(list(read_lines(self.path, use_mmap)), [])
+
+    def test_lines(self) -> None:
+        """Blank lines are skipped and the object can be iterated again."""
+        lines = Lines(self.path, lambda line: sum(map(int, line.split())))
+
+        self.assertEqual(list(lines), [3, 7, 5, 6])
+        self.assertEqual(list(lines), [3, 7, 5, 6])
+        self.assertEqual(list(copy.deepcopy(lines)), [3, 7, 5, 6])
+
+    def test_sections(self) -> None:
+        """Runs of blank lines separate sections."""
+        self.assertEqual(
+            list(Sections(self.path, use_mmap=True)),
+            [["1 2"], ["3 4"], ["5", "6"]])
+        self.assertEqual(list(iter_sections(["", "", "a", ""])), [["a"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
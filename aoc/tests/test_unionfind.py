@@ -0,0 +1,63 @@
+"""Tests for the array-backed union-find."""
+import random
+import unittest
+
+from aoc.unionfind import UnionFind
+
+
+class TestUnionFind(unittest.TestCase):
+    """Components, their sizes and their count stay consistent."""
+
+    def test_union(self) -> None:
+        uf = UnionFind(6)
+
+        self.assertTrue(uf.union(0, 1))
+        self.assertTrue(uf.union(2, 1))
+        self.assertFalse(uf.union(0, 2))
+        self.assertTrue(uf.union(4, 5))
+
+        self.assertEqual(uf.count, 3)
+        self.assertTrue(uf.connected(0, 2))
+        self.assertFalse(uf.connected(0, 3))
+        self.assertEqual(uf.component_size(2), 3)
+        self.assertEqual(sorted(uf.sizes()), [1, 2, 3])
+        self.assertEqual(len(uf.roots()), 3)
+
+    def test_long_chain(self) -> None:
+        """Chains far deeper than the recursion limit are fine."""
+        n = 100_000
+        uf = UnionFind(n)
+
+        # Hang each element under the next by hand, the worst case
+        uf.parent = list(range(1, n)) + [n - 1]
+
+        self.assertEqual(uf.find(0), n - 1)
+
+        # Path halving skipped every other node on the way up
+        self.assertEqual(uf.parent[:4], [2, 2, 4, 4])
+
+    def test_random(self) -> None:
+        """Agrees with a naive labeling."""
+        rng = random.Random(0)
+        n = 200
+        uf = UnionFind(n)
+        label = list(range(n))
+
+        for _ in range(150):
+            a, b = rng.randrange(n), rng.randrange(n)
+            merged = label[a] != label[b]
+            self.assertEqual(uf.union(a, b), merged)
+
+            old, new = label[a], label[b]
+            label = [new if x == old else x for x in label]
+
+        self.assertEqual(uf.count, len(set(label)))
+        for a in range(n):
+            self.assertEqual(
+                uf.component_size(a), label.count(label[a]))
+            self.assertEqual(
+                uf.find(a), uf.find(label.index(label[a])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""Unit tests for the 2025 engines, on the puzzle examples."""
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from aoc import discover
+
+
+EXAMPLE_01 = "L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82\n"
+
+EXAMPLE_02 = (
+    "11-22,95-115,998-1012,1188511880-1188511890,222220-222224,"
+    "1698522-1698528,446443-446449,38593856-38593862,565653-565659,"
+    "824824821-824824827,2121212118-2121212124")
+
+# Bank, largest 2 and 12 digit joltages
+EXAMPLE_03 = [
+    ("987654321111111", 98, 987654321111),
+    ("811111111111119", 89, 811111111119),
+    ("234234234234278", 78, 434234234278),
+    ("818181911112111", 92, 888911112111),
+]
+
+
+def load_solution(day: int):
+    """Import ``2025/DD/solution.py`` under a name of its own."""
+    path = discover.ROOT / "2025" / f"{day:02d}" / "solution.py"
+    spec = importlib.util.spec_from_file_location(f"y2025_{day:02d}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestDay01(unittest.TestCase):
+    """Dial turns, streamed and as a vectorized log."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_solution(1)
+
+    def test_turn(self) -> None:
+        turn = self.module.Solution.turn
+
+        self.assertEqual(turn(50, "L68"), (82, 1))
+        self.assertEqual(turn(50, "R50"), (0, 1))
+        self.assertEqual(turn(0, "L5"), (95, 0))
+        self.assertEqual(turn(50, "R1000"), (50, 10))
+        self.assertEqual(turn(5, "L5", dial_size=10), (0, 1))
+
+    def test_parts(self) -> None:
+        sol = self.module.Solution
+        lines = EXAMPLE_01.split()
+
+        self.assertEqual(sol.part_1(lines), 3)
+        self.assertEqual(sol.part_2(lines), 6)
+        self.assertEqual(sol.part_2_brute(lines), 6)
+
+    def test_dial_log(self) -> None:
+        """Prefix queries over any range of instructions."""
+        log = self.module.DialLog.from_text(EXAMPLE_01)
+
+        self.assertEqual(len(log), 10)
+        self.assertEqual((log.landings(), log.zero_clicks()), (3, 6))
+        self.assertEqual(log.positions[:4].tolist(), [50, 82, 52, 0])
+        self.assertEqual((log.landings(0, 3), log.zero_clicks(0, 3)), (1, 2))
+        self.assertEqual((log.landings(3, 3), log.zero_clicks(3, 3)), (0, 0))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "input.txt"
+            path.write_text(EXAMPLE_01, encoding="utf-8")
+            self.assertEqual(
+                self.module.DialLog.from_file(path).zero_clicks(), 6)
+
+
+class TestDay02(unittest.TestCase):
+    """Invalid IDs summed without visiting the ranges."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sol = load_solution(2).Solution
+
+    def test_repeated_sum(self) -> None:
+        self.assertEqual(self.sol.repeated_sum(11, 22, 1, 2), 11 + 22)
+        self.assertEqual(self.sol.repeated_sum(95, 115, 1, 3), 111)
+        self.assertEqual(
+            self.sol.repeated_sum(1, 10**6, 3, 6),
+            1001 * sum(range(100, 1000)))
+        self.assertEqual(self.sol.repeated_sum(23, 32, 1, 2), 0)
+
+    def test_invalid_sum(self) -> None:
+        """Part 2 counts IDs with several periods once."""
+        self.assertEqual(self.sol.invalid_sum(95, 115, False), 99)
+        self.assertEqual(self.sol.invalid_sum(95, 115, True), 99 + 111)
+        self.assertEqual(
+            self.sol.invalid_sum(222220, 222224, True), 222222)
+
+        def repeated(n: int) -> bool:
+            s = str(n)
+            return any(
+                s[:p] * (len(s) // p) == s for p in range(1, len(s) // 2 + 1))
+
+        for lo, hi in ((1, 10**4), (111000, 222300)):
+            with self.subTest(lo=lo, hi=hi):
+                self.assertEqual(
+                    self.sol.invalid_sum(lo, hi, True),
+                    sum(n for n in range(lo, hi + 1) if repeated(n)))
+
+    def test_parts(self) -> None:
+        ranges = EXAMPLE_02.split(",")
+
+        self.assertEqual(self.sol.part_1(ranges), 1227775554)
+        self.assertEqual(self.sol.part_2(ranges), 4174379265)
+        self.assertEqual(self.sol.part_1_brute(ranges), 1227775554)
+        self.assertEqual(self.sol.part_2_brute(ranges), 4174379265)
+
+    def test_overlapping_ranges(self) -> None:
+        """IDs in several ranges are counted once."""
+        self.assertEqual(self.sol.part_1(["10-30", "20-40"]),
+                         sum(range(11, 41, 11)))
+
+
+class TestDay03(unittest.TestCase):
+    """Largest k digit joltages, one bank at a time and batched."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sol = load_solution(3).Solution
+
+    def test_best_k_digits(self) -> None:
+        for bank, two, twelve in EXAMPLE_03:
+            with self.subTest(bank=bank):
+                self.assertEqual(self.sol.best_k_digits(bank, 2), two)
+                self.assertEqual(self.sol.best_k_digits(bank, 12), twelve)
+
+        self.assertEqual(self.sol.best_k_digits("12", 2), 12)
+        self.assertEqual(self.sol.best_k_digits("4", 1), 4)
+
+    def test_too_many_digits(self) -> None:
+        for k in (0, 3):
+            with self.assertRaises(ValueError):
+                self.sol.best_k_digits("12", k)
+
+        with self.assertRaises(ValueError):
+            self.sol.best_k_digits_batch(np.array([[1, 2]]), 3)
+
+    def test_parts(self) -> None:
+        banks = [bank for bank, _, _ in EXAMPLE_03]
+
+        self.assertEqual(self.sol.part_1(banks), 357)
+        self.assertEqual(self.sol.part_2(banks), 3121910778619)
+        self.assertEqual(self.sol.part_1_brute(banks), 357)
+        self.assertEqual(self.sol.part_2_greedy(banks), 3121910778619)
+
+    def test_batch(self) -> None:
+        """Banks of different lengths go in separate matrices."""
+        banks = [bank for bank, _, _ in EXAMPLE_03] + ["1919", "0909"]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "input.txt"
+            path.write_text("\n".join(banks) + "\n", encoding="utf-8")
+            matrices = self.sol.read_matrices(path)
+
+        self.assertEqual(
+            sorted(m.shape for m in matrices), [(2, 4), (4, 15)])
+
+        for k in (1, 2, 4):
+            with self.subTest(k=k):
+                self.assertEqual(
+                    self.sol.joltage_batch(matrices, k),
+                    sum(self.sol.best_k_digits(b, k) for b in banks))
+
+
+
+class TestDay10(unittest.TestCase):
+    """Fewest button presses to light up each machine."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sol = load_solution(10).Solution
+
+    def test_part_1(self) -> None:
+        machines = [
+            ([False, True, True, False], [False] * 4,
+             [[3], [1, 3], [2], [2, 3], [0, 2], [0, 1]], [3, 5, 4, 7]),
+            ([True, False], [False] * 2, [[0, 1], [1]], [1, 1]),
+        ]
+
+        self.assertEqual(self.sol.part_1(machines), 4)
+
+    def test_unreachable(self) -> None:
+        machines = [
+            ([True], [False], [[0]], [1]),
+            ([True, False], [False] * 2, [[0, 1]], [1, 1]),
+        ]
+
+        with self.assertRaisesRegex(ValueError, "Machine 2"):
+            self.sol.part_1(machines)
+
+
+if __name__ == "__main__":
+    unittest.main()
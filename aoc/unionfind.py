@@ -0,0 +1,107 @@
+"""Disjoint sets over the integers ``0 .. n - 1``.
+
+Elements are plain ints (a point's position in a list, a flat ``Grid``
+index, ...) so the parents and sizes live in two flat lists instead of
+dicts keyed by tuples. ``find`` walks up iteratively with path halving, so
+long chains cannot overflow the stack, and ``union`` hangs the smaller tree
+under the larger one, which keeps every tree shallow.
+
+The number of components and the size of each are kept up to date on every
+union, so checks like "is everything connected yet?" cost O(1) instead of a
+``find`` of every element.
+
+Usage
+-----
+from aoc.unionfind import UnionFind
+
+uf = UnionFind(len(points))
+for _, i, j in sorted_pairs:
+    if uf.union(i, j) and uf.count == 1:
+        ...
+"""
+from __future__ import annotations
+
+
+class UnionFind:
+    """Disjoint sets of the elements ``0 .. n - 1``, each starting alone.
+
+    Attributes
+    ----------
+    parent : list[int]
+        Parent of every element; roots are their own parent.
+    size : list[int]
+        Number of elements under every root. Only meaningful for roots.
+    count : int
+        Number of components.
+    """
+
+    def __init__(self, n: int) -> None:
+        """Make ``n`` singleton sets.
+
+        Parameters
+        ----------
+        n : int
+            Number of elements.
+        """
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.count = n
+
+    def find(self, x: int) -> int:
+        """Return the root of the component of an element."""
+        parent = self.parent
+
+        while parent[x] != x:
+            # Path halving: point every other node at its grandparent
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the components of two elements.
+
+        Returns
+        -------
+        bool
+            True if they were in different components.
+        """
+        a = self.find(a)
+        b = self.find(b)
+
+        if a == b:
+            return False
+
+        size = self.size
+        if size[a] < size[b]:
+            a, b = b, a
+
+        self.parent[b] = a
+        size[a] += size[b]
+        self.count -= 1
+
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        """Return True if two elements are in the same component."""
+        return self.find(a) == self.find(b)
+
+    def component_size(self, x: int) -> int:
+        """Return the number of elements in the component of an element."""
+        return self.size[self.find(x)]
+
+    def roots(self) -> list[int]:
+        """Return the root of every component."""
+        return [x for x, p in enumerate(self.parent) if x == p]
+
+    def sizes(self) -> list[int]:
+        """Return the size of every component, in the order of ``roots``."""
+        size = self.size
+        return [size[x] for x in self.roots()]
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} n={len(self)} components={self.count}>")
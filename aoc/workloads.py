@@ -0,0 +1,40 @@
+"""Benchmark workloads of the shared modules, for ``bench --lib``.
+
+Sizes are fixed so that results stay comparable with a saved baseline.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from aoc.bench import workload
+from aoc.intervals import IntervalSet
+
+
+@workload("intervals")
+def intervals(n: int = 1_000_000, seed: int = 0) -> dict:
+    """A million intervals: half scattered over 10**12, half overlapping.
+
+    The overlapping half is packed into a range a hundred times its count,
+    so merging collapses many of them; the scattered half mostly stays
+    apart, like the 2025/05 and 2023/05 inputs.
+    """
+    rng = np.random.default_rng(seed)
+    half = n // 2
+
+    starts = np.concatenate([
+        rng.integers(0, 10 ** 12, half), rng.integers(0, 100 * half, half)])
+    ends = starts + rng.integers(0, 10 ** 4, n)
+    raw = list(zip(starts.tolist(), ends.tolist()))
+
+    a = IntervalSet(raw)
+    b = IntervalSet(raw[::2]).shift(500)
+    queries = rng.integers(0, 10 ** 12, n)
+
+    return {
+        "build": lambda: IntervalSet(raw),
+        "contains_many": lambda: a.contains_many(queries),
+        "union": lambda: a | b,
+        "intersection": lambda: a & b,
+        "difference": lambda: a - b,
+        "total": a.total,
+    }